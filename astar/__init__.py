@@ -0,0 +1,49 @@
+'''
+Author: Jai Sharma
+Shared A* planning code used by the AStar_emptyMap, AStar_obstacleMap and Astar_Maze scripts
+
+The names below are imported lazily, on first use: "from astar import solve" loads the
+solver and what it needs, not HPA*, landmarks or the batch and parallel engines. This keeps
+short-lived planner processes (python -m astar, see astar/__main__.py) fast to start.
+'''
+
+import importlib
+
+_EXPORTS = {
+    "AnytimePath": "anytime",
+    "BatchPlanner": "batch",
+    "CellSet": "grid",
+    "DStarLite": "dstar",
+    "FieldCache": "distfield",
+    "HierarchicalMap": "hpa",
+    "Landmarks": "landmarks",
+    "MotionModel": "motion",
+    "OccupancyGrid": "grid",
+    "OpenList": "openlist",
+    "Path": "solver",
+    "PathCache": "pathcache",
+    "SearchBuffers": "buffers",
+    "SearchObserver": "solver",
+    "SearchStats": "stats",
+    "distanceField": "distfield",
+    "heuristicField": "heuristics",
+    "loadGrid": "gridfile",
+    "saveGrid": "gridfile",
+    "solve": "solver",
+    "solveAnytime": "anytime",
+    "solveBidirectional": "bidirectional",
+    "solveJPS": "jps",
+}
+
+__all__ = sorted(_EXPORTS, key=lambda name: (name[0].islower(), name))
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value             # later lookups skip __getattr__
+    return(value)
+
+def __dir__():
+    return(sorted(set(globals()) | set(_EXPORTS)))
@@ -0,0 +1,249 @@
+## ------------------------------------------------------------------------------------------
+#                                   Planner Entry Point
+## ------------------------------------------------------------------------------------------
+
+'''
+Command line planner, one process for one query or a whole stream of them:
+
+    python -m astar solve --map maze --start 16,1 --goal 3,6
+    python -m astar solve --map map2 --scale 20 --queries queries.csv
+    producer | python -m astar solve --map maze --queries -
+
+Every query prints one JSON line:
+
+    {"start": [16, 1], "goal": [3, 6], "found": true, "cost": 27.556, "expanded": 61,
+     "seconds": 0.0004, "path": [[16, 1], [15, 2], ...]}
+
+Queries that cannot be planned (start or goal outside the map or blocked) and malformed
+query lines print a line with "error" instead, and the stream goes on. Query files are CSV,
+"sx,sy,gx,gy" per line with an optional header line, see astar.batch; "-" reads them from
+stdin. Engine and motion model combinations that cannot work (jps needs --motion 8) and
+map sizes below 1 are refused before the first query. --visualize draws the search of the
+chosen engine (all but hpa). The map, its neighbour masks and the search buffers
+are set up once per process and shared by all queries.
+
+Only the modules a command needs are imported: the heuristics table for the --heuristic
+choices (and with it NumPy), then, after the arguments are parsed, the chosen engine and the
+map builders. pygame is only loaded for --visualize. With --timing,
+the startup time (imports and map loading) and the total solve time are reported separately
+on stderr. Interpreter startup happens before this module runs; benchmarks/bench_startup.py
+measures the whole process from the outside.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import time
+
+T0 = time.perf_counter()                # before any planner module is imported
+
+import argparse
+import json
+import sys
+
+## ------------------------------------------------------------------------------------------
+#                                          Engines
+## ------------------------------------------------------------------------------------------
+
+# Each engine returns a query function (start, goal, observer) --> Path. The observer is None
+# unless --visualize is given; engines that cannot report their search raise ValueError then.
+
+def astarEngine(grid, motion, args):
+    from .batch import BatchPlanner
+    planner = BatchPlanner(grid, motion, args.heuristic)
+    return(planner.plan)
+
+def jpsEngine(grid, motion, args):
+    from .jps import diagonalCostOf, solveJPS
+    diagonalCostOf(motion)                  # ValueError for a motion model JPS cannot search
+    return(lambda s, g, observer: solveJPS(s, g, grid, observer=observer, motion=motion, heuristic=args.heuristic))
+
+def bidirectionalEngine(grid, motion, args):
+    from .bidirectional import solveBidirectional
+    return(lambda s, g, observer: solveBidirectional(s, g, grid, observer=observer, motion=motion, heuristic=args.heuristic))
+
+def altEngine(grid, motion, args):
+    from .landmarks import Landmarks
+    from .solver import solve
+    landmarks = Landmarks.build(grid, motion=motion)
+    return(lambda s, g, observer: solve(s, g, grid, observer=observer, motion=motion, heuristic=args.heuristic,
+                                        field=landmarks.field(g)))
+
+def hpaEngine(grid, motion, args):
+    from .hpa import HierarchicalMap
+    if args.visualize:
+        raise ValueError("HPA* searches an abstract graph and cannot be drawn, drop --visualize")
+    hierarchy = HierarchicalMap(grid, motion=motion)
+    return(lambda s, g, observer: hierarchy.solve(s, g, heuristic=args.heuristic))
+
+ENGINES = {
+    "astar": astarEngine,
+    "jps": jpsEngine,
+    "bidirectional": bidirectionalEngine,
+    "alt": altEngine,
+    "hpa": hpaEngine,
+}
+
+## ------------------------------------------------------------------------------------------
+#                                         Commands
+## ------------------------------------------------------------------------------------------
+
+def positive(text):
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {text!r}")
+    return(value)
+
+def cell(text):
+    try:
+        x, y = (int(v) for v in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected x,y, got {text!r}")
+    return((x, y))
+
+def record(start, goal, path, seconds, compress):
+    '''
+    JSON-ready result of one query, with the path last
+    '''
+    result = {"start": list(start), "goal": list(goal), **path.toDict(compress), "seconds": round(seconds, 6)}
+    result["path"] = result.pop("path")
+    return(result)
+
+def readStream(lines):
+    '''
+    (query, None) for every query of a CSV file or stdin, (None, error) for a malformed line
+    '''
+    from .batch import parseQuery
+    with lines:
+        for number, line in enumerate(lines, 1):
+            try:
+                query = parseQuery(line, header=number == 1)
+            except ValueError as error:
+                yield(None, f"line {number}: {error}")
+                continue
+            if query is not None:
+                yield(query, None)
+
+def solveCommand(args, parser):
+    from .maps import BUILTIN, loadMap
+    from .motion import MotionModel
+    options = {name: getattr(args, name) for name in ("width", "height", "scale") if getattr(args, name) is not None}
+    motion = MotionModel.fourConnected() if args.motion == 4 else MotionModel.eightConnected()
+    imported = time.perf_counter()
+    try:
+        grid = loadMap(args.map, **options)
+    except OSError:
+        parser.error(f"{args.map!r} is neither a built-in map ({', '.join(BUILTIN)}) nor a readable grid file")
+    except ValueError as error:
+        parser.error(str(error))
+    try:
+        query = ENGINES[args.engine](grid, motion, args)
+    except ValueError as error:
+        parser.error(f"--engine {args.engine}: {error}")
+    loaded = time.perf_counter()
+
+    if args.queries is not None:
+        try:
+            queries = readStream(sys.stdin if args.queries == "-" else open(args.queries))
+        except OSError as error:
+            parser.error(str(error))
+    else:
+        queries = [((args.start, args.goal), None)]
+
+    planned = failed = 0
+    solveSeconds = 0.0
+    for pair, problem in queries:
+        if problem is not None:
+            failed += 1
+            print(json.dumps({"error": problem}, separators=(", ", ": ")), flush=True)
+            continue
+        start, goal = pair
+        problem = next((f"{name} {list(point)} is outside the map or blocked"
+                        for name, point in (("start", start), ("goal", goal)) if not grid.isFree(point)), None)
+        if problem is not None:
+            result = {"start": list(start), "goal": list(goal), "error": problem}
+            failed += 1
+        else:
+            t0 = time.perf_counter()
+            if args.visualize:
+                from .render import PygameObserver
+                observer = PygameObserver.forGrid(grid, expandDelay=args.delay, goalDelay=5)
+                path = query(start, goal, observer)
+                seconds = time.perf_counter() - t0 - observer.seconds
+            else:
+                path = query(start, goal, None)
+                seconds = time.perf_counter() - t0
+            solveSeconds += seconds
+            planned += 1
+            failed += not path.found
+            result = record(start, goal, path, seconds, args.compress)
+        print(json.dumps(result, separators=(", ", ": ")), flush=True)
+
+    if args.timing:
+        print(f"startup {(loaded - T0) * 1e3:.1f} ms (imports {(imported - T0) * 1e3:.1f} ms, "
+              f"map and {args.engine} setup {(loaded - imported) * 1e3:.1f} ms), "
+              f"solve {solveSeconds * 1e3:.2f} ms for {planned} queries", file=sys.stderr)
+    return(1 if failed else 0)
+
+def serveCommand(args, parser):
+    import asyncio
+
+    from .server import serve
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, [name for name in args.preload.split(",") if name],
+                          maxPending=args.max_pending, timeout=args.timeout, maxMaps=args.max_maps,
+                          maxCells=args.max_cells,
+                          cacheSize=args.cache_size))
+    except KeyboardInterrupt:
+        pass
+    return(0)
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+def main(argv=None):
+    from . import heuristics
+    parser = argparse.ArgumentParser(prog="python -m astar", description="A* grid path planner")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solveParser = commands.add_parser("solve", help="plan one path, or every query of a CSV file")
+    solveParser.add_argument("--map", required=True, help="built-in map name (empty, map1, map2, maze) or grid file")
+    solveParser.add_argument("--start", type=cell, help="start cell x,y")
+    solveParser.add_argument("--goal", type=cell, help="goal cell x,y")
+    solveParser.add_argument("--queries", help="CSV file of sx,sy,gx,gy lines, - for stdin")
+    solveParser.add_argument("--width", type=positive, help="width of a built-in map")
+    solveParser.add_argument("--height", type=positive, help="height of a built-in map")
+    solveParser.add_argument("--scale", type=positive, help="scale factor of a built-in map")
+    solveParser.add_argument("--engine", choices=sorted(ENGINES), default="astar")
+    solveParser.add_argument("--heuristic", choices=sorted(heuristics.VECTOR), default="euclidean")
+    solveParser.add_argument("--motion", type=int, choices=(4, 8), default=8, help="4- or 8-connected moves")
+    solveParser.add_argument("--compress", action="store_true", help="list only the start, turns and goal")
+    solveParser.add_argument("--visualize", action="store_true", help="draw each search with pygame (not --engine hpa)")
+    solveParser.add_argument("--delay", type=float, default=0.05, help="seconds per expanded node with --visualize")
+    solveParser.add_argument("--timing", action="store_true", help="report startup and solve time on stderr")
+    solveParser.set_defaults(run=solveCommand)
+
+    serveParser = commands.add_parser("serve", help="run a planning server (see astar/server.py)")
+    serveParser.add_argument("--host", default="127.0.0.1")
+    serveParser.add_argument("--port", type=int, default=8765)
+    serveParser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    serveParser.add_argument("--preload", default="", help="comma-separated maps to load at startup")
+    serveParser.add_argument("--max-pending", type=int, default=64, help="queued requests before answering 503")
+    serveParser.add_argument("--timeout", type=float, default=1.0, help="default request deadline in seconds")
+    serveParser.add_argument("--max-maps", type=int, default=8, help="maps kept resident")
+    serveParser.add_argument("--max-cells", type=int, default=2**24, help="largest map a request may load, in cells")
+    serveParser.add_argument("--cache-size", type=int, default=4096, help="answers kept in the path cache, 0 for none")
+    serveParser.set_defaults(run=serveCommand)
+
+    args = parser.parse_args(argv)
+    if args.command == "solve" and (args.queries is None) == (args.start is None or args.goal is None):
+        solveParser.error("give either --start and --goal, or --queries")
+    return(args.run(args, solveParser))
+
+if __name__== "__main__":
+    sys.exit(main())
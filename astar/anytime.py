@@ -0,0 +1,174 @@
+## ------------------------------------------------------------------------------------------
+#                              Anytime Repairing A* (ARA*)
+## ------------------------------------------------------------------------------------------
+
+'''
+ARA* (Likhachev, Gordon and Thrun, 2003): a bounded-latency version of solve().
+
+The evaluation function is the usual f = c2c + c2g with the heuristic inflated by a weight
+w >= 1, f = c2c + w * c2g. A large w finds a path quickly, with cost at most w times the
+optimal. ARA* then lowers w step by step and repairs the search, reusing the cost-to-come
+values it already has. Only cells whose cost improved after they were expanded (the
+INCONS list) are queued again. Each finished pass gives a path and a proven bound:
+
+    bound = cost / min(c2c + c2g over queued cells)   (cost <= bound * optimal)
+
+solveAnytime() stops at a wall-clock deadline (seconds) or an expansion budget, whichever
+comes first, and returns the best path found so far with its bound. bound == 1 means the
+path is optimal. If time runs out before the first pass ends, the path is empty.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import time
+
+from . import heuristics
+from .motion import EIGHT_CONNECTED
+from .openlist import OpenList
+from .solver import Path
+
+## ------------------------------------------------------------------------------------------
+#                                    Anytime Path Class
+## ------------------------------------------------------------------------------------------
+
+class AnytimePath(Path):
+
+    '''
+    Attributes:
+        cells: (x, y) cells from start to goal of the best path found, empty if none
+        cost: cost of that path, inf if none
+        expanded: nodes expanded over all passes
+        bound: proven suboptimality bound, cost <= bound * optimal cost
+        weight: heuristic weight of the last finished pass
+        improvements: (seconds, expanded, cost, bound) after every finished pass
+    '''
+
+    def __init__(self, cells, cost, expanded, bound=float('inf'), weight=None, improvements=()):
+        Path.__init__(self, cells, cost, expanded)
+        self.bound = bound
+        self.weight = weight
+        self.improvements = list(improvements)
+
+    def __repr__(self):
+        return(f' AnytimePath: {len(self.cells)} cells, cost: {round(self.cost, 3)}, '
+               f'bound: {round(self.bound, 3)}, expanded: {self.expanded}')
+
+    @property
+    def optimal(self):
+        return(self.bound <= 1.0)
+
+## ------------------------------------------------------------------------------------------
+#                                         Solver
+## ------------------------------------------------------------------------------------------
+
+def solveAnytime(start, goal, grid, deadline=None, budget=None, weight=3.0, step=0.5,
+                 motion=EIGHT_CONNECTED, heuristic="euclidean"):
+    '''
+    Best path from start to goal found within deadline seconds and / or budget expansions
+    (no limit if both are None), starting at heuristic weight `weight` and lowering it by
+    `step` after every pass. Returns an AnytimePath.
+    '''
+    start, goal = tuple(start), tuple(goal)
+    if not grid.inBounds(start):
+        raise ValueError(f"start {start} is outside the {grid.width} x {grid.height} map")
+    if not grid.inBounds(goal):
+        raise ValueError(f"goal {goal} is outside the {grid.width} x {grid.height} map")
+    if weight < 1:
+        raise ValueError(f"weight must be at least 1, got {weight}")
+    t0 = time.perf_counter()
+    stopTime = None if deadline is None else t0 + deadline
+
+    width, height = grid.width, grid.height
+    hScalar = heuristics.scalarFor(heuristic, motion)
+    masks = None if grid.mapped else motion.masksFor(grid)
+    blocked = grid.cells.reshape(-1)
+    moves = motion.offsets(height)
+    gx, gy = goal
+    startId, goalId = grid.cellId(start), grid.cellId(goal)
+    hCache = {}
+    stepCosts = {}
+    for _, _, dx, dy, stepCost in moves:
+        stepCosts[(dx, dy)] = min(stepCost, stepCosts.get((dx, dy), stepCost))
+
+    def h(cellId):
+        value = hCache.get(cellId)
+        if value is None:
+            x, y = divmod(cellId, height)
+            value = hCache[cellId] = hScalar(abs(x + 1 - gx), abs(y + 1 - gy))
+        return(value)
+
+    c2c = {startId: 0.0}
+    parent = {startId: -1}
+    queue = OpenList()
+    incons = set()
+    w = float(weight)
+    queue.push(startId, w * h(startId))
+    best = AnytimePath([], float('inf'), 0)
+    expanded = 0
+    outOfTime = False
+
+    while True:
+        # ImprovePath: expand until nothing queued can beat the goal's f value
+        closed = set()
+        while queue and queue.peek()[1] < c2c.get(goalId, float('inf')):
+            if (budget is not None and expanded >= budget) or (stopTime is not None and time.perf_counter() >= stopTime):
+                outOfTime = True
+                break
+            current, _, _ = queue.pop()
+            closed.add(current)
+            expanded += 1
+            x, y = current // height + 1, current % height + 1
+            currentCost = c2c[current]
+            mask = -1 if masks is None else int(masks[current])
+            for bit, dId, dx, dy, stepCost in moves:
+                if not mask & bit:
+                    continue
+                child = current + dId
+                if masks is None and (not (1 <= x + dx <= width and 1 <= y + dy <= height) or blocked[child]):
+                    continue
+                newCost = currentCost + stepCost
+                if newCost < c2c.get(child, float('inf')):
+                    c2c[child] = newCost
+                    parent[child] = current
+                    if child in closed:
+                        incons.add(child)   # improved after expansion, queue it next pass
+                    else:
+                        queue.push(child, newCost + w * h(child))
+        if outOfTime:
+            break
+
+        # the pass is complete: record its path and the proven bound
+        if goalId in c2c:
+            cells = []
+            current = goalId
+            while current != -1:
+                cells.append(grid.cellFromId(current))
+                current = parent[current]
+            cells.reverse()
+            # parents may have improved since the goal was reached, so the path can be
+            # cheaper than c2c[goal]; report what it really costs
+            cost = sum(stepCosts[(b[0] - a[0], b[1] - a[1])] for a, b in zip(cells, cells[1:]))
+            lower = min([c2c[s] + h(s) for s in list(queue.entries) + list(incons)], default=float('inf'))
+            bound = max(1.0, min(w, cost / lower)) if lower > 0 else 1.0
+            if cost < best.cost or bound < best.bound:
+                best = AnytimePath(cells, cost, expanded, bound, w, best.improvements)
+            best.improvements.append((time.perf_counter() - t0, expanded, cost, bound))
+            if bound <= 1.0:
+                break
+        elif not queue:
+            break                           # goal unreachable
+        if w <= 1.0:
+            break
+
+        # next pass: lower the weight, requeue the INCONS cells and rekey the queue
+        w = max(1.0, w - step)
+        pending = list(queue.entries) + list(incons)
+        incons = set()
+        queue = OpenList()
+        for s in pending:
+            queue.push(s, c2c[s] + w * h(s))
+
+    best.expanded = expanded
+    return(best)
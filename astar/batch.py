@@ -0,0 +1,153 @@
+## ------------------------------------------------------------------------------------------
+#                                   Batch Query Engine
+## ------------------------------------------------------------------------------------------
+
+'''
+Plans many (start, goal) queries against one map.
+
+The map, the neighbour masks and the search buffers are prepared once. Every query reuses
+the same buffers; between queries they are reset by bumping their generation counter
+(see astar.buffers), not by clearing the arrays. Results are streamed as they are found.
+
+Query files are CSV with one query per line, "sx,sy,gx,gy"; blank lines, lines starting
+with # and a non-numeric header on the first line are skipped; any other malformed line
+raises ValueError.
+
+Usage: python -m astar.batch MAP QUERIES.csv       MAP is a built-in name or a grid file
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import time
+
+from .buffers import newBuffers
+from .motion import EIGHT_CONNECTED
+from .solver import solve
+
+## ------------------------------------------------------------------------------------------
+#                                  Batch Planner Class
+## ------------------------------------------------------------------------------------------
+
+class BatchPlanner:
+
+    '''
+    Attributes:
+        grid: OccupancyGrid shared by every query
+        motion: MotionModel used by every query
+        heuristic: heuristic name used by every query
+        buffers: search buffers reused between queries
+        queries: number of queries planned, not counting rejected ones
+        invalid: number of queries rejected by run() (start or goal outside the map)
+        seconds: total time spent planning the counted queries
+        stats: SearchStats accumulating every query, or None
+    '''
+
+    def __init__(self, grid, motion=EIGHT_CONNECTED, heuristic="euclidean", stats=None):
+        self.grid = grid
+        self.motion = motion
+        self.heuristic = heuristic
+        self.stats = stats
+        self.buffers = newBuffers(grid)
+        if not grid.mapped:
+            motion.masksFor(grid)     # build the neighbour masks up front
+        self.queries = 0
+        self.invalid = 0
+        self.seconds = 0.0
+
+    def __repr__(self):
+        return(f' BatchPlanner: {self.queries} queries, {round(self.queriesPerSecond, 1)} queries/sec')
+
+    @property
+    def queriesPerSecond(self):
+        return(self.queries / self.seconds if self.seconds > 0 else 0.0)
+
+    def plan(self, start, goal, observer=None):
+        '''
+        Path for a single query, reusing the planner's buffers
+        '''
+        t0 = time.perf_counter()
+        path = solve(start, goal, self.grid, observer=observer, motion=self.motion, buffers=self.buffers,
+                     heuristic=self.heuristic, stats=self.stats)
+        self.seconds += time.perf_counter() - t0
+        self.queries += 1
+        return(path)
+
+    def run(self, queries):
+        '''
+        Plan every (start, goal) pair of an iterable, yielding (start, goal, path) as each one
+        finishes. path is None for a query whose start or goal lies outside the map.
+        '''
+        for start, goal in queries:
+            try:
+                path = self.plan(start, goal)
+            except ValueError:
+                self.invalid += 1
+                path = None
+            yield(start, goal, path)
+
+## ------------------------------------------------------------------------------------------
+#                                     Helper Functions
+## ------------------------------------------------------------------------------------------
+
+def parseQuery(line, header=False):
+    '''
+    ((sx, sy), (gx, gy)) from a "sx,sy,gx,gy" line, or None for a line to skip. A line of
+    four non-integer fields is skipped as a column header if header is True (the first line
+    of a file), and raises ValueError like any other malformed line otherwise.
+    '''
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return(None)
+    fields = [field.strip() for field in line.split(",")]
+    if len(fields) != 4:
+        raise ValueError(f"expected sx,sy,gx,gy, got {line!r}")
+    try:
+        sx, sy, gx, gy = (int(field) for field in fields)
+    except ValueError:
+        if header:
+            return(None)
+        raise ValueError(f"expected integers sx,sy,gx,gy, got {line!r}")
+    return((sx, sy), (gx, gy))
+
+def readQueries(path):
+    '''
+    Stream the queries of a CSV file, raises ValueError on a malformed line
+    '''
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            try:
+                query = parseQuery(line, header=number == 1)
+            except ValueError as error:
+                raise ValueError(f"{path}, line {number}: {error}")
+            if query is not None:
+                yield(query)
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+if __name__== "__main__":
+
+    import argparse
+
+    from .maps import loadMap
+
+    parser = argparse.ArgumentParser(description="Plan every query of a CSV file on one map")
+    parser.add_argument("map", help="built-in map name (empty, map1, map2, maze) or grid file")
+    parser.add_argument("queries", help="CSV file of sx,sy,gx,gy lines")
+    parser.add_argument("--stats", help="write search statistics of the whole batch to this JSON file")
+    args = parser.parse_args()
+
+    from .stats import SearchStats
+    planner = BatchPlanner(loadMap(args.map), stats=SearchStats() if args.stats else None)
+    for start, goal, path in planner.run(readQueries(args.queries)):
+        if path is None:
+            print(start, goal, "outside map")
+        else:
+            print(start, goal, round(path.cost, 3) if path.found else "no path", path.expanded)
+    print(f"{planner.queries} queries, {planner.invalid} invalid, {planner.queriesPerSecond:.1f} queries/sec")
+    if args.stats:
+        with open(args.stats, "w") as f:
+            f.write(planner.stats.toJSON(indent=2))
@@ -0,0 +1,146 @@
+## ------------------------------------------------------------------------------------------
+#                                    Bidirectional A*
+## ------------------------------------------------------------------------------------------
+
+'''
+A* run from the start and from the goal at the same time.
+
+The backward search walks the moves of the motion model in reverse. Both sides use the
+average potential p(n) = (h(n, goal) - h(n, start)) / 2: the forward key is g(n) + p(n) and
+the backward key is g(n) - p(n). With a consistent heuristic, both are Dijkstra searches
+on non-negative reduced costs.
+
+Every time a relaxed cell has already been reached by the other side, the path through it
+is a candidate, and the cheapest one, of cost mu, is kept. Each step expands one node of the
+side with the smaller open list.
+
+Termination: a path through an open node n costs at least keyF(n) + keyB(n), because the
+potentials cancel. Once the sum of the two lowest keys reaches mu, no cheaper path is left
+and the candidate is optimal. Stopping at the first meeting cell would not be.
+
+Whether this beats solve() depends on the map. It saves the most when a strong heuristic
+still leads one end into dead ends the other end avoids. With octile or euclidean
+heuristics on the built-in maps, plain A* usually expands fewer nodes. Run
+benchmarks/bench_bidirectional.py to compare.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from . import heuristics
+from .buffers import newBuffers
+from .motion import EIGHT_CONNECTED
+from .openlist import OpenList
+from .solver import Path
+
+## ------------------------------------------------------------------------------------------
+#                                      Frontier Class
+## ------------------------------------------------------------------------------------------
+
+class _Frontier:
+
+    '''
+    Attributes:
+        buffers: SearchBuffers of this direction
+        queue: open list of this direction
+        target: cell the heuristic measures towards
+        sign: +1 walks the moves forward, -1 walks them backward
+        expanded: nodes expanded by this direction
+    '''
+
+    def __init__(self, grid, rootId, target, sign, priority):
+        self.buffers = newBuffers(grid)
+        self.buffers.reset()
+        self.buffers.c2c[rootId] = 0.0
+        self.buffers.parent[rootId] = -1
+        self.buffers.state[rootId] = self.buffers.openMark
+        self.queue = OpenList()
+        self.queue.push(rootId, priority)
+        self.target = target
+        self.sign = sign
+        self.expanded = 0
+
+## ------------------------------------------------------------------------------------------
+#                                         Solver
+## ------------------------------------------------------------------------------------------
+
+def solveBidirectional(start, goal, grid, observer=None, motion=EIGHT_CONNECTED, heuristic="euclidean"):
+    '''
+    Same contract as solve(), searching from both ends. path.expanded is the total of both
+    directions.
+    '''
+    start, goal = tuple(start), tuple(goal)
+    if not grid.inBounds(start):
+        raise ValueError(f"start {start} is outside the {grid.width} x {grid.height} map")
+    if not grid.inBounds(goal):
+        raise ValueError(f"goal {goal} is outside the {grid.width} x {grid.height} map")
+    if observer is not None:
+        observer.onStart(start, goal, grid)
+
+    width, height = grid.width, grid.height
+    hScalar = heuristics.scalarFor(heuristic, motion)
+    masks = None if grid.mapped else motion.masksFor(grid)
+    blocked = grid.cells.reshape(-1)
+    moves = motion.offsets(height)
+    startId, goalId = grid.cellId(start), grid.cellId(goal)
+    h0 = hScalar(abs(start[0] - goal[0]), abs(start[1] - goal[1]))
+    forward = _Frontier(grid, startId, goal, 1, h0 / 2)
+    backward = _Frontier(grid, goalId, start, -1, h0 / 2)
+    best, meet = (0.0, startId) if startId == goalId else (float('inf'), -1)
+    if blocked[goalId] and startId != goalId:    # solve() never enters a blocked goal
+        forward.queue.clear()
+
+    while forward.queue and backward.queue:
+        if forward.queue.peek()[1] + backward.queue.peek()[1] >= best:
+            break
+        side, other = (forward, backward) if len(forward.queue) <= len(backward.queue) else (backward, forward)
+        c2c, parent, state = side.buffers.c2c, side.buffers.parent, side.buffers.state
+        OPEN, CLOSED = side.buffers.openMark, side.buffers.closedMark
+        otherC2c, otherState = other.buffers.c2c, other.buffers.state
+        otherMarks = (other.buffers.openMark, other.buffers.closedMark)
+        sx, sy = start if side.sign > 0 else goal      # root of this direction
+        tx, ty = side.target
+
+        current, _, _ = side.queue.pop()
+        state[current] = CLOSED
+        side.expanded += 1
+        x, y = current // height + 1, current % height + 1
+        if observer is not None:
+            observer.onExpand((x, y))
+
+        currentCost = float(c2c[current])
+        mask = -1 if masks is None or side.sign < 0 else int(masks[current])
+        for bit, dId, dx, dy, stepCost in moves:
+            if side.sign > 0:
+                if not mask & bit:
+                    continue
+                child, nx, ny = current + dId, x + dx, y + dy
+                if masks is None and (not (1 <= nx <= width and 1 <= ny <= height) or blocked[child]):
+                    continue
+            else:   # predecessor: a cell that reaches current through this move
+                child, nx, ny = current - dId, x - dx, y - dy
+                if not (1 <= nx <= width and 1 <= ny <= height) or (blocked[child] and child != startId):
+                    continue
+            if state[child] == CLOSED:
+                continue
+            newCost = currentCost + stepCost
+            if state[child] != OPEN or newCost < c2c[child]:
+                c2c[child] = newCost
+                parent[child] = current
+                state[child] = OPEN
+                side.queue.push(child, newCost + (hScalar(abs(nx - tx), abs(ny - ty)) - hScalar(abs(nx - sx), abs(ny - sy))) / 2)
+                if otherState[child] in otherMarks and newCost + otherC2c[child] < best:
+                    best, meet = newCost + float(otherC2c[child]), child
+
+    expanded = forward.expanded + backward.expanded
+    if meet == -1:
+        path = Path([], float('inf'), expanded)
+    else:
+        ids = np.concatenate((forward.buffers.backtrackIds(meet), backward.buffers.backtrackIds(meet)[::-1][1:]))
+        path = Path.fromIds(ids, grid.height, best, expanded)
+    if observer is not None:
+        observer.onFinish(path)
+    return(path)
@@ -0,0 +1,195 @@
+## ------------------------------------------------------------------------------------------
+#                                  Search Buffers [Node Store]
+## ------------------------------------------------------------------------------------------
+
+'''
+Preallocated per-cell search state, replacing one Node object per generated neighbour.
+
+Every cell of the map has a flat id, (x - 1) * height + (y - 1), and the search keeps its state
+in NumPy arrays indexed by that id:
+
+    c2c     float64   cost to come, only valid while the cell is OPEN or CLOSED
+    parent  int32     flat id of the parent cell, -1 for none (int64 on maps over 2**31 cells)
+    state   uint32    generation << 2 | NEW / OPEN / CLOSED
+
+That is 16 bytes per cell, allocated once per map. The buffers can be passed back into
+solve() so later searches on the same map allocate nothing.
+
+Resetting between searches does not clear the arrays: reset() bumps a generation counter, and
+a cell whose state carries an older generation reads as NEW. A search compares state against
+openMark and closedMark, and only the cells it reaches are ever written. The arrays are only
+cleared when the counter wraps around.
+
+Maps above DENSE_LIMIT cells (e.g. memory-mapped 50k x 50k grids) use SparseSearchBuffers
+instead, which has the same interface but only stores the cells a search reaches.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import sys
+
+import numpy as np
+
+NEW, OPEN, CLOSED = 0, 1, 2   # cell states, low 2 bits of state
+
+MAX_GENERATION = 2**30 - 1    # generation << 2 must fit in uint32
+
+DENSE_LIMIT = 2**25           # cells, about 540 MB of dense buffers
+
+## ------------------------------------------------------------------------------------------
+#                                  Search Buffers Class
+## ------------------------------------------------------------------------------------------
+
+class SearchBuffers:
+
+    '''
+    Attributes:
+        width: number of columns (x)
+        height: number of rows (y)
+        c2c: cost to come of every cell
+        parent: flat id of the parent of every cell
+        state: generation and NEW / OPEN / CLOSED flag of every cell
+        generation: id of the current search, see reset()
+        openMark, closedMark: state values of OPEN and CLOSED cells in this generation
+    '''
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        size = width * height
+        indexType = np.int32 if size < 2**31 else np.int64
+        self.c2c = np.zeros(size, dtype=np.float64)
+        self.parent = np.zeros(size, dtype=indexType)
+        self.state = np.zeros(size, dtype=np.uint32)
+        self.generation = 0
+        self.openMark = self.closedMark = None
+
+    def __repr__(self):
+        return(f' SearchBuffers: {self.width} x {self.height}, {self.nbytes} bytes')
+
+    @classmethod
+    def forGrid(cls, grid):
+        return(cls(grid.width, grid.height))
+
+    @property
+    def nbytes(self):
+        return(self.c2c.nbytes + self.parent.nbytes + self.state.nbytes)
+
+    def fits(self, grid):
+        return(self.width == grid.width and self.height == grid.height)
+
+    def reset(self):
+        '''
+        Start a new search: every cell reads as NEW again, in O(1)
+        '''
+        self.generation += 1
+        if self.generation > MAX_GENERATION:   # wrapped around, stale marks could collide
+            self.state.fill(0)
+            self.generation = 1
+        self.openMark = self.generation << 2 | OPEN
+        self.closedMark = self.generation << 2 | CLOSED
+
+    def isReached(self, cellId):
+        return(self.state[cellId] in (self.openMark, self.closedMark))
+
+    def cost(self, cellId):
+        '''
+        Cost to come of a cell in the current search, inf if it was not reached
+        '''
+        return(float(self.c2c[cellId]) if self.isReached(cellId) else float('inf'))
+
+    def cellId(self, cell):
+        return((cell[0] - 1) * self.height + (cell[1] - 1))
+
+    def cellFromId(self, cellId):
+        x, y = divmod(cellId, self.height)
+        return((x + 1, y + 1))
+
+    def backtrackIds(self, goalId):
+        '''
+        int64 array of the flat ids from start to goal, following parent ids back from goalId
+        '''
+        parent = self.parent
+        backtrackIds = []
+        current = goalId
+        while current != -1:
+            backtrackIds.append(current)
+            current = int(parent[current])
+        return(np.array(backtrackIds[::-1], dtype=np.int64))
+
+    def backtrack(self, goalId):
+        '''
+        Cells from start to goal as (x, y) tuples
+        '''
+        return([self.cellFromId(cellId) for cellId in self.backtrackIds(goalId).tolist()])
+
+## ------------------------------------------------------------------------------------------
+#                                  Sparse Search Buffers
+## ------------------------------------------------------------------------------------------
+
+class _SparseArray(dict):
+
+    '''
+    dict that reads as a default value for missing ids, so it can stand in for an array
+    '''
+
+    def __init__(self, default):
+        dict.__init__(self)
+        self.default = default
+
+    def __missing__(self, key):
+        return(self.default)
+
+    def fill(self, value):
+        self.clear()
+        self.default = value
+
+
+class SparseSearchBuffers(SearchBuffers):
+
+    '''
+    SearchBuffers that only store the cells a search reaches, for maps too large for
+    dense per-cell arrays
+
+    Attributes:
+        width: number of columns (x)
+        height: number of rows (y)
+        c2c: cost to come of every reached cell
+        parent: flat id of the parent of every reached cell
+        state: generation and NEW / OPEN / CLOSED flag of every reached cell
+        generation: id of the current search
+        openMark, closedMark: state values of OPEN and CLOSED cells in this generation
+    '''
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.c2c = _SparseArray(np.inf)
+        self.parent = _SparseArray(-1)
+        self.state = _SparseArray(NEW)
+        self.generation = 0
+        self.openMark = self.closedMark = None
+
+    def reset(self):
+        self.c2c.clear()      # dicts only hold the cells of the last search, drop them
+        self.parent.clear()
+        self.state.clear()
+        SearchBuffers.reset(self)
+
+    @property
+    def nbytes(self):
+        return(sys.getsizeof(self.c2c) + sys.getsizeof(self.parent) + sys.getsizeof(self.state))
+
+## ------------------------------------------------------------------------------------------
+#                                     Helper Functions
+## ------------------------------------------------------------------------------------------
+
+def newBuffers(grid):
+    '''
+    Dense buffers for ordinary maps, sparse ones for maps above DENSE_LIMIT cells
+    '''
+    if grid.width * grid.height > DENSE_LIMIT:
+        return(SparseSearchBuffers.forGrid(grid))
+    return(SearchBuffers.forGrid(grid))
@@ -0,0 +1,167 @@
+## ------------------------------------------------------------------------------------------
+#                               Goal Distance Field Cache
+## ------------------------------------------------------------------------------------------
+
+'''
+Cost-to-goal fields for answering many queries toward the same goal.
+
+distanceField() runs one backward Dijkstra from the goal over the whole grid and returns the
+exact cost to goal of every cell (inf where the goal cannot be reached). After that, the
+path from any start is found by following the field downhill: at each cell, step to the
+neighbour minimizing step cost + field value. That costs O(path length) per query, with no
+search.
+
+The Dijkstra uses scipy.sparse.csgraph when scipy is installed, and a heapq version otherwise.
+
+FieldCache keeps computed fields in an LRU cache keyed by (map id, goal, motion model),
+bounded by a memory budget in bytes.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import heapq
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from .motion import EIGHT_CONNECTED
+from .solver import Path
+
+## ------------------------------------------------------------------------------------------
+#                                     Distance Fields
+## ------------------------------------------------------------------------------------------
+
+def distanceField(grid, goal, motion=EIGHT_CONNECTED):
+    '''
+    Flat float64 array of the cost from every cell to goal, indexed by cell id
+    '''
+    if not grid.isFree(goal):
+        raise ValueError(f"goal {tuple(goal)} is outside the map or blocked")
+    goalId = grid.cellId(goal)
+    try:
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import dijkstra
+    except ImportError:
+        return(_heapDijkstra(grid, goalId, motion))
+
+    size = grid.width * grid.height
+    free = np.flatnonzero(~np.asarray(grid.cells, dtype=bool).reshape(-1))
+    parents, children, costs = motion.expand(free, grid)
+    reverse = csr_matrix((costs, (children, parents)), shape=(size, size))   # child --> parent
+    return(dijkstra(reverse, directed=True, indices=goalId))
+
+def _heapDijkstra(grid, goalId, motion):
+    height = grid.height
+    masks = motion.masksFor(grid)
+    blocked = grid.cells.reshape(-1)
+    # walking backwards: cell c is reached from cell c - dId through move k
+    moves = [(bit, dId, cost) for bit, dId, _, _, cost in motion.offsets(height)]
+    field = np.full(grid.width * height, np.inf)
+    field[goalId] = 0.0
+    heap = [(0.0, goalId)]
+    while heap:
+        dist, current = heapq.heappop(heap)
+        if dist > field[current]:
+            continue
+        for bit, dId, cost in moves:
+            prev = current - dId
+            if not 0 <= prev < field.size or not masks[prev] & bit or blocked[prev]:
+                continue
+            newDist = dist + cost
+            if newDist < field[prev]:
+                field[prev] = newDist
+                heapq.heappush(heap, (newDist, prev))
+    return(field)
+
+def pathFromField(field, start, grid, motion=EIGHT_CONNECTED):
+    '''
+    Follow a distance field downhill from start, returns a Path (expanded is 0)
+    '''
+    start = tuple(start)
+    if not grid.inBounds(start):
+        raise ValueError(f"start {start} is outside the {grid.width} x {grid.height} map")
+    current = grid.cellId(start)
+    if not np.isfinite(field[current]):
+        return(Path([], float('inf'), 0))
+    masks = motion.masksFor(grid)
+    moves = [(bit, dId, cost) for bit, dId, _, _, cost in motion.offsets(grid.height)]
+    cells = [start]
+    cost = 0.0
+    while field[current] > 0:
+        best, bestValue, bestCost = None, float('inf'), 0.0
+        mask = int(masks[current])
+        for bit, dId, stepCost in moves:
+            if mask & bit:
+                value = stepCost + field[current + dId]
+                if value < bestValue:
+                    best, bestValue, bestCost = current + dId, value, stepCost
+        current = best
+        cost += bestCost
+        cells.append(grid.cellFromId(current))
+    return(Path(cells, cost, 0))
+
+## ------------------------------------------------------------------------------------------
+#                                    Field Cache Class
+## ------------------------------------------------------------------------------------------
+
+class FieldCache:
+
+    '''
+    Attributes:
+        budget: maximum total size of the cached fields in bytes
+        fields: (map id, goal, moves) --> (grid version, field, grid), least recently used first
+        nbytes: current total size of the cached fields
+        hits, misses: lookup counters
+    '''
+
+    def __init__(self, budget=256 * 2**20):
+        self.budget = budget
+        self.fields = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return(f' FieldCache: {len(self.fields)} fields, {self.nbytes} of {self.budget} bytes, {self.hits} hits, {self.misses} misses')
+
+    def __len__(self):
+        return(len(self.fields))
+
+    def field(self, grid, goal, motion=EIGHT_CONNECTED, mapId=None):
+        '''
+        Cached distanceField(grid, goal, motion). mapId names the map in the cache key and
+        defaults to the grid object itself; fields of an edited grid are recomputed.
+        '''
+        key = (id(grid) if mapId is None else mapId, tuple(goal), motion.moves)
+        entry = self.fields.get(key)
+        if entry is not None and entry[0] == grid.version and (mapId is not None or entry[2]() is grid):
+            self.fields.move_to_end(key)
+            self.hits += 1
+            return(entry[1])
+        self.misses += 1
+        if entry is not None:
+            self.drop(key)
+        field = distanceField(grid, goal, motion)
+        if field.nbytes <= self.budget:
+            while self.nbytes + field.nbytes > self.budget:
+                self.drop(next(iter(self.fields)))    # evict least recently used
+            self.fields[key] = (grid.version, field, weakref.ref(grid))
+            self.nbytes += field.nbytes
+        return(field)
+
+    def drop(self, key):
+        field = self.fields.pop(key)[1]
+        self.nbytes -= field.nbytes
+
+    def clear(self):
+        self.fields.clear()
+        self.nbytes = 0
+
+    def solve(self, start, goal, grid, motion=EIGHT_CONNECTED, mapId=None):
+        '''
+        Path from start to goal using the cached field of goal
+        '''
+        return(pathFromField(self.field(grid, goal, motion, mapId), start, grid, motion))
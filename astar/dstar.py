@@ -0,0 +1,209 @@
+## ------------------------------------------------------------------------------------------
+#                              Incremental Replanning (D* Lite)
+## ------------------------------------------------------------------------------------------
+
+'''
+D* Lite (Koenig and Likhachev, 2002) for a robot that discovers obstacles while it moves.
+
+The search runs backward from the goal and keeps two cost-to-goal estimates per cell: g, the
+value from the last expansion, and rhs, the one-step lookahead min over moves of
+cost + g(neighbour). Cells where the two differ are queued. When cells change, only their rhs values are
+recomputed. The next plan() expands just the queued cells whose key is below the start's key.
+That is usually a small region near the change, not the whole map.
+
+    planner = DStarLite(grid, start, goal)
+    path = planner.plan()
+    grid.add(cell)              # obstacle discovered
+    planner.moveTo(path.cells[1])
+    path = planner.plan()       # repairs the previous search (update() runs automatically)
+
+The keys must stay lower bounds across edits and moves, so the heuristic has to be
+consistent: octile by default, or another name in heuristics.ADMISSIBLE (manhattan is
+refused). python -m astar.validate checks the plan, move and edit cycle against Dijkstra.
+
+plan() returns a Path whose expanded count covers that call only, which shows the saving
+over solve() from scratch. Edits are detected by comparing the grid against a copy taken at
+the last update, or can be passed to update() as a list of cells.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from . import heuristics
+from .motion import EIGHT_CONNECTED
+from .openlist import OpenList
+from .solver import Path
+
+INF = float('inf')
+
+EPS = 1e-9      # g + h sums along one path differ by rounding, keys this close are ties
+
+## ------------------------------------------------------------------------------------------
+#                                    D* Lite Planner Class
+## ------------------------------------------------------------------------------------------
+
+class DStarLite:
+
+    '''
+    Attributes:
+        grid: OccupancyGrid being planned on, edited by the caller
+        start: current robot cell, moved with moveTo()
+        goal: goal cell
+        motion: MotionModel of the robot
+        g, rhs: cell id --> cost to goal estimates (missing means inf)
+        queue: inconsistent cells keyed by (min(g, rhs) + h + km, min(g, rhs))
+        km: key modifier, sum of the heuristic distances the robot has moved
+        expanded: expansions done by the last plan()
+    '''
+
+    def __init__(self, grid, start, goal, motion=EIGHT_CONNECTED, heuristic="octile"):
+        start, goal = tuple(start), tuple(goal)
+        if not grid.inBounds(start):
+            raise ValueError(f"start {start} is outside the {grid.width} x {grid.height} map")
+        if not grid.inBounds(goal):
+            raise ValueError(f"goal {goal} is outside the {grid.width} x {grid.height} map")
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.motion = motion
+        if heuristics.checkName(heuristic) not in heuristics.ADMISSIBLE:
+            raise ValueError(f"D* Lite needs a consistent heuristic, pick one of {sorted(heuristics.ADMISSIBLE)}")
+        self.hScalar = heuristics.scalarFor(heuristic, motion)
+        self.moves = [(dId, dx, dy, cost) for _, dId, dx, dy, cost in motion.offsets(grid.height)]
+        self.blocked = grid.cells.reshape(-1)
+        self.snapshot = np.array(grid.cells, dtype=bool)
+        self.version = grid.version
+        self.km = 0.0
+        self.expanded = 0
+
+        self.goalId = grid.cellId(goal)
+        self.g = {}
+        self.rhs = {self.goalId: 0.0}
+        self.queue = OpenList()
+        self.queue.push(self.goalId, self.key(self.goalId))
+
+    def __repr__(self):
+        return(f' DStarLite: {self.start} --> {self.goal}, {len(self.g)} cells reached, {len(self.queue)} queued')
+
+    ## --------------------------------------------------------------------------------------
+    #                                  Graph and Keys
+    ## --------------------------------------------------------------------------------------
+
+    def key(self, cellId):
+        m = min(self.g.get(cellId, INF), self.rhs.get(cellId, INF))
+        x, y = divmod(cellId, self.grid.height)
+        return((m + self.hScalar(abs(x + 1 - self.start[0]), abs(y + 1 - self.start[1])) + self.km, m))
+
+    def neighbours(self, cellId, sign):
+        '''
+        (neighbour id, cost) over the moves from the cell (sign +1) or into it (sign -1).
+        A move touching a blocked cell costs inf.
+        '''
+        width, height = self.grid.width, self.grid.height
+        x, y = divmod(cellId, height)
+        blocked = self.blocked
+        here = blocked[cellId]
+        for dId, dx, dy, cost in self.moves:
+            nx, ny = x + sign * dx, y + sign * dy
+            if 0 <= nx < width and 0 <= ny < height:
+                other = cellId + sign * dId
+                yield(other, INF if here or blocked[other] else cost)
+
+    def updateCell(self, cellId):
+        g, rhs = self.g, self.rhs
+        if cellId != self.goalId:
+            rhs[cellId] = min((cost + g.get(s, INF) for s, cost in self.neighbours(cellId, 1)), default=INF)
+        self.queue.remove(cellId)
+        if g.get(cellId, INF) != rhs.get(cellId, INF):
+            self.queue.push(cellId, self.key(cellId))
+
+    ## --------------------------------------------------------------------------------------
+    #                                     Planning
+    ## --------------------------------------------------------------------------------------
+
+    def computeShortestPath(self):
+        g, rhs, queue = self.g, self.rhs, self.queue
+        startId = self.grid.cellId(self.start)
+        expanded = 0
+        # also expand ties with the start's key: the heap orders keys exactly, and a stale
+        # cell whose key differs from the start's only by rounding must not be left behind
+        while queue and (queue.peek()[1][0] <= self.key(startId)[0] + EPS or rhs.get(startId, INF) != g.get(startId, INF)):
+            current, oldKey, _ = queue.pop()
+            newKey = self.key(current)
+            if oldKey[0] < newKey[0] - EPS:     # key went stale after the robot moved
+                queue.push(current, newKey)
+                continue
+            expanded += 1
+            if g.get(current, INF) > rhs.get(current, INF):
+                g[current] = rhs[current]       # over-consistent: settle it
+                for p, _ in self.neighbours(current, -1):
+                    self.updateCell(p)
+            else:
+                g[current] = INF                # under-consistent: raise it, recheck around
+                self.updateCell(current)
+                for p, _ in self.neighbours(current, -1):
+                    self.updateCell(p)
+        self.expanded = expanded
+        return(expanded)
+
+    def plan(self):
+        '''
+        Repair the search after any grid edits and return the path from the current start
+        '''
+        if self.grid.version != self.version:
+            self.update()
+        self.computeShortestPath()
+        grid, g = self.grid, self.g
+        current = grid.cellId(self.start)
+        cost = g.get(current, INF)
+        if cost == INF:
+            return(Path([], INF, self.expanded))
+        cells = [self.start]
+        total = 0.0
+        while current != self.goalId:   # descend: best move cost + cost to goal
+            best, bestValue, bestCost = None, INF, 0.0
+            for s, stepCost in self.neighbours(current, 1):
+                value = stepCost + g.get(s, INF)
+                if value < bestValue:
+                    best, bestValue, bestCost = s, value, stepCost
+            if best is None or len(cells) > grid.width * grid.height:
+                return(Path([], INF, self.expanded))
+            current = best
+            total += bestCost
+            cells.append(grid.cellFromId(current))
+        return(Path(cells, total, self.expanded))
+
+    def update(self, cells=None):
+        '''
+        Account for changed cells: the (x, y) cells given, or by default every cell that
+        differs from the copy taken at the last update. Returns the number of cells changed.
+        '''
+        grid = self.grid
+        if cells is None:
+            changed = [grid.cellId((int(x) + 1, int(y) + 1))
+                       for x, y in np.argwhere(self.snapshot != np.asarray(grid.cells, dtype=bool))]
+        else:
+            changed = [grid.cellId(cell) for cell in cells]
+        self.blocked = grid.cells.reshape(-1)
+        for cellId in changed:
+            # every move into or out of the cell changed cost, so recompute its rhs and
+            # the rhs of every cell with a move into it
+            self.updateCell(cellId)
+            for p, _ in self.neighbours(cellId, -1):
+                self.updateCell(p)
+        self.snapshot = np.array(grid.cells, dtype=bool)
+        self.version = grid.version
+        return(len(changed))
+
+    def moveTo(self, cell):
+        '''
+        Move the robot to cell. Keys already in the queue stay valid, raised by km.
+        '''
+        cell = tuple(cell)
+        if not self.grid.inBounds(cell):
+            raise ValueError(f"cell {cell} is outside the {self.grid.width} x {self.grid.height} map")
+        self.km += self.hScalar(abs(cell[0] - self.start[0]), abs(cell[1] - self.start[1]))
+        self.start = cell
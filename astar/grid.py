@@ -0,0 +1,155 @@
+## ------------------------------------------------------------------------------------------
+#                                  Occupancy Grid and Cell Sets
+## ------------------------------------------------------------------------------------------
+
+'''
+Bitmap storage for obstacles and visited cells.
+
+Cells use the same coordinates as the scripts: (x, y) with 1 <= x <= width and
+1 <= y <= height. Both classes are backed by a NumPy boolean array indexed by
+(x - 1, y - 1), so membership checks are O(1) instead of a scan over a list of [x, y] lists,
+and no list of every map cell has to be built.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import struct
+
+import numpy as np
+
+## ------------------------------------------------------------------------------------------
+#                                     Cell Set Class
+## ------------------------------------------------------------------------------------------
+
+class CellSet:
+
+    '''
+    Attributes:
+        width: number of columns (x)
+        height: number of rows (y)
+        cells: boolean array of shape (width, height), True for cells in the set
+        version: edit counter, bumped by add / discard / clear / touch
+    '''
+
+    def __init__(self, width, height, cells=None):
+        self.width = width
+        self.height = height
+        self.cells = np.zeros((width, height), dtype=bool) if cells is None else cells
+        self.version = 0
+
+    def __repr__(self):
+        return(f' {type(self).__name__}: {self.width} x {self.height}, {len(self)} cells set')
+
+    def __len__(self):
+        return(int(np.count_nonzero(self.cells)))
+
+    def inBounds(self, cell):
+        x, y = cell[0], cell[1]
+        return(1 <= x <= self.width and 1 <= y <= self.height)
+
+    def __contains__(self, cell):
+        x, y = cell[0], cell[1]
+        if 1 <= x <= self.width and 1 <= y <= self.height:
+            return(bool(self.cells[x - 1, y - 1]))
+        return(False)
+
+    def add(self, cell):
+        self.cells[cell[0] - 1, cell[1] - 1] = True
+        self.version += 1
+
+    def discard(self, cell):
+        self.cells[cell[0] - 1, cell[1] - 1] = False
+        self.version += 1
+
+    def clear(self):
+        self.cells[:] = False
+        self.version += 1
+
+    def touch(self):
+        '''
+        Mark the set as edited after writing to self.cells directly
+        '''
+        self.version += 1
+
+    def __iter__(self):  # cells in the set as [x, y] lists, like the old obsCord lists
+        for x, y in np.argwhere(self.cells):
+            yield [int(x) + 1, int(y) + 1]
+
+    def cellId(self, cell):
+        '''
+        Flat index of a cell, row-major over (x, y)
+        '''
+        return((cell[0] - 1) * self.height + (cell[1] - 1))
+
+    def cellFromId(self, cellId):
+        x, y = divmod(cellId, self.height)
+        return((x + 1, y + 1))
+
+    def fingerprint(self):
+        '''
+        Hex digest of the size and contents, equal for equal sets. Used to check that data
+        precomputed for a map (and saved to disk) still matches it.
+        '''
+        import hashlib                      # only needed for saved data, keep startup fast
+        digest = hashlib.blake2b(struct.pack("<QQ", self.width, self.height), digest_size=16)
+        digest.update(np.packbits(np.asarray(self.cells, dtype=bool), axis=None).tobytes())
+        return(digest.hexdigest())
+
+## ------------------------------------------------------------------------------------------
+#                                  Occupancy Grid Class
+## ------------------------------------------------------------------------------------------
+
+class OccupancyGrid(CellSet):
+
+    '''
+    A CellSet of obstacle cells.
+
+    Attributes:
+        width: number of columns (x)
+        height: number of rows (y)
+        cells: boolean array of shape (width, height), True for obstacle cells
+        version: edit counter, cached data derived from the grid is rebuilt when it changes
+        resolution: map units per cell
+    '''
+
+    def __init__(self, width, height, cells=None, resolution=1.0):
+        CellSet.__init__(self, width, height, cells)
+        self.resolution = resolution
+
+    @classmethod
+    def fromCells(cls, width, height, obsCord):
+        grid = cls(width, height)
+        for cell in obsCord:
+            grid.add(cell)
+        return(grid)
+
+    @property
+    def blocked(self):
+        return(self.cells)
+
+    @property
+    def mapped(self):
+        '''
+        True when the cells are memory-mapped from a grid file (see astar.gridfile)
+        '''
+        return(isinstance(self.cells, np.memmap))
+
+    def isBlocked(self, cell):
+        return(cell in self)
+
+    def isFree(self, cell):
+        '''
+        True for a cell inside the map that is not an obstacle
+        '''
+        x, y = cell[0], cell[1]
+        if 1 <= x <= self.width and 1 <= y <= self.height:
+            return(not self.cells[x - 1, y - 1])
+        return(False)
+
+    def newCellSet(self):
+        '''
+        Empty CellSet of the same size, used for the closed set of a search
+        '''
+        return(CellSet(self.width, self.height))
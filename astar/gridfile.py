@@ -0,0 +1,129 @@
+## ------------------------------------------------------------------------------------------
+#                                  Occupancy Grid File Format
+## ------------------------------------------------------------------------------------------
+
+'''
+Binary file format for occupancy grids, so large maps do not have to be rebuilt from
+Python predicates on every run.
+
+Layout (little-endian):
+
+    offset  size  field
+    0       8     magic b"ASTARGRD"
+    8       2     format version (1)
+    10      2     flags, bit 0 set --> payload is bit-packed
+    12      4     width  (uint32)
+    16      4     height (uint32)
+    20      8     resolution, map units per cell (float64)
+    28      4     reserved
+    32      ...   payload: width * height cells in (x, y) row-major order, cell id
+                  (x - 1) * height + (y - 1); one uint8 per cell (0 free, 1 obstacle), or one
+                  bit per cell (numpy.packbits, little bit order) when bit-packed
+
+loadGrid() opens uint8 files with numpy.memmap: a 50k x 50k map opens in milliseconds and
+only the pages the search touches are read from disk. Bit-packed files are an eighth of the
+size on disk (one bit per cell instead of one byte), but loadGrid() unpacks them into memory,
+so once loaded they take one byte per cell of RAM like an in-memory grid.
+
+Usage: python -m astar.gridfile OUTDIR [--packed]     export the built-in maps
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import os
+import struct
+
+import numpy as np
+
+from .grid import OccupancyGrid
+
+MAGIC = b"ASTARGRD"
+VERSION = 1
+PACKED = 0x1
+HEADER = struct.Struct("<8sHHIId4x")    # 32 bytes
+
+## ------------------------------------------------------------------------------------------
+#                                     Reading and Writing
+## ------------------------------------------------------------------------------------------
+
+def readHeader(path):
+    '''
+    (width, height, resolution, packed) stored in a grid file
+    '''
+    with open(path, "rb") as f:
+        raw = f.read(HEADER.size)
+    if len(raw) < HEADER.size:
+        raise ValueError(f"{path}: file too short for a grid header")
+    magic, version, flags, width, height, resolution = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a grid file")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported grid file version {version}")
+    return(width, height, resolution, bool(flags & PACKED))
+
+def saveGrid(grid, path, packed=False):
+    '''
+    Write an OccupancyGrid to path
+    '''
+    resolution = getattr(grid, "resolution", 1.0)
+    cells = np.ascontiguousarray(grid.cells, dtype=bool).reshape(-1)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, PACKED if packed else 0, grid.width, grid.height, resolution))
+        if packed:
+            np.packbits(cells, bitorder="little").tofile(f)
+        else:
+            cells.view(np.uint8).tofile(f)
+    return(path)
+
+def loadGrid(path, mode="r"):
+    '''
+    Open a grid file as an OccupancyGrid.
+
+    uint8 files are memory-mapped; mode is passed to numpy.memmap ("r" read-only,
+    "r+" edits go to the file, "c" copy-on-write edits stay in memory).
+    '''
+    width, height, resolution, packed = readHeader(path)
+    if packed:
+        payload = np.fromfile(path, dtype=np.uint8, offset=HEADER.size)
+        cells = np.unpackbits(payload, count=width * height, bitorder="little").view(bool)
+        cells = cells.reshape(width, height)
+    else:
+        cells = np.memmap(path, dtype=bool, mode=mode, offset=HEADER.size, shape=(width, height))
+    return(OccupancyGrid(width, height, cells, resolution=resolution))
+
+def createGrid(path, width, height, resolution=1.0):
+    '''
+    Create an all-free uint8 grid file of any size without building it in memory, and open
+    it for editing (mode "r+")
+    '''
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, width, height, resolution))
+        f.truncate(HEADER.size + width * height)   # sparse file of zeros
+    return(loadGrid(path, mode="r+"))
+
+## ------------------------------------------------------------------------------------------
+#                                       Map Exporter
+## ------------------------------------------------------------------------------------------
+
+def exportMaps(directory, packed=False):
+    '''
+    Write map 1, map 2, the maze and the empty map into directory, returns the file paths
+    '''
+    from . import maps
+
+    os.makedirs(directory, exist_ok=True)
+    return([saveGrid(build(), os.path.join(directory, name + ".grid"), packed) for name, build in maps.BUILTIN.items()])
+
+if __name__== "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export the built-in maps as grid files")
+    parser.add_argument("directory")
+    parser.add_argument("--packed", action="store_true", help="bit-pack the cells")
+    args = parser.parse_args()
+
+    for path in exportMaps(args.directory, args.packed):
+        print(path)
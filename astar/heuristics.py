@@ -0,0 +1,155 @@
+## ------------------------------------------------------------------------------------------
+#                                        Heuristics
+## ------------------------------------------------------------------------------------------
+
+'''
+Cost-to-go estimates h(n) for the A* evaluation function f(n) = g(n) + h(n).
+
+Each heuristic comes in two forms taking the absolute offsets dx, dy to the goal:
+
+    VECTOR[name](dx, dy)   NumPy version, evaluates whole arrays of cells in one call
+    SCALAR[name](dx, dy)   plain math version for a single cell
+
+"euclidean" in SCALAR and VECTOR is round(distance, 3), numerically identical to the old
+Node.manhatten() that called scipy.spatial.distance.euclidean. The rounding can overestimate
+by up to 0.0005 (round(3 sqrt 2, 3) = 4.243 > 4.24264), so that form is neither admissible
+nor consistent; it is kept for comparisons with the old output only. heuristicField() evaluates a heuristic for every cell
+of a map at once, after which each lookup during the search is a single array read.
+
+VECTOR and SCALAR assume straight steps of cost 1 and diagonal steps of cost sqrt 2. The
+searches call scalarFor(name, motion) / vectorFor(name, motion) instead, which fit the
+heuristic to the step costs of their motion model (see fitted()) and use the unrounded
+Euclidean distance:
+    euclidean, octile, chebyshev   admissible and consistent for any motion model; octile is
+                                   exact on an empty map for 4- and 8-connected models
+    manhattan                      scaled by the straight step cost only: exact on 4-connected
+                                   maps, not admissible once diagonal moves are allowed
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import math
+
+import numpy as np
+
+from .motion import EIGHT_CONNECTED
+
+SQRT2 = math.sqrt(2)
+
+ADMISSIBLE = {"euclidean", "octile", "chebyshev"}     # in their fitted forms, see above
+
+_fits = {}                              # (name, moves) --> (scale, diagonal cost)
+
+## ------------------------------------------------------------------------------------------
+#                                    Vectorized Heuristics
+## ------------------------------------------------------------------------------------------
+
+def euclidean(dx, dy):
+    return(np.round(np.hypot(dx, dy), 3))
+
+def manhattan(dx, dy):
+    return(np.add(dx, dy, dtype=np.float64))
+
+def octile(dx, dy, diagonalCost=SQRT2):
+    return(np.maximum(dx, dy) + (diagonalCost - 1) * np.minimum(dx, dy))
+
+def chebyshev(dx, dy):
+    return(np.maximum(dx, dy).astype(np.float64))
+
+VECTOR = {
+    "euclidean": euclidean,
+    "manhattan": manhattan,
+    "octile": octile,
+    "chebyshev": chebyshev,
+}
+
+## ------------------------------------------------------------------------------------------
+#                                      Scalar Heuristics
+## ------------------------------------------------------------------------------------------
+
+SCALAR = {
+    "euclidean": lambda dx, dy: round(math.hypot(dx, dy), 3),
+    "manhattan": lambda dx, dy: float(dx + dy),
+    "octile": lambda dx, dy: max(dx, dy) + (SQRT2 - 1) * min(dx, dy),
+    "chebyshev": lambda dx, dy: float(max(dx, dy)),
+}
+
+## ------------------------------------------------------------------------------------------
+#                                     Helper Functions
+## ------------------------------------------------------------------------------------------
+
+def checkName(name):
+    if name not in VECTOR:
+        raise ValueError(f"unknown heuristic {name!r}, pick one of {sorted(VECTOR)}")
+    return(name)
+
+def fitted(name, motion):
+    '''
+    (scale, diagonal cost) that fit heuristic name to the step costs of motion.
+
+    octile uses the model's own diagonal to straight cost ratio, kept between 1 and 2 so it
+    stays a norm. euclidean, octile and chebyshev are norms, and a norm scaled down to at
+    most cost / norm of every move is admissible and consistent. manhattan is scaled by the
+    cheapest straight step. The default 8-connected model gives (1.0, sqrt 2), the plain
+    VECTOR and SCALAR functions.
+    '''
+    key = (checkName(name), motion.moves)
+    fit = _fits.get(key)
+    if fit is None:
+        straight = min((cost / max(abs(dx), abs(dy)) for dx, dy, cost in motion.moves if dx == 0 or dy == 0), default=None)
+        diagonal = min((cost / abs(dx) for dx, dy, cost in motion.moves if abs(dx) == abs(dy)), default=None)
+        if straight is None or diagonal is None:
+            ratio = 1.0 if straight is None else 2.0
+        else:
+            ratio = min(max(diagonal / straight, 1.0), 2.0) if straight > 0 else 1.0
+        if name == "manhattan":
+            scale = 1.0 if straight is None else straight
+        else:
+            dx, dy, costs = (np.abs(np.array(column, dtype=np.float64)) for column in zip(*motion.moves))
+            norms = {"euclidean": np.hypot, "chebyshev": np.maximum}.get(name, lambda dx, dy: octile(dx, dy, ratio))(dx, dy)
+            scale = float(np.min(costs / norms))
+        fit = _fits[key] = (1.0 if abs(scale - 1.0) <= 1e-12 else scale, ratio)
+    return(fit)
+
+def scalarFor(name, motion=EIGHT_CONNECTED):
+    '''
+    SCALAR[name] fitted to the step costs of motion, euclidean unrounded
+    '''
+    scale, diagonal = fitted(name, motion)
+    if name == "octile" and diagonal != SQRT2:
+        return(lambda dx, dy: scale * (max(dx, dy) + (diagonal - 1) * min(dx, dy)))
+    function = math.hypot if name == "euclidean" else SCALAR[name]
+    if scale == 1.0:
+        return(function)
+    return(lambda dx, dy: scale * function(dx, dy))
+
+def vectorFor(name, motion=EIGHT_CONNECTED):
+    '''
+    VECTOR[name] fitted to the step costs of motion, euclidean unrounded
+    '''
+    scale, diagonal = fitted(name, motion)
+    if name == "octile":
+        return(lambda dx, dy: scale * octile(dx, dy, diagonal))
+    function = np.hypot if name == "euclidean" else VECTOR[name]
+    if scale == 1.0:
+        return(function)
+    return(lambda dx, dy: scale * function(dx, dy))
+
+def evaluate(xs, ys, goal, name="euclidean", motion=EIGHT_CONNECTED):
+    '''
+    Heuristic of many cells in one call, e.g. all 8 neighbours of an expanded node
+    '''
+    dx = np.abs(np.asarray(xs) - goal[0])
+    dy = np.abs(np.asarray(ys) - goal[1])
+    return(vectorFor(name, motion)(dx, dy))
+
+def heuristicField(grid, goal, name="euclidean", motion=EIGHT_CONNECTED):
+    '''
+    Heuristic of every cell of the grid toward goal, as a flat float64 array indexed by cell id
+    '''
+    xs = np.abs(np.arange(1, grid.width + 1) - goal[0])[:, None]    # column of x offsets
+    ys = np.abs(np.arange(1, grid.height + 1) - goal[1])[None, :]   # row of y offsets
+    field = vectorFor(name, motion)(xs, ys)
+    return(np.ascontiguousarray(np.broadcast_to(field, (grid.width, grid.height)), dtype=np.float64).reshape(-1))
@@ -0,0 +1,438 @@
+## ------------------------------------------------------------------------------------------
+#                              Hierarchical Path-Finding (HPA*)
+## ------------------------------------------------------------------------------------------
+
+'''
+HPA* (Botea, Mueller and Schaeffer, 2004): a precomputed abstract graph over an
+OccupancyGrid, for maps where a full A* per query is too slow.
+
+The map is split into square clusters of clusterSize cells. Wherever two neighbouring
+clusters touch, each maximal run of free cells along their border is an entrance. An
+entrance gets one transition in its middle, or one at each end if it is at least
+WIDE_ENTRANCE cells long. A diagonal move that crosses a border between two blocked
+cells is a transition of its own. The two cells of a transition are abstract nodes,
+joined by an inter-cluster edge. Nodes of the same cluster are joined by intra-cluster
+edges whose cost is the shortest distance inside the cluster.
+
+A query connects start and goal to the nodes of their clusters and runs A* on the abstract
+graph. Each abstract edge is then refined into cells with a local A* inside one cluster.
+Paths are near-optimal: they only cross clusters at transitions.
+
+    hmap = HierarchicalMap(grid, clusterSize=16)
+    path = hmap.solve(start, goal)
+    hmap.save("maze.hpa.npz")
+    hmap = HierarchicalMap.load("maze.hpa.npz", grid)   # checks grid.fingerprint()
+
+After editing the grid, update() rebuilds only the clusters around the changed cells, and
+solve() does so automatically when grid.version has changed.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import math
+from collections import Counter
+
+import numpy as np
+
+from . import heuristics
+from .grid import OccupancyGrid
+from .motion import EIGHT_CONNECTED
+from .openlist import OpenList
+from .solver import Path, solve
+
+WIDE_ENTRANCE = 6       # entrances at least this long get a transition at each end
+
+FILE_VERSION = 1
+
+## ------------------------------------------------------------------------------------------
+#                                 Hierarchical Map Class
+## ------------------------------------------------------------------------------------------
+
+class HierarchicalMap:
+
+    '''
+    Attributes:
+        grid: OccupancyGrid the abstraction was built for
+        clusterSize: side of a cluster in cells
+        motion: symmetric MotionModel with moves of one cell
+        clustersX, clustersY: number of clusters along x and y
+        borders: (i, j, axis) --> [(cell id, cell id, cost)] transitions of the border
+            between cluster (i, j) and its neighbour along x (axis 0) or y (axis 1)
+        intra: cluster --> [(cell id, cell id, cost)] intra-cluster edges
+        refs: cell id --> number of transitions using that node
+        nodes: cluster --> set of its node cell ids
+        version: grid version the abstraction matches
+    '''
+
+    def __init__(self, grid, clusterSize=16, motion=EIGHT_CONNECTED, build=True):
+        costs = {(dx, dy): cost for dx, dy, cost in motion.moves}
+        if motion.reach != 1 or any(costs.get((-dx, -dy)) != cost for (dx, dy), cost in costs.items()):
+            raise ValueError("HPA* needs a symmetric motion model with moves of one cell")
+        if (1, 0) not in costs or (0, 1) not in costs:
+            raise ValueError("HPA* needs the four straight moves")
+        self.grid = grid
+        self.clusterSize = clusterSize
+        self.motion = motion
+        self.costs = costs
+        self.clustersX = math.ceil(grid.width / clusterSize)
+        self.clustersY = math.ceil(grid.height / clusterSize)
+        self.borders = {}
+        self.intra = {}
+        self.refs = Counter()
+        self.nodes = {}
+        self.version = grid.version
+        self.snapshot = np.array(grid.cells, dtype=bool)
+        self._adjacency = None
+        if build:
+            self.build()
+
+    def __repr__(self):
+        return(f' HierarchicalMap: {self.clustersX} x {self.clustersY} clusters of {self.clusterSize}, '
+               f'{len(self.refs)} nodes, {self.edgeCount} edges')
+
+    @property
+    def edgeCount(self):
+        return(sum(len(t) for t in self.borders.values()) + sum(len(e) for e in self.intra.values()))
+
+    ## --------------------------------------------------------------------------------------
+    #                                  Cluster Geometry
+    ## --------------------------------------------------------------------------------------
+
+    def clusters(self):
+        return([(i, j) for i in range(self.clustersX) for j in range(self.clustersY)])
+
+    def clusterOf(self, cellId):
+        x, y = divmod(cellId, self.grid.height)
+        return((x // self.clusterSize, y // self.clusterSize))
+
+    def box(self, cluster):
+        '''
+        0-based half-open (x0, x1, y0, y1) cell range of a cluster
+        '''
+        i, j = cluster
+        s = self.clusterSize
+        return(i * s, min((i + 1) * s, self.grid.width), j * s, min((j + 1) * s, self.grid.height))
+
+    def subgrid(self, cluster):
+        '''
+        OccupancyGrid of one cluster and its (x0, y0) offset
+        '''
+        x0, x1, y0, y1 = self.box(cluster)
+        cells = np.array(self.grid.cells[x0:x1, y0:y1], dtype=bool)
+        return(OccupancyGrid(x1 - x0, y1 - y0, cells), x0, y0)
+
+    def nodesIn(self, cluster):
+        return(sorted(self.nodes.get(cluster, ())))
+
+    ## --------------------------------------------------------------------------------------
+    #                                   Building
+    ## --------------------------------------------------------------------------------------
+
+    def build(self):
+        '''
+        Build the whole abstraction: every border, then every cluster
+        '''
+        self.borders, self.intra, self.refs, self.nodes = {}, {}, Counter(), {}
+        for i, j in self.clusters():
+            for axis in (0, 1):
+                self._setBorder((i, j, axis))
+        for cluster in self.clusters():
+            self._buildCluster(cluster)
+        self._adjacency = None
+
+    def _scanBorder(self, key):
+        '''
+        Transitions across the border between cluster (i, j) and its neighbour along axis
+        '''
+        i, j, axis = key
+        s = self.clusterSize
+        height = self.grid.height
+        cells = self.grid.cells
+        if axis == 0:           # work in (u, v): u crosses the border, v runs along it
+            size, line, lo, hi = self.grid.width, (i + 1) * s, j * s, min((j + 1) * s, self.grid.height)
+            toId = lambda u, v: u * height + v
+        else:
+            size, line, lo, hi = self.grid.height, (j + 1) * s, i * s, min((i + 1) * s, self.grid.width)
+            toId = lambda u, v: v * height + u
+        if line >= size:        # last cluster along this axis, no neighbour
+            return([])
+        # free cells on both sides of the border, one cell past each end for diagonal moves
+        first = max(lo - 1, 0)
+        if axis == 0:
+            near, far = ~np.asarray(cells[line - 1:line + 1, first:hi + 1], dtype=bool)
+        else:
+            near, far = ~np.asarray(cells[first:hi + 1, line - 1:line + 1], dtype=bool).T
+        near = np.concatenate((np.zeros(first, dtype=bool), near))   # index by v again
+        far = np.concatenate((np.zeros(first, dtype=bool), far))
+        straight = self.costs[(1, 0) if axis == 0 else (0, 1)]
+        transitions = []
+
+        both = near[lo:hi] & far[lo:hi]
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], both.astype(np.int8), [0]))))
+        for start, stop in zip(edges[::2], edges[1::2]):    # runs [start, stop) of open border
+            picks = [(start + stop - 1) // 2] if stop - start < WIDE_ENTRANCE else [start, stop - 1]
+            for v in picks:
+                transitions.append((toId(line - 1, lo + v), toId(line, lo + v), straight))
+
+        for dv in (-1, 1):      # diagonal moves squeezing between two blocked cells
+            diagonal = self.costs.get((1, dv) if axis == 0 else (dv, 1))
+            if diagonal is None:
+                continue
+            for v in range(lo, hi):
+                w = v + dv
+                if not 0 <= w < len(near) or (axis == 1 and not lo <= w < hi):
+                    continue    # crossings that also change cluster column belong to axis 0
+                if near[v] and far[w] and not far[v] and not near[w]:
+                    transitions.append((toId(line - 1, v), toId(line, w), diagonal))
+        return(transitions)
+
+    def _setBorder(self, key):
+        '''
+        Rescan a border, returns the clusters whose nodes changed
+        '''
+        old = self.borders.get(key, [])
+        new = self._scanBorder(key)
+        for a, b, _ in old:
+            self._ref(a, -1)
+            self._ref(b, -1)
+        for a, b, _ in new:
+            self._ref(a, 1)
+            self._ref(b, 1)
+        if new:
+            self.borders[key] = new
+        else:
+            self.borders.pop(key, None)
+        oldNodes = {n for a, b, _ in old for n in (a, b)}
+        newNodes = {n for a, b, _ in new for n in (a, b)}
+        return({self.clusterOf(n) for n in oldNodes ^ newNodes})
+
+    def _ref(self, node, delta):
+        count = self.refs[node] + delta
+        cluster = self.clusterOf(node)
+        if count > 0:
+            self.refs[node] = count
+            self.nodes.setdefault(cluster, set()).add(node)
+        else:                   # no transition uses the node any more
+            del self.refs[node]
+            self.nodes[cluster].discard(node)
+
+    def _buildCluster(self, cluster):
+        nodes = self.nodesIn(cluster)
+        edges = []
+        if len(nodes) > 1:
+            dist = self.localDistances(cluster, nodes, nodes)
+            for k, a in enumerate(nodes):
+                for l in range(k + 1, len(nodes)):
+                    if np.isfinite(dist[k, l]):
+                        edges.append((a, nodes[l], float(dist[k, l])))
+        if edges:
+            self.intra[cluster] = edges
+        else:
+            self.intra.pop(cluster, None)
+
+    def localDistances(self, cluster, sources, targets):
+        '''
+        Matrix of shortest distances inside a cluster from each source to each target cell id
+        '''
+        sub, x0, y0 = self.subgrid(cluster)
+        height = self.grid.height
+        local = lambda n: (n // height - x0) * sub.height + (n % height - y0)
+        sourceIds, targetIds = [local(n) for n in sources], [local(n) for n in targets]
+        try:
+            from scipy.sparse import csr_matrix
+            from scipy.sparse.csgraph import dijkstra
+        except ImportError:
+            from .distfield import distanceField
+            # moves are symmetric, so a field toward one cell also gives distances from it:
+            # run one per source or one per target, whichever is fewer
+            if len(sourceIds) <= len(targetIds):
+                return(np.array([distanceField(sub, sub.cellFromId(s), self.motion)[targetIds]
+                                 for s in sourceIds]).reshape(len(sourceIds), len(targetIds)))
+            return(np.array([distanceField(sub, sub.cellFromId(t), self.motion)[sourceIds]
+                             for t in targetIds]).reshape(len(targetIds), len(sourceIds)).T)
+        size = sub.width * sub.height
+        free = np.flatnonzero(~sub.cells.reshape(-1))
+        parents, children, costs = self.motion.expand(free, sub)
+        graph = csr_matrix((costs, (parents, children)), shape=(size, size))
+        return(dijkstra(graph, directed=True, indices=sourceIds)[:, targetIds])
+
+    ## --------------------------------------------------------------------------------------
+    #                                  Incremental Update
+    ## --------------------------------------------------------------------------------------
+
+    def update(self, cells=None):
+        '''
+        Rebuild the clusters affected by edited cells. cells lists the (x, y) cells that
+        changed; by default they are found by comparing the grid against the copy taken at
+        the last build. Returns the set of rebuilt clusters.
+        '''
+        if cells is None:
+            changed = np.argwhere(self.snapshot != np.asarray(self.grid.cells, dtype=bool))
+            dirty = {(int(x) // self.clusterSize, int(y) // self.clusterSize) for x, y in changed}
+        else:
+            dirty = {((x - 1) // self.clusterSize, (y - 1) // self.clusterSize) for x, y in cells}
+        # a border reads the cells of the clusters around it, rescan every border next to
+        # a dirty cluster or one of its 8 neighbours
+        near = {(i + di, j + dj) for i, j in dirty for di in (-1, 0, 1) for dj in (-1, 0, 1)}
+        rebuild = set(dirty)
+        for i, j in near:
+            for key in ((i, j, 0), (i, j, 1), (i - 1, j, 0), (i, j - 1, 1)):
+                if 0 <= key[0] < self.clustersX and 0 <= key[1] < self.clustersY:
+                    rebuild |= self._setBorder(key)
+        for cluster in rebuild:
+            if 0 <= cluster[0] < self.clustersX and 0 <= cluster[1] < self.clustersY:
+                self._buildCluster(cluster)
+        self.snapshot = np.array(self.grid.cells, dtype=bool)
+        self.version = self.grid.version
+        self._adjacency = None
+        return(rebuild)
+
+    ## --------------------------------------------------------------------------------------
+    #                                       Queries
+    ## --------------------------------------------------------------------------------------
+
+    @property
+    def adjacency(self):
+        '''
+        node --> [(node, cost)] over all inter- and intra-cluster edges
+        '''
+        if self._adjacency is None:
+            adjacency = {n: [] for n in self.refs}
+            for edges in list(self.borders.values()) + list(self.intra.values()):
+                for a, b, cost in edges:
+                    adjacency[a].append((b, cost))
+                    adjacency[b].append((a, cost))
+            self._adjacency = adjacency
+        return(self._adjacency)
+
+    def solve(self, start, goal, heuristic="euclidean"):
+        '''
+        Near-optimal path from start to goal; path.expanded counts abstract nodes
+        '''
+        grid = self.grid
+        start, goal = tuple(start), tuple(goal)
+        if not grid.inBounds(start):
+            raise ValueError(f"start {start} is outside the {grid.width} x {grid.height} map")
+        if not grid.inBounds(goal):
+            raise ValueError(f"goal {goal} is outside the {grid.width} x {grid.height} map")
+        if grid.version != self.version:
+            self.update()
+        if start == goal:
+            return(Path([start], 0.0, 0))
+        if not grid.isFree(start) or not grid.isFree(goal):
+            return(Path([], float('inf'), 0))
+
+        startId, goalId = grid.cellId(start), grid.cellId(goal)
+        startCluster, goalCluster = self.clusterOf(startId), self.clusterOf(goalId)
+        adjacency = self.adjacency
+        START, GOAL = -1, -2
+        # temporary edges from start and into goal
+        nodes = self.nodesIn(startCluster)
+        extra = {START: [(n, float(d)) for n, d in zip(nodes, self.localDistances(startCluster, [startId], nodes)[0]) if np.isfinite(d)]}
+        nodes = self.nodesIn(goalCluster)
+        toGoal = {n: float(d) for n, d in zip(nodes, self.localDistances(goalCluster, [goalId], nodes)[0]) if np.isfinite(d)}
+        if startCluster == goalCluster:
+            direct = float(self.localDistances(startCluster, [startId], [goalId])[0, 0])
+            if np.isfinite(direct):
+                extra[START].append((GOAL, direct))
+
+        hScalar = heuristics.scalarFor(heuristic, self.motion)
+        height = grid.height
+        gx, gy = goal
+        cellOf = lambda n: start if n == START else goal if n == GOAL else (n // height + 1, n % height + 1)
+        c2c, parent, closed = {START: 0.0}, {START: None}, set()
+        queue = OpenList()
+        queue.push(START, hScalar(abs(start[0] - gx), abs(start[1] - gy)))
+        expanded = 0
+        while queue:
+            current, _, _ = queue.pop()
+            closed.add(current)
+            expanded += 1
+            if current == GOAL:
+                break
+            neighbours = extra[START] if current == START else adjacency.get(current, [])
+            if current in toGoal:
+                neighbours = neighbours + [(GOAL, toGoal[current])]
+            for child, cost in neighbours:
+                if child in closed:
+                    continue
+                newCost = c2c[current] + cost
+                if child not in c2c or newCost < c2c[child]:
+                    c2c[child] = newCost
+                    parent[child] = current
+                    x, y = cellOf(child)
+                    queue.push(child, newCost + hScalar(abs(x - gx), abs(y - gy)))
+        if GOAL not in closed:
+            return(Path([], float('inf'), expanded))
+
+        abstract = []
+        current = GOAL
+        while current is not None:
+            abstract.append(cellOf(current))
+            current = parent[current]
+        abstract.reverse()
+        cells, cost = self.refine(abstract)
+        return(Path(cells, cost, expanded))
+
+    def refine(self, abstract):
+        '''
+        Cells and cost of a path through the abstract cells, one local A* per cluster step
+        '''
+        grid = self.grid
+        cells, cost = [abstract[0]], 0.0
+        for a, b in zip(abstract, abstract[1:]):
+            cluster = self.clusterOf(grid.cellId(a))
+            if cluster != self.clusterOf(grid.cellId(b)):      # transition, one move
+                cells.append(b)
+                cost += self.costs[(b[0] - a[0], b[1] - a[1])]
+                continue
+            sub, x0, y0 = self.subgrid(cluster)
+            local = solve((a[0] - x0, a[1] - y0), (b[0] - x0, b[1] - y0), sub, motion=self.motion, heuristic="chebyshev")
+            cells.extend((x + x0, y + y0) for x, y in local.cells[1:])
+            cost += local.cost
+        return(cells, cost)
+
+    ## --------------------------------------------------------------------------------------
+    #                                    Serialization
+    ## --------------------------------------------------------------------------------------
+
+    def save(self, path):
+        '''
+        Write the abstraction to a NumPy .npz file
+        '''
+        borders = [(i, j, axis, a, b) for (i, j, axis), edges in self.borders.items() for a, b, _ in edges]
+        borderCosts = [cost for edges in self.borders.values() for _, _, cost in edges]
+        intra = [(i, j, a, b) for (i, j), edges in self.intra.items() for a, b, _ in edges]
+        intraCosts = [cost for edges in self.intra.values() for _, _, cost in edges]
+        np.savez_compressed(
+            path,
+            header=np.array([FILE_VERSION, self.grid.width, self.grid.height, self.clusterSize], dtype=np.int64),
+            fingerprint=np.array(self.grid.fingerprint()),
+            moves=np.array(self.motion.moves, dtype=np.float64),
+            borders=np.array(borders, dtype=np.int64).reshape(-1, 5),
+            borderCosts=np.array(borderCosts, dtype=np.float64),
+            intra=np.array(intra, dtype=np.int64).reshape(-1, 4),
+            intraCosts=np.array(intraCosts, dtype=np.float64))
+
+    @classmethod
+    def load(cls, path, grid):
+        '''
+        Read an abstraction saved by save(); grid must be the map it was built for
+        '''
+        from .motion import MotionModel
+        with np.load(path, allow_pickle=False) as data:
+            fileVersion, width, height, clusterSize = (int(v) for v in data["header"])
+            if fileVersion != FILE_VERSION:
+                raise ValueError(f"{path}: unsupported HPA* file version {fileVersion}")
+            if (width, height) != (grid.width, grid.height) or str(data["fingerprint"]) != grid.fingerprint():
+                raise ValueError(f"{path} was built for a different map")
+            hmap = cls(grid, clusterSize, MotionModel(data["moves"].tolist()), build=False)
+            for (i, j, axis, a, b), cost in zip(data["borders"].tolist(), data["borderCosts"].tolist()):
+                hmap.borders.setdefault((i, j, axis), []).append((a, b, cost))
+                hmap._ref(a, 1)
+                hmap._ref(b, 1)
+            for (i, j, a, b), cost in zip(data["intra"].tolist(), data["intraCosts"].tolist()):
+                hmap.intra.setdefault((i, j), []).append((a, b, cost))
+        return(hmap)
@@ -0,0 +1,231 @@
+## ------------------------------------------------------------------------------------------
+#                                    Jump Point Search
+## ------------------------------------------------------------------------------------------
+
+'''
+Jump Point Search (Harabor and Grastien, 2011) for 8-connected grids with straight steps of
+cost 1 and one diagonal cost between 1 and 2. The heuristic is fitted to that diagonal cost
+(heuristics.scalarFor), so it stays consistent and closed jump points never need reopening.
+
+On an open grid, A* expands every cell of every equally cheap path. JPS instead moves in
+straight lines and only stops at jump points. A jump point is the goal, or a cell with a
+"forced" neighbour that can only be reached optimally through that cell, i.e. a cell next to
+an obstacle corner. Scanning cells does not touch the open list, so far fewer nodes are
+expanded and the search allocates almost nothing.
+
+The pruning rules follow the motion model of solve(): a diagonal move is allowed whenever
+the target cell is free, even between two blocked cells. So solveJPS() returns a path with the
+same cost as solve() with an admissible heuristic.
+
+The scan works on a padded copy of the map as a bytes object. It has one blocked border cell
+on every side, so the jump loops need no bounds checks. The copy is cached per grid and
+rebuilt when the grid version changes.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import weakref
+
+import numpy as np
+
+from . import heuristics
+from .motion import EIGHT_CONNECTED
+from .openlist import OpenList
+from .solver import Path
+
+DIRECTIONS = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+
+_wallCache = weakref.WeakKeyDictionary()   # grid --> (grid version, padded walls)
+
+## ------------------------------------------------------------------------------------------
+#                                     Helper Functions
+## ------------------------------------------------------------------------------------------
+
+def wallsFor(grid):
+    '''
+    Cached bytes of the map padded by one blocked cell on every side, 1 for blocked.
+    Cell (x, y) is at index x * (height + 2) + y.
+    '''
+    cached = _wallCache.get(grid)
+    if cached is None or cached[0] != grid.version:
+        padded = np.ones((grid.width + 2, grid.height + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = np.asarray(grid.cells, dtype=bool)
+        cached = (grid.version, padded.tobytes())
+        _wallCache[grid] = cached
+    return(cached[1])
+
+def diagonalCostOf(motion):
+    '''
+    Diagonal step cost of an 8-connected motion model with straight steps of cost 1. The
+    pruning rules assume a diagonal step costs no less than a straight one and no more than
+    two, otherwise they cut off optimal zig-zag or two-step paths.
+    '''
+    costs = {(dx, dy): cost for dx, dy, cost in motion.moves}
+    if len(motion.moves) != 8 or set(costs) != set(DIRECTIONS):
+        raise ValueError(f"jump point search needs an 8-connected motion model, got {motion.name}")
+    straight = {costs[d] for d in DIRECTIONS if 0 in d}
+    diagonal = {costs[d] for d in DIRECTIONS if 0 not in d}
+    if straight != {1.0} or len(diagonal) != 1:
+        raise ValueError("jump point search needs straight steps of cost 1 and one diagonal cost")
+    diagonalCost = diagonal.pop()
+    if not 1 <= diagonalCost <= 2:
+        raise ValueError(f"jump point search needs a diagonal cost between 1 and 2, got {diagonalCost}")
+    return(diagonalCost)
+
+def _jumpStraight(p, step, side, walls, goalP):
+    '''
+    Scan from p along step until a jump point (returned) or a wall (-1). side is the flat
+    offset perpendicular to the scan.
+    '''
+    while True:
+        p += step
+        if walls[p]:
+            return(-1)
+        if p == goalP:
+            return(p)
+        if (walls[p + side] and not walls[p + side + step]) or (walls[p - side] and not walls[p - side + step]):
+            return(p)
+
+def _jump(p, dx, dy, walls, hp, goalP):
+    '''
+    Next jump point from p in direction (dx, dy), -1 if there is none
+    '''
+    if dx == 0:
+        return(_jumpStraight(p, dy, hp, walls, goalP))
+    if dy == 0:
+        return(_jumpStraight(p, dx * hp, 1, walls, goalP))
+    stepX = dx * hp
+    step = stepX + dy
+    while True:
+        p += step
+        if walls[p]:
+            return(-1)
+        if p == goalP:
+            return(p)
+        if (walls[p - stepX] and not walls[p - stepX + dy]) or (walls[p - dy] and not walls[p + stepX - dy]):
+            return(p)
+        # a diagonal cell is a jump point if a straight scan from it finds one
+        if _jumpStraight(p, stepX, 1, walls, goalP) != -1 or _jumpStraight(p, dy, hp, walls, goalP) != -1:
+            return(p)
+
+def _directions(p, dx, dy, walls, hp):
+    '''
+    Directions worth scanning from p when it was reached moving in direction (dx, dy):
+    the natural neighbours plus any forced ones
+    '''
+    if dx == 0 and dy == 0:       # start node, scan everywhere
+        return(DIRECTIONS)
+    stepX = dx * hp
+    if dx and dy:
+        found = [(0, dy), (dx, 0), (dx, dy)]
+        if walls[p - stepX] and not walls[p - stepX + dy]:
+            found.append((-dx, dy))
+        if walls[p - dy] and not walls[p + stepX - dy]:
+            found.append((dx, -dy))
+    elif dx:
+        found = [(dx, 0)]
+        if walls[p + 1] and not walls[p + stepX + 1]:
+            found.append((dx, 1))
+        if walls[p - 1] and not walls[p + stepX - 1]:
+            found.append((dx, -1))
+    else:
+        found = [(0, dy)]
+        if walls[p + hp] and not walls[p + hp + dy]:
+            found.append((1, dy))
+        if walls[p - hp] and not walls[p - hp + dy]:
+            found.append((-1, dy))
+    return(found)
+
+def _sign(v):
+    return((v > 0) - (v < 0))
+
+## ------------------------------------------------------------------------------------------
+#                                         Solver
+## ------------------------------------------------------------------------------------------
+
+def solveJPS(start, goal, grid, observer=None, motion=EIGHT_CONNECTED, heuristic="octile"):
+    '''
+    Same contract as solve(), searching only jump points. motion must be 8-connected with
+    straight steps of cost 1 and one diagonal cost between 1 and 2.
+
+    path.cells lists every cell of the path, path.expanded counts expanded jump points.
+    '''
+    start, goal = tuple(start), tuple(goal)
+    if not grid.inBounds(start):
+        raise ValueError(f"start {start} is outside the {grid.width} x {grid.height} map")
+    if not grid.inBounds(goal):
+        raise ValueError(f"goal {goal} is outside the {grid.width} x {grid.height} map")
+    diagonalCost = diagonalCostOf(motion)
+    hScalar = heuristics.scalarFor(heuristic, motion)
+    if observer is not None:
+        observer.onStart(start, goal, grid)
+
+    walls = wallsFor(grid)
+    hp = grid.height + 2
+    gx, gy = goal
+    startP, goalP = start[0] * hp + start[1], gx * hp + gy
+    c2c = {startP: 0.0}
+    parent = {startP: -1}
+    closed = set()
+    queue = OpenList()
+    queue.push(startP, hScalar(abs(start[0] - gx), abs(start[1] - gy)))
+    expanded = 0
+    path = Path([], float('inf'), 0)
+
+    while queue:
+        current, _, _ = queue.pop()
+        closed.add(current)
+        expanded += 1
+        x, y = divmod(current, hp)
+        if observer is not None:
+            observer.onExpand((x, y))
+
+        # Case 1 --> Goal Reached
+        if current == goalP:
+            path = Path(_cells(parent, goalP, hp), c2c[goalP], expanded)
+            break
+
+        # Case 2: scan from the current jump point in the unpruned directions
+        before = parent[current]
+        if before == -1:
+            dx = dy = 0
+        else:
+            px, py = divmod(before, hp)
+            dx, dy = _sign(x - px), _sign(y - py)
+        currentCost = c2c[current]
+        for dx, dy in _directions(current, dx, dy, walls, hp):
+            child = _jump(current, dx, dy, walls, hp, goalP)
+            if child == -1 or child in closed:
+                continue
+            cx, cy = divmod(child, hp)
+            steps = max(abs(cx - x), abs(cy - y))
+            newCost = currentCost + steps * (diagonalCost if dx and dy else 1.0)
+            if child not in c2c or newCost < c2c[child]:
+                c2c[child] = newCost
+                parent[child] = current
+                queue.push(child, newCost + hScalar(abs(cx - gx), abs(cy - gy)))
+    else:
+        path.expanded = expanded
+
+    if observer is not None:
+        observer.onFinish(path)
+    return(path)
+
+def _cells(parent, goalP, hp):
+    '''
+    Every cell from start to goal, filling in the straight runs between jump points
+    '''
+    points = []
+    current = goalP
+    while current != -1:
+        points.append(divmod(current, hp))
+        current = parent[current]
+    points.reverse()
+    cells = [points[0]]
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        dx, dy = _sign(x2 - x1), _sign(y2 - y1)
+        for k in range(1, max(abs(x2 - x1), abs(y2 - y1)) + 1):
+            cells.append((x1 + k * dx, y1 + k * dy))
+    return(cells)
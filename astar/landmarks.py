@@ -0,0 +1,221 @@
+## ------------------------------------------------------------------------------------------
+#                               Landmark (ALT) Heuristics
+## ------------------------------------------------------------------------------------------
+
+'''
+A*, Landmarks and the Triangle inequality (Goldberg and Harrelson, 2005).
+
+Straight-line distance ignores walls, so in a maze it is far below the true cost and A*
+expands most of the map. ALT picks K landmark cells and precomputes the exact distance d(L, n)
+from every landmark to every cell. With symmetric moves, the triangle inequality gives, for
+any cell n and goal t,
+
+    cost(n, t) >= | d(L, t) - d(L, n) |
+
+and the ALT heuristic is the largest such bound over all landmarks, combined with the
+geometric heuristic. It stays admissible and consistent, and it knows about the walls.
+
+Landmarks are chosen by farthest-point sampling: each new landmark is the cell farthest
+from the ones already picked. Distances are stored compactly as one row per landmark:
+
+    float32   4 bytes per cell per landmark
+    uint16    2 bytes per cell per landmark, in units of 1 / scale (65535 = unreachable)
+
+Rounding is accounted for by lowering every bound by the largest storage error, so the
+heuristic never overestimates. field(goal) evaluates the heuristic of every cell at once,
+and the result plugs straight into solve(..., field=...).
+
+Tables are saved next to the map: forGridFile("maze.grid") loads "maze.grid.alt.npz" if it
+matches the map, and builds and saves it otherwise.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import os
+
+import numpy as np
+
+from . import heuristics
+from .distfield import distanceField
+from .motion import EIGHT_CONNECTED, MotionModel
+
+UNREACHABLE = np.iinfo(np.uint16).max
+
+FILE_VERSION = 1
+
+## ------------------------------------------------------------------------------------------
+#                                    Landmarks Class
+## ------------------------------------------------------------------------------------------
+
+class Landmarks:
+
+    '''
+    Attributes:
+        grid: OccupancyGrid the table was built for
+        cells: (x, y) landmark cells
+        table: (K, width * height) float32 or uint16 distances from each landmark
+        scale: uint16 units per unit of cost, None for float32 tables
+        slack: largest storage error of a bound, subtracted from every bound
+        motion: symmetric MotionModel the distances were computed with
+    '''
+
+    def __init__(self, grid, cells, table, scale=None, motion=EIGHT_CONNECTED):
+        self.grid = grid
+        self.cells = [tuple(cell) for cell in cells]
+        self.table = table
+        self.scale = scale
+        self.motion = motion
+        if table.dtype == np.uint16:
+            self.slack = 1.0 / scale
+        else:
+            finite = table[np.isfinite(table)]
+            self.slack = 2.0 * float(finite.max(initial=0.0)) * np.finfo(np.float32).eps
+
+    def __repr__(self):
+        return(f' Landmarks: {len(self.cells)} landmarks, {self.table.dtype} table, {self.table.nbytes} bytes')
+
+    def __len__(self):
+        return(len(self.cells))
+
+    @classmethod
+    def build(cls, grid, count=8, motion=EIGHT_CONNECTED, dtype="float32", seed=None):
+        '''
+        Choose count landmarks by farthest-point sampling from seed (default: the first free
+        cell) and compute their distance table
+        '''
+        if dtype not in ("float32", "uint16"):
+            raise ValueError(f"dtype must be float32 or uint16, got {dtype!r}")
+        costs = {(dx, dy): cost for dx, dy, cost in motion.moves}
+        if any(costs.get((-dx, -dy)) != cost for (dx, dy), cost in costs.items()):
+            raise ValueError("landmark bounds need a symmetric motion model")
+        free = np.flatnonzero(~np.asarray(grid.cells, dtype=bool).reshape(-1))
+        if free.size == 0:
+            raise ValueError("the map has no free cell")
+        seed = grid.cellFromId(int(free[0])) if seed is None else tuple(seed)
+
+        fields, cells = [], []
+        nearest = distanceField(grid, seed, motion)     # distance to the closest pick so far
+        for _ in range(min(count, free.size)):
+            reachable = np.where(np.isfinite(nearest), nearest, -1.0)
+            pick = int(np.argmax(reachable))
+            if reachable[pick] <= 0:
+                break                       # every reachable cell is already a landmark
+            cell = grid.cellFromId(pick)
+            field = distanceField(grid, cell, motion)
+            cells.append(cell)
+            fields.append(field)
+            nearest = np.minimum(nearest, field) if len(fields) > 1 else field
+        distances = np.array(fields, dtype=np.float64).reshape(len(fields), grid.width * grid.height)
+        return(cls(grid, cells, *encode(distances, dtype), motion=motion))
+
+    ## --------------------------------------------------------------------------------------
+    #                                     Heuristic
+    ## --------------------------------------------------------------------------------------
+
+    def distances(self, rows=slice(None), columns=slice(None)):
+        '''
+        Decoded float64 distances, inf where unreachable
+        '''
+        table = self.table[rows, columns]
+        if self.table.dtype == np.uint16:
+            return(np.where(table == UNREACHABLE, np.inf, table / self.scale))
+        return(table.astype(np.float64))
+
+    def field(self, goal, heuristic="octile"):
+        '''
+        ALT heuristic of every cell toward goal, combined with a geometric heuristic, as a
+        flat float64 array for solve(..., field=...). Cells that cannot reach the goal get inf.
+        '''
+        goalId = self.grid.cellId(goal)
+        toGoal = self.distances(columns=goalId)[:, None]            # d(L, goal)
+        fromCell = self.distances()                                 # d(L, n)
+        known = np.isfinite(toGoal) | np.isfinite(fromCell)
+        with np.errstate(invalid="ignore"):
+            bound = np.where(known, np.abs(toGoal - fromCell), 0.0)
+        bound = np.nan_to_num(bound, nan=0.0, posinf=np.inf)        # one side unreachable --> inf
+        alt = np.maximum(bound.max(axis=0, initial=0.0) - self.slack, 0.0)
+        return(np.maximum(alt, heuristics.heuristicField(self.grid, goal, heuristic, self.motion)))
+
+    def bound(self, cell, goal):
+        '''
+        ALT lower bound on the cost from cell to goal, for code outside the search
+        '''
+        ids = [self.grid.cellId(cell), self.grid.cellId(goal)]
+        a, b = self.distances(columns=ids).T
+        known = np.isfinite(a) | np.isfinite(b)
+        if not known.any():
+            return(0.0)
+        with np.errstate(invalid="ignore"):
+            diff = np.nan_to_num(np.abs(a[known] - b[known]), nan=0.0, posinf=np.inf)
+        return(max(float(diff.max()) - self.slack, 0.0))
+
+    ## --------------------------------------------------------------------------------------
+    #                                    Serialization
+    ## --------------------------------------------------------------------------------------
+
+    def save(self, path):
+        np.savez(path,
+                 header=np.array([FILE_VERSION, self.grid.width, self.grid.height], dtype=np.int64),
+                 fingerprint=np.array(self.grid.fingerprint()),
+                 moves=np.array(self.motion.moves, dtype=np.float64),
+                 cells=np.array(self.cells, dtype=np.int64).reshape(-1, 2),
+                 scale=np.array(np.nan if self.scale is None else self.scale),
+                 table=self.table)
+
+    @classmethod
+    def load(cls, path, grid):
+        '''
+        Read a table saved by save(); grid must be the map it was built for
+        '''
+        with np.load(path, allow_pickle=False) as data:
+            fileVersion, width, height = (int(v) for v in data["header"])
+            if fileVersion != FILE_VERSION:
+                raise ValueError(f"{path}: unsupported landmark file version {fileVersion}")
+            if (width, height) != (grid.width, grid.height) or str(data["fingerprint"]) != grid.fingerprint():
+                raise ValueError(f"{path} was built for a different map")
+            scale = float(data["scale"])
+            return(cls(grid, data["cells"].tolist(), data["table"], None if np.isnan(scale) else scale,
+                       MotionModel(data["moves"].tolist())))
+
+## ------------------------------------------------------------------------------------------
+#                                     Helper Functions
+## ------------------------------------------------------------------------------------------
+
+def encode(distances, dtype):
+    '''
+    (table, scale) storing float64 distances as float32, or as uint16 rounded down
+    '''
+    if dtype == "float32":
+        return(distances.astype(np.float32), None)
+    finite = distances[np.isfinite(distances)]
+    scale = (UNREACHABLE - 1) / max(float(finite.max(initial=0.0)), 1.0)
+    table = np.full(distances.shape, UNREACHABLE, dtype=np.uint16)
+    reachable = np.isfinite(distances)
+    table[reachable] = np.floor(distances[reachable] * scale).astype(np.uint16)
+    return(table, scale)
+
+def sidecarPath(gridPath):
+    return(gridPath + ".alt.npz")
+
+def forGridFile(gridPath, grid, count=8, motion=EIGHT_CONNECTED, dtype="float32"):
+    '''
+    Landmarks saved next to a grid file, built and saved first if missing, stale or built
+    with other parameters. build() places count landmarks, or one on every cell of the
+    first landmark's component if that is smaller, so a saved table is reused only if it
+    has exactly that many.
+    '''
+    path = sidecarPath(gridPath)
+    if os.path.exists(path):
+        try:
+            landmarks = Landmarks.load(path, grid)
+            placeable = int(np.isfinite(landmarks.distances(rows=0)).sum()) if len(landmarks) else count
+            if (landmarks.motion == motion and landmarks.table.dtype == np.dtype(dtype)
+                    and len(landmarks) == min(count, placeable)):
+                return(landmarks)
+        except ValueError:
+            pass                            # built for an older version of the map
+    landmarks = Landmarks.build(grid, count, motion, dtype)
+    landmarks.save(path)
+    return(landmarks)
@@ -0,0 +1,168 @@
+## ------------------------------------------------------------------------------------------
+#                                      Map Definitions
+## ------------------------------------------------------------------------------------------
+
+'''
+The maps of the three scripts, described with shape primitives:
+
+    emptyMap()           10 x 10 map, no obstacles                 (AStar_emptyMap.py)
+    obstacleMap(1)       10 x 10 map, three circles                (AStar_obstacleMap.py)
+    obstacleMap(2)       10 x 10 map, three walls                  (AStar_obstacleMap.py)
+    maze()               16 x 8 maze                               (Astar_Maze.py)
+    randomMap(w, h)      w x h map, each cell blocked with probability density
+    randomMaze(w, h)     w x h perfect maze (one route between any two cells)
+    randomQueries(g, n)  n random (start, goal) pairs of free cells of grid g
+
+Each builder rasterizes its shapes into a fresh OccupancyGrid and produces the same obstacle
+cells the cell-by-cell buildMap() loops did. scale multiplies the map size and every shape,
+e.g. maze(scale=50) is an 800 x 400 maze. The random maps are generated from a seed, so
+the same arguments always give the same map. loadMap() resolves a built-in map name
+("empty", "map1", "map2", "maze") or the path of a grid file.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import random
+
+import numpy as np
+
+from .grid import OccupancyGrid
+from .shapes import Circle, Rectangle, Segment, rasterize
+
+OBSTACLE_MAPS = {
+    1: [Circle(3, 7, 1),                      # Circle 1
+        Circle(5, 3, 2),                      # Circle 2
+        Circle(9, 7, 1)],                     # Circle 3
+    2: [Rectangle(2, 3, 3, 10),               # Wall 1
+        Rectangle(6, 7, 1, 8),                # Wall 2
+        Rectangle(9, 10, 3, 10)],             # Wall 3
+}
+
+MAZE_WALLS = [
+    # Vertical Walls
+    Segment(2, 5, 2, 7),                      # Wall 1
+    Segment(2, 1, 2, 3),                      # Wall 2
+    Segment(5, 5, 5, 8),                      # Wall 3
+    Segment(7, 2, 7, 7),                      # Wall 4
+    Segment(9, 4, 9, 7),                      # Wall 5
+    Segment(11, 4, 11, 5),                    # Wall 6
+    Segment(12, 1, 12, 2),                    # Wall 7
+    Segment(13, 5, 13, 7),                    # Wall 8
+    Segment(16, 2, 16, 3),                    # Wall 9
+    Rectangle(13, 14, 2, 3),                  # Walls 10 and 11
+    # Horizontal Walls
+    Segment(2, 3, 5, 3),                      # Wall 1
+    Segment(2, 5, 5, 5),                      # Wall 2
+    Segment(2, 7, 3, 7),                      # Wall 3
+    Segment(9, 2, 14, 2),                     # Wall 4
+    Segment(9, 4, 11, 4),                     # Wall 5
+    Segment(7, 7, 15, 7),                     # Wall 6
+    Segment(13, 5, 16, 5),                    # Wall 7
+]
+
+## ------------------------------------------------------------------------------------------
+#                                       Map Builders
+## ------------------------------------------------------------------------------------------
+
+def emptyMap(width=10, height=10, scale=1):
+    return(OccupancyGrid(width * scale, height * scale))
+
+def obstacleMap(mapNum, width=10, height=10, scale=1):
+    if mapNum not in OBSTACLE_MAPS:
+        raise ValueError(f"unknown map number {mapNum}, pick one of {sorted(OBSTACLE_MAPS)}")
+    return(buildScaled(width, height, scale, OBSTACLE_MAPS[mapNum]))
+
+def maze(width=16, height=8, scale=1):
+    return(buildScaled(width, height, scale, MAZE_WALLS))
+
+def buildScaled(width, height, scale, shapes):
+    if scale != 1:
+        shapes = [shape.scaled(scale) for shape in shapes]
+    return(rasterize(OccupancyGrid(width * scale, height * scale), shapes))
+
+def randomMap(width, height, density=0.2, seed=0, scale=1):
+    rng = np.random.default_rng(seed)
+    return(blockScaled(rng.random((width, height)) < density, scale))
+
+def randomMaze(width, height, seed=0, scale=1):
+    '''
+    Maze carved by a depth-first backtracker: rooms at odd (x, y), walls in between. An even
+    width or height leaves a solid wall along the far edge.
+    '''
+    rng = random.Random(seed)
+    cells = np.ones((width, height), dtype=bool)
+    roomsX, roomsY = (width + 1) // 2, (height + 1) // 2
+    if width < 3 or height < 3:
+        raise ValueError(f"a maze needs at least 3 x 3 cells, got {width} x {height}")
+    cells[0, 0] = False
+    visited = np.zeros((roomsX, roomsY), dtype=bool)
+    visited[0, 0] = True
+    stack = [(0, 0)]
+    while stack:
+        rx, ry = stack[-1]
+        options = [(rx + dx, ry + dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                   if 0 <= rx + dx < roomsX and 0 <= ry + dy < roomsY and not visited[rx + dx, ry + dy]]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        visited[nx, ny] = True
+        cells[2 * nx, 2 * ny] = False               # the room
+        cells[rx + nx, ry + ny] = False             # the wall between the two rooms
+        stack.append((nx, ny))
+    return(blockScaled(cells, scale))
+
+def randomQueries(grid, count, rng):
+    '''
+    count (start, goal) pairs of free cells drawn from rng (a random.Random), so a fixed
+    seed gives the same queries on every run
+    '''
+    if count > 0 and len(grid) == grid.width * grid.height:
+        raise ValueError(f"the {grid.width} x {grid.height} map has no free cell to query")
+    queries = []
+    while len(queries) < count:
+        s = (rng.randint(1, grid.width), rng.randint(1, grid.height))
+        g = (rng.randint(1, grid.width), rng.randint(1, grid.height))
+        if grid.isFree(s) and grid.isFree(g):
+            queries.append((s, g))
+    return(queries)
+
+def blockScaled(cells, scale):
+    if scale != 1:
+        cells = np.repeat(np.repeat(cells, scale, axis=0), scale, axis=1)
+    return(OccupancyGrid(cells.shape[0], cells.shape[1], np.ascontiguousarray(cells)))
+
+SIZES = {"empty": (10, 10), "map1": (10, 10), "map2": (10, 10), "maze": (16, 8)}     # default width, height
+
+BUILTIN = {
+    "empty": emptyMap,
+    "map1": lambda **options: obstacleMap(1, **options),
+    "map2": lambda **options: obstacleMap(2, **options),
+    "maze": maze,
+}
+
+def loadMap(name, **options):
+    '''
+    Built-in map by name, or a grid file (see astar.gridfile) by path. options (width,
+    height, scale) are passed to the builder of a built-in map.
+    '''
+    if name in BUILTIN:
+        return(BUILTIN[name](**options))
+    if options:
+        raise ValueError(f"width, height and scale only apply to the built-in maps, not {name!r}")
+    from .gridfile import loadGrid
+    return(loadGrid(name))
+
+def mapSize(name, **options):
+    '''
+    (width, height) loadMap(name, **options) would return, without building or opening the map
+    '''
+    if name in BUILTIN:
+        width, height = SIZES[name]
+        scale = options.get("scale", 1)
+        return(options.get("width", width) * scale, options.get("height", height) * scale)
+    from .gridfile import readHeader
+    width, height, _, _ = readHeader(name)
+    return(width, height)
@@ -0,0 +1,141 @@
+## ------------------------------------------------------------------------------------------
+#                                       Motion Model
+## ------------------------------------------------------------------------------------------
+
+'''
+Table-driven neighbour generation, replacing the eight copy-pasted moveX methods.
+
+A MotionModel is a table of (dx, dy, cost) moves. Instead of checking the map bounds and the
+obstacle grid for every move of every expanded node, neighbourMasks() builds, in one
+vectorized pass over the whole map, a bit mask per cell: bit k is set when move k from that
+cell lands on a free cell inside the map. The search then only tests one bit per move. Masks
+are cached per grid and rebuilt when the grid version changes.
+
+Default search sequence (8 action steps):
+    Up --> UpRight --> Right --> DownRight --> Down --> DownLeft --> Left --> UpLeft
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import math
+import weakref
+
+import numpy as np
+
+SQRT2 = math.sqrt(2)
+
+_maskCache = weakref.WeakKeyDictionary()   # grid --> {motion key: (grid version, masks)}
+
+## ------------------------------------------------------------------------------------------
+#                                    Motion Model Class
+## ------------------------------------------------------------------------------------------
+
+class MotionModel:
+
+    '''
+    Attributes:
+        moves: tuple of (dx, dy, cost) moves in search order
+        name: short label used in reports
+    '''
+
+    def __init__(self, moves, name=None):
+        moves = tuple((int(dx), int(dy), float(cost)) for dx, dy, cost in moves)
+        if not moves or len(moves) > 32:
+            raise ValueError("a motion model needs between 1 and 32 moves")
+        if any(dx == 0 and dy == 0 for dx, dy, _ in moves):
+            raise ValueError("a move must change the cell")
+        self.moves = moves
+        self.name = name or f"{len(moves)}-connected"
+
+    def __repr__(self):
+        return(f' MotionModel: {self.name}, moves: {self.moves}')
+
+    def __eq__(self, other):
+        return(isinstance(other, MotionModel) and self.moves == other.moves)
+
+    def __hash__(self):
+        return(hash(self.moves))
+
+    @classmethod
+    def fourConnected(cls, cost=1):
+        return(cls(((0, 1, cost), (1, 0, cost), (0, -1, cost), (-1, 0, cost)), "4-connected"))
+
+    @classmethod
+    def eightConnected(cls, diagonalCost=SQRT2, cost=1):
+        return(cls(((0, 1, cost), (1, 1, diagonalCost), (1, 0, cost), (1, -1, diagonalCost),
+                    (0, -1, cost), (-1, -1, diagonalCost), (-1, 0, cost), (-1, 1, diagonalCost)),
+                   "8-connected" if diagonalCost == SQRT2 else f"8-connected (diagonal {diagonalCost})"))
+
+    @property
+    def reach(self):
+        return(max(max(abs(dx), abs(dy)) for dx, dy, _ in self.moves))
+
+    @property
+    def maskType(self):
+        return(np.uint8 if len(self.moves) <= 8 else np.uint16 if len(self.moves) <= 16 else np.uint32)
+
+    def offsets(self, height):
+        '''
+        (bit, flat id offset, dx, dy, cost) of every move, for a map with the given height
+        '''
+        return([(1 << k, dx * height + dy, dx, dy, cost) for k, (dx, dy, cost) in enumerate(self.moves)])
+
+    def neighbourMasks(self, grid):
+        '''
+        Flat array with one bit per move for every cell: set if the move lands on a free cell
+        '''
+        width, height = grid.width, grid.height
+        pad = self.reach
+        free = np.zeros((width + 2 * pad, height + 2 * pad), dtype=bool)
+        free[pad:pad + width, pad:pad + height] = ~np.asarray(grid.cells, dtype=bool)
+        masks = np.zeros((width, height), dtype=self.maskType)
+        for k, (dx, dy, _) in enumerate(self.moves):
+            shifted = free[pad + dx:pad + dx + width, pad + dy:pad + dy + height]
+            masks |= shifted.astype(self.maskType) << k
+        return(masks.reshape(-1))
+
+    def masksFor(self, grid):
+        '''
+        Cached neighbourMasks(grid), rebuilt when the grid has been edited
+        '''
+        perGrid = _maskCache.setdefault(grid, {})
+        cached = perGrid.get(self.moves)
+        if cached is None or cached[0] != grid.version:
+            cached = (grid.version, self.neighbourMasks(grid))
+            perGrid[self.moves] = cached
+        return(cached[1])
+
+    def primeMasks(self, grid, masks):
+        '''
+        Use precomputed masks for grid, e.g. a copy shared between processes
+        '''
+        _maskCache.setdefault(grid, {})[self.moves] = (grid.version, masks)
+
+    def neighbours(self, cell, grid):
+        '''
+        (neighbour, cost) pairs of a single cell, for code outside the search hot loop
+        '''
+        x, y = cell[0], cell[1]
+        return([((x + dx, y + dy), cost) for dx, dy, cost in self.moves if grid.isFree((x + dx, y + dy))])
+
+    def expand(self, cellIds, grid):
+        '''
+        Vectorized neighbours of many cells at once.
+
+        Returns (parents, children, costs): flat ids of every valid (cell, neighbour) pair
+        and the step cost of each.
+        '''
+        cellIds = np.asarray(cellIds, dtype=np.int64)
+        masks = self.masksFor(grid)[cellIds]
+        parents, children, costs = [], [], []
+        for bit, dId, _, _, cost in self.offsets(grid.height):
+            valid = (masks & bit) != 0
+            parents.append(cellIds[valid])
+            children.append(cellIds[valid] + dId)
+            costs.append(np.full(np.count_nonzero(valid), cost))
+        return(np.concatenate(parents), np.concatenate(children), np.concatenate(costs))
+
+EIGHT_CONNECTED = MotionModel.eightConnected()
+FOUR_CONNECTED = MotionModel.fourConnected()
@@ -0,0 +1,115 @@
+## ------------------------------------------------------------------------------------------
+#                                  Open List [Binary Heap]
+## ------------------------------------------------------------------------------------------
+
+'''
+Priority queue used as the A* open list.
+
+The scripts used to call queue.sort() followed by queue.pop(0) on every expansion, which
+costs O(n log n) + O(n) per node. OpenList keeps a binary heap (heapq) instead, so push and
+pop are O(log n). Every entry is keyed by its cell, and pushing a cell that is already
+queued with a cheaper priority performs a decrease-key: the old heap entry is marked stale
+and skipped when it reaches the top (lazy deletion).
+
+Ties on priority are broken by insertion order, which is what the old stable sort did.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import heapq
+import itertools
+
+## ------------------------------------------------------------------------------------------
+#                                     Open List Class
+## ------------------------------------------------------------------------------------------
+
+_REMOVED = object()   # placeholder for the item of a stale heap entry
+
+
+class OpenList:
+
+    '''
+    Attributes:
+        heap: heap of [priority, count, key, item] entries
+        entries: key --> live heap entry, used for membership and decrease-key
+        counter: insertion counter, breaks ties in FIFO order
+    '''
+
+    def __init__(self):
+        self.heap = []
+        self.entries = {}
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return(len(self.entries))
+
+    def __bool__(self):
+        return(bool(self.entries))
+
+    def __contains__(self, key):
+        return(key in self.entries)
+
+    def __repr__(self):
+        return(f' OpenList: {len(self.entries)} live entries, {len(self.heap)} heap entries')
+
+    def push(self, key, priority, item=None):
+        '''
+        Insert key with the given priority. If key is already queued, its priority is only
+        updated when the new one is lower (decrease-key). Returns True if the queue changed.
+        '''
+        entry = self.entries.get(key)
+        if entry is not None:
+            if priority >= entry[0]:
+                return(False)
+            entry[3] = _REMOVED      # lazy deletion of the old entry
+        entry = [priority, next(self.counter), key, item]
+        self.entries[key] = entry
+        heapq.heappush(self.heap, entry)
+        return(True)
+
+    def pop(self):
+        '''
+        Remove and return (key, priority, item) with the lowest priority.
+        '''
+        heap = self.heap
+        while heap:
+            priority, _, key, item = heapq.heappop(heap)
+            if item is not _REMOVED:
+                del self.entries[key]
+                return(key, priority, item)
+        raise IndexError("pop from an empty OpenList")
+
+    def peek(self):
+        '''
+        Return (key, priority, item) with the lowest priority without removing it.
+        '''
+        heap = self.heap
+        while heap and heap[0][3] is _REMOVED:
+            heapq.heappop(heap)
+        if not heap:
+            raise IndexError("peek at an empty OpenList")
+        priority, _, key, item = heap[0]
+        return(key, priority, item)
+
+    def priority(self, key):
+        '''
+        Current priority of a queued key, or None if it is not queued.
+        '''
+        entry = self.entries.get(key)
+        return(None if entry is None else entry[0])
+
+    def remove(self, key):
+        '''
+        Drop key from the queue if present. Returns True if it was queued.
+        '''
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return(False)
+        entry[3] = _REMOVED
+        return(True)
+
+    def clear(self):
+        self.heap.clear()
+        self.entries.clear()
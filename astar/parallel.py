@@ -0,0 +1,156 @@
+## ------------------------------------------------------------------------------------------
+#                                 Parallel Batch Planner
+## ------------------------------------------------------------------------------------------
+
+'''
+Fans (start, goal) queries out to a pool of worker processes.
+
+The occupancy grid and its neighbour masks are copied once into
+multiprocessing.shared_memory blocks; every worker maps them as NumPy arrays (zero-copy) and
+keeps its own BatchPlanner, so only the queries and the resulting paths are pickled.
+Grid files memory-mapped read-only ("r") or with edits written through ("r+", flushed first)
+are not copied at all: workers open the same file. Copy-on-write maps ("c") keep their edits
+in this process only, so they are copied like in-memory grids.
+
+    with ParallelPlanner(grid, workers=4) as planner:
+        for start, goal, path in planner.run(queries):               # input order
+            ...
+        for start, goal, path in planner.run(queries, ordered=False): # completion order
+            ...
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .batch import BatchPlanner
+from .grid import OccupancyGrid
+from .motion import EIGHT_CONNECTED
+
+_planner = None      # BatchPlanner of the current worker process
+_blocks = []         # shared memory blocks the worker is attached to
+
+## ------------------------------------------------------------------------------------------
+#                                     Worker Functions
+## ------------------------------------------------------------------------------------------
+
+def _attach(name):
+    try:
+        return(shared_memory.SharedMemory(name=name, track=False))   # Python 3.13+
+    except TypeError:
+        return(shared_memory.SharedMemory(name=name))
+
+def _initWorker(source, width, height, resolution, masksSpec, motion, heuristic):
+    global _planner
+    if source[0] == "file":
+        from .gridfile import loadGrid
+        grid = loadGrid(source[1])
+    else:
+        block = _attach(source[1])
+        _blocks.append(block)
+        cells = np.ndarray((width, height), dtype=bool, buffer=block.buf)
+        grid = OccupancyGrid(width, height, cells, resolution=resolution)
+    if masksSpec is not None:
+        block = _attach(masksSpec[0])
+        _blocks.append(block)
+        masks = np.ndarray((width * height,), dtype=np.dtype(masksSpec[1]), buffer=block.buf)
+        motion.primeMasks(grid, masks)
+    _planner = BatchPlanner(grid, motion=motion, heuristic=heuristic)
+
+def _planChunk(chunk):
+    return([(start, goal, path) for start, goal, path in _planner.run(chunk)])
+
+## ------------------------------------------------------------------------------------------
+#                                Parallel Planner Class
+## ------------------------------------------------------------------------------------------
+
+class ParallelPlanner:
+
+    '''
+    Attributes:
+        grid: OccupancyGrid shared by every worker
+        workers: number of worker processes
+        chunksize: queries sent to a worker at a time
+        queries: number of queries planned
+        seconds: wall-clock time spent in run()
+    '''
+
+    def __init__(self, grid, workers=None, motion=EIGHT_CONNECTED, heuristic="euclidean", chunksize=32):
+        self.grid = grid
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.queries = 0
+        self.seconds = 0.0
+        self.blocks = []
+
+        masksSpec = None
+        if grid.mapped and grid.cells.mode in ("r", "r+"):
+            if grid.cells.mode == "r+":
+                grid.cells.flush()                  # workers read the file, not our pages
+            source = ("file", grid.cells.filename)
+        else:
+            cells = self.share(np.ascontiguousarray(grid.cells, dtype=bool))
+            source = ("shm", cells.name)
+            masks = motion.masksFor(grid)
+            masksSpec = (self.share(masks).name, masks.dtype.str)
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_initWorker,
+            initargs=(source, grid.width, grid.height, getattr(grid, "resolution", 1.0), masksSpec, motion, heuristic))
+
+    def __repr__(self):
+        return(f' ParallelPlanner: {self.workers} workers, {self.queries} queries, {round(self.queriesPerSecond, 1)} queries/sec')
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def queriesPerSecond(self):
+        return(self.queries / self.seconds if self.seconds > 0 else 0.0)
+
+    def share(self, array):
+        '''
+        Copy array into a new shared memory block owned by this planner
+        '''
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        self.blocks.append(block)
+        return(block)
+
+    def run(self, queries, ordered=True):
+        '''
+        Plan every (start, goal) pair, yielding (start, goal, path) in input order, or as
+        soon as each chunk finishes when ordered is False. path is None for a query whose
+        start or goal lies outside the map.
+        '''
+        queries = [(tuple(start), tuple(goal)) for start, goal in queries]
+        chunks = [queries[i:i + self.chunksize] for i in range(0, len(queries), self.chunksize)]
+        t0 = time.perf_counter()
+        try:
+            if ordered:
+                results = self.executor.map(_planChunk, chunks)
+            else:
+                results = (future.result() for future in as_completed([self.executor.submit(_planChunk, chunk) for chunk in chunks]))
+            for chunk in results:
+                for result in chunk:
+                    self.queries += result[2] is not None     # rejected queries are not planned
+                    yield(result)
+        finally:
+            self.seconds += time.perf_counter() - t0
+
+    def close(self):
+        self.executor.shutdown()
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
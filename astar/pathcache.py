@@ -0,0 +1,237 @@
+## ------------------------------------------------------------------------------------------
+#                                    Path Result Cache
+## ------------------------------------------------------------------------------------------
+
+'''
+LRU cache of solved paths for workloads where the same (start, goal) queries recur.
+
+Entries are keyed by (map fingerprint, start, goal, motion model, heuristic, tag). The
+fingerprint hashes the map contents (CellSet.fingerprint()), so equal maps share entries even
+when they are different objects. It is recomputed only when the grid's version changes, and
+the version advances on every add / discard / clear / touch. A cache that sees a grid at a new
+version drops every entry of its previous contents. tag separates results of different
+solvers on the same key, e.g. "jps".
+
+With subpaths=True a miss is also answered from a cached path that passes through both the
+start and the goal: every piece of an optimal path is optimal. Reversed pieces are used when
+the motion model is symmetric. This is only done for heuristics in ADMISSIBLE, whose paths are
+optimal; subpath answers have expanded == 0.
+
+    cache = PathCache(capacity=10000, subpaths=True)
+    path = cache.solve(start, goal, grid)                # solve() on a miss
+    grid.add(cell)                                       # the next lookup drops stale paths
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from .heuristics import ADMISSIBLE
+from .motion import EIGHT_CONNECTED
+from .solver import Path, solve
+
+_fingerprints = weakref.WeakKeyDictionary()    # grid --> (grid version, fingerprint)
+
+## ------------------------------------------------------------------------------------------
+#                                    Path Cache Class
+## ------------------------------------------------------------------------------------------
+
+class PathCache:
+
+    '''
+    Attributes:
+        capacity: maximum number of cached paths
+        subpaths: answer misses from cached paths through both ends
+        paths: key --> _Entry, least recently used first
+        hits, misses: lookup counters, subpathHits counts the hits answered by a subpath
+        evictions: entries dropped to stay within capacity
+        invalidations: entries dropped because their map changed
+    '''
+
+    def __init__(self, capacity=4096, subpaths=False):
+        self.capacity = capacity
+        self.subpaths = subpaths
+        self.paths = OrderedDict()
+        self.byMap = {}                         # fingerprint --> set of keys
+        self.index = {}                         # (fingerprint, moves, heuristic, tag) --> {cell id: set of keys}
+        self.seen = weakref.WeakKeyDictionary() # grid --> fingerprint this cache last saw
+        self.hits = 0
+        self.subpathHits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __repr__(self):
+        return(f' PathCache: {len(self.paths)} of {self.capacity} paths, {self.hits} hits '
+               f'({self.subpathHits} subpaths), {self.misses} misses')
+
+    def __len__(self):
+        return(len(self.paths))
+
+    @property
+    def hitRate(self):
+        lookups = self.hits + self.misses
+        return(self.hits / lookups if lookups else 0.0)
+
+    def solve(self, start, goal, grid, motion=EIGHT_CONNECTED, heuristic="euclidean", solver=None, tag=None):
+        '''
+        Cached path from start to goal. On a miss, solver(start, goal) plans it (default:
+        solve() with this motion model and heuristic) and the result is stored.
+        '''
+        path = self.get(start, goal, grid, motion, heuristic, tag)
+        if path is None:
+            if solver is None:
+                path = solve(start, goal, grid, motion=motion, heuristic=heuristic)
+            else:
+                path = solver(start, goal)
+            self.put(start, goal, grid, path, motion, heuristic, tag)
+        return(path)
+
+    def get(self, start, goal, grid, motion=EIGHT_CONNECTED, heuristic="euclidean", tag=None):
+        '''
+        Cached Path, or None on a miss
+        '''
+        fingerprint = self.check(grid)
+        start, goal = tuple(start), tuple(goal)
+        key = (fingerprint, start, goal, motion.moves, heuristic, tag)
+        entry = self.paths.get(key)
+        if entry is not None:
+            self.paths.move_to_end(key)
+            self.hits += 1
+            return(entry.path)
+        if self.subpaths and heuristic in ADMISSIBLE:
+            path = self.subpath(fingerprint, start, goal, grid, motion, heuristic, tag)
+            if path is not None:
+                self.hits += 1
+                self.subpathHits += 1
+                return(path)
+        self.misses += 1
+        return(None)
+
+    def put(self, start, goal, grid, path, motion=EIGHT_CONNECTED, heuristic="euclidean", tag=None):
+        fingerprint = self.check(grid)
+        start, goal = tuple(start), tuple(goal)
+        key = (fingerprint, start, goal, motion.moves, heuristic, tag)
+        if key in self.paths:
+            self.drop(key)
+        entry = self.paths[key] = _Entry(path, grid, motion, self.subpaths and heuristic in ADMISSIBLE)
+        self.byMap.setdefault(fingerprint, set()).add(key)
+        if entry.positions is not None:
+            cells = self.index.setdefault(key[:1] + key[3:], {})
+            for cellId in entry.positions:
+                cells.setdefault(cellId, set()).add(key)
+        while len(self.paths) > self.capacity:
+            self.drop(next(iter(self.paths)))       # evict least recently used
+            self.evictions += 1
+
+    ## --------------------------------------------------------------------------------------
+    #                                     Invalidation
+    ## --------------------------------------------------------------------------------------
+
+    def check(self, grid):
+        '''
+        Fingerprint of the grid's current contents; drops the entries of its old contents
+        if the grid changed since this cache last saw it
+        '''
+        cached = _fingerprints.get(grid)
+        if cached is None or cached[0] != grid.version:
+            cached = _fingerprints[grid] = (grid.version, grid.fingerprint())
+        fingerprint = cached[1]
+        previous = self.seen.get(grid)
+        if previous != fingerprint:
+            if previous is not None:
+                self.invalidate(previous)
+            self.seen[grid] = fingerprint
+        return(fingerprint)
+
+    def invalidate(self, fingerprint=None):
+        '''
+        Drop every entry of one map (by fingerprint), or of all maps
+        '''
+        fingerprints = list(self.byMap) if fingerprint is None else [fingerprint]
+        for fingerprint in fingerprints:
+            for key in list(self.byMap.get(fingerprint, ())):
+                self.drop(key)
+                self.invalidations += 1
+
+    def drop(self, key):
+        entry = self.paths.pop(key)
+        keys = self.byMap[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self.byMap[key[0]]
+        cells = self.index.get(key[:1] + key[3:])
+        if cells is not None and entry.positions is not None:
+            for cellId in entry.positions:
+                keys = cells.get(cellId)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del cells[cellId]
+            if not cells:
+                del self.index[key[:1] + key[3:]]
+
+    def clear(self):
+        self.paths.clear()
+        self.byMap.clear()
+        self.index.clear()
+
+    ## --------------------------------------------------------------------------------------
+    #                                    Subpath Reuse
+    ## --------------------------------------------------------------------------------------
+
+    def subpath(self, fingerprint, start, goal, grid, motion, heuristic, tag):
+        cells = self.index.get((fingerprint, motion.moves, heuristic, tag))
+        if not cells:
+            return(None)
+        startId, goalId = grid.cellId(start), grid.cellId(goal)
+        for key in cells.get(startId, ()):
+            entry = self.paths[key]
+            i, j = entry.positions[startId], entry.positions.get(goalId)
+            if j is None or (i > j and not entry.symmetric):
+                continue
+            self.paths.move_to_end(key)
+            if i <= j:
+                ids = entry.ids[i:j + 1]
+            else:
+                ids = entry.ids[j:i + 1][::-1]
+            return(Path.fromIds(ids, grid.height, float(abs(entry.costs[j] - entry.costs[i])), 0))
+        return(None)
+
+## ------------------------------------------------------------------------------------------
+#                                     Cache Entry
+## ------------------------------------------------------------------------------------------
+
+class _Entry:
+
+    '''
+    A cached Path. When indexed, also the flat ids, cumulative costs and positions of its
+    cells for subpath lookups; positions stays None otherwise, or if the path has a step that
+    is not a move of the motion model (e.g. an abstract HPA* edge).
+    '''
+
+    __slots__ = ("path", "ids", "costs", "positions", "symmetric")
+
+    def __init__(self, path, grid, motion, indexed):
+        self.path = path
+        self.ids = self.costs = self.positions = None
+        self.symmetric = False
+        if not (indexed and path.found):
+            return
+        points = path.array()
+        stepCosts = {}
+        for dx, dy, cost in reversed(motion.moves):     # first listed move wins
+            stepCosts[(dx, dy)] = cost
+        try:
+            costs = [stepCosts[(dx, dy)] for dx, dy in np.diff(points, axis=0).tolist()]
+        except KeyError:
+            return
+        self.ids = (points[:, 0] - 1) * grid.height + (points[:, 1] - 1)
+        self.costs = np.concatenate(([0.0], np.cumsum(costs)))
+        self.positions = {cellId: k for k, cellId in enumerate(self.ids.tolist())}
+        self.symmetric = all(stepCosts.get((-dx, -dy)) == cost for (dx, dy), cost in stepCosts.items())
@@ -0,0 +1,119 @@
+## ------------------------------------------------------------------------------------------
+#                                  Pygame Search Visualizer
+## ------------------------------------------------------------------------------------------
+
+'''
+Optional observer that draws a search with pygame. pygame is only imported when a
+PygameObserver is created, so the solver itself runs without a display.
+
+Start Node is Red, Goal Node is Green, Solution Path is in Blue/Yellow, Explored Nodes are in White
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import sys
+import time
+
+from .solver import SearchObserver
+
+## ------------------------------------------------------------------------------------------
+#                                  Pygame Observer Class
+## ------------------------------------------------------------------------------------------
+
+class PygameObserver(SearchObserver):
+
+    '''
+    Attributes:
+        screenSize: window size in cells (columns, rows)
+        origin: screen position of map coordinate (0, 0) in cells, y grows upwards
+        magf: magnification factor, pixels per cell
+        drawMap: callable(screen, magf) drawing the static obstacles once, or None
+        nodeRadius: radius of an explored node in pixels
+        expandDelay: seconds to sleep after each expanded node
+        goalDelay: seconds to keep the window open after the path is drawn
+        seconds: time spent in the hooks (drawing and delays), to subtract from search timings
+    '''
+
+    def __init__(self, screenSize, origin, magf=50, drawMap=None, nodeRadius=9, expandDelay=0, goalDelay=0):
+        import pygame
+        self.pygame = pygame
+        self.screenSize = screenSize
+        self.origin = origin
+        self.magf = magf
+        self.drawMap = drawMap
+        self.nodeRadius = nodeRadius
+        self.expandDelay = expandDelay
+        self.goalDelay = goalDelay
+        self.screen = None
+        self.start = self.goal = None
+        self.seconds = 0.0
+
+    @classmethod
+    def forGrid(cls, grid, magf=None, **kwargs):
+        '''
+        Observer sized for any grid, drawing its obstacle cells as squares
+        '''
+        if magf is None:
+            magf = max(2, min(50, 900 // (max(grid.width, grid.height) + 3)))
+        kwargs.setdefault("nodeRadius", max(1, magf * 9 // 50))
+        return(cls((grid.width + 3, grid.height + 3), (1, grid.height + 2), magf=magf,
+                   drawMap=lambda screen, magf: drawCells(screen, magf, grid, (1, grid.height + 2)), **kwargs))
+
+    def toScreen(self, cell):
+        return((self.magf*(self.origin[0] + cell[0]), self.magf*(self.origin[1] - cell[1])))
+
+    def onStart(self, start, goal, grid):
+        t0 = time.perf_counter()
+        pygame = self.pygame
+        pygame.init()
+        self.screen = pygame.display.set_mode((self.screenSize[0]*self.magf, self.screenSize[1]*self.magf))
+        self.screen.fill((30,30,30))
+        if self.drawMap is not None:
+            self.drawMap(self.screen, self.magf)   # obstacles are static, draw them once
+        self.start, self.goal = start, goal
+        self.seconds += time.perf_counter() - t0
+
+    def onExpand(self, cell):
+        t0 = time.perf_counter()
+        pygame = self.pygame
+        pygame.draw.circle(self.screen, (0,128,0), self.toScreen(self.goal), 16)      # Goal Node
+        pygame.draw.circle(self.screen, (255,0,0), self.toScreen(self.start), 16)     # Start Node
+        pygame.draw.circle(self.screen, (255,255,255), self.toScreen(cell), self.nodeRadius)   # Current Node
+        pygame.display.update()
+        if self.expandDelay:
+            time.sleep(self.expandDelay)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+        self.seconds += time.perf_counter() - t0
+
+    def onFinish(self, path):
+        t0 = time.perf_counter()
+        pygame = self.pygame
+        if path.found:
+            prev = path.cells[0]
+            for route in path.cells:   # visualize the solution path
+                pygame.draw.circle(self.screen, (0,0,250), self.toScreen(route), 7)
+                pygame.draw.line(self.screen, (255, 255, 0), self.toScreen(route), self.toScreen(prev), 5)
+                pygame.draw.circle(self.screen, (0,0,250), self.toScreen(prev), 7)
+                pygame.display.update()
+                prev = route
+        if self.goalDelay:
+            time.sleep(self.goalDelay)
+        self.seconds += time.perf_counter() - t0
+
+## ------------------------------------------------------------------------------------------
+#                                     Helper Functions
+## ------------------------------------------------------------------------------------------
+
+def drawCells(screen, magf, grid, origin, colour=(80,80,80)):
+    '''
+    Draw every blocked cell of a grid as a square, for maps without a hand-drawn layout
+    '''
+    import pygame
+    for x, y in grid:
+        left, top = magf*(origin[0] + x) - magf // 2, magf*(origin[1] - y) - magf // 2
+        pygame.draw.rect(screen, colour, (left, top, magf, magf))
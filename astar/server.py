@@ -0,0 +1,512 @@
+## ------------------------------------------------------------------------------------------
+#                                     Planning Server
+## ------------------------------------------------------------------------------------------
+
+'''
+A long-running planner that answers path queries over HTTP/1.1 on localhost or a Unix socket.
+
+Maps stay resident between requests: a MapEntry holds the OccupancyGrid (built from the
+astar.maps definitions or read from a grid file), its neighbour masks, reusable search buffers
+and, once the alt engine has been used, its landmark table. Up to maxMaps entries are kept,
+least recently used first out. Maps of more than maxCells cells are refused with 400 before
+anything is allocated, since a load cannot be interrupted and blocks the worker. Answers are kept in an astar.pathcache.PathCache of cacheSize
+paths (0 turns it off), shared by all maps and separated per engine; a repeated query, or one
+on a cached path, is answered without a search.
+
+    POST /solve     {"map": "maze", "start": [16, 1], "goal": [3, 6]}
+                    optional: "scale", "width", "height", "engine" (astar, jps, bidirectional,
+                    alt), "heuristic", "compress", "timeout" (seconds)
+    POST /maps      {"map": "map2", "scale": 20, "engines": ["alt"]}   load and preprocess a map
+    GET  /maps      resident maps
+    GET  /metrics   per-endpoint request counts, errors and latency percentiles, cache counters
+    GET  /health
+
+Searches run one at a time on a worker thread, so the event loop stays free to accept,
+reject and time out requests. For more throughput run one server per core (or use
+astar.parallel.ParallelPlanner behind one).
+
+Back-pressure: at most maxPending /solve and /maps requests wait for or run on the worker.
+A request counts until the worker is done with it, even after its client got a 504. Beyond
+that the server answers 503 with Retry-After at once instead of queueing without bound.
+
+Timeouts: every request has a deadline (its "timeout", or the server default), counted from
+arrival and so including time spent waiting. The search checks it every DEADLINE_CHECK
+expansions through a SearchObserver and gives up with 504. Map loading and preprocessing
+cannot be interrupted; a request whose deadline passes during a load also gets 504, and the
+load finishes in the background for the next request. Requests whose deadline has passed
+by the time the worker reaches them are dropped without starting.
+
+    python -m astar serve --port 8765 --preload maze,map1
+    curl -s localhost:8765/solve -d '{"map": "maze", "start": [16, 1], "goal": [3, 6]}'
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .buffers import newBuffers
+from .maps import loadMap, mapSize
+from .motion import EIGHT_CONNECTED
+from .pathcache import PathCache
+from .solver import SearchObserver, solve
+
+DEADLINE_CHECK = 256                    # expansions between deadline checks
+
+MAX_BODY = 2**20                        # bytes
+
+LATENCY_SAMPLES = 4096                  # latencies kept per endpoint for the percentiles
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+           504: "Gateway Timeout"}
+
+ENGINES = ("astar", "jps", "bidirectional", "alt")
+
+## ------------------------------------------------------------------------------------------
+#                                 Deadlines and Metrics
+## ------------------------------------------------------------------------------------------
+
+class SearchTimeout(Exception):
+    pass
+
+
+class RequestError(Exception):
+
+    '''
+    Error answered to the client with an HTTP status
+    '''
+
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+class DeadlineObserver(SearchObserver):
+
+    '''
+    Aborts a search with SearchTimeout once time.perf_counter() passes deadline
+    '''
+
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.expanded = 0
+
+    def onExpand(self, cell):
+        self.expanded += 1
+        if self.expanded % DEADLINE_CHECK == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+
+class EndpointMetrics:
+
+    '''
+    Attributes:
+        requests: requests answered
+        errors: requests answered with a status of 400 or above
+        statuses: count of every status answered
+        seconds: total time from request parsed to response written
+        latencies: most recent LATENCY_SAMPLES latencies, in seconds
+    '''
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.statuses = {}
+        self.seconds = 0.0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def add(self, status, seconds):
+        self.requests += 1
+        self.errors += status >= 400
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.seconds += seconds
+        self.latencies.append(seconds)
+
+    def toDict(self):
+        ordered = sorted(self.latencies)
+
+        def percentile(p):
+            return(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1e3 if ordered else None)
+
+        return({"requests": self.requests, "errors": self.errors,
+                "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+                "meanMs": self.seconds / self.requests * 1e3 if self.requests else None,
+                "p50Ms": percentile(50), "p90Ms": percentile(90), "p99Ms": percentile(99),
+                "maxMs": ordered[-1] * 1e3 if ordered else None})
+
+## ------------------------------------------------------------------------------------------
+#                                      Map Cache Entry
+## ------------------------------------------------------------------------------------------
+
+class MapEntry:
+
+    '''
+    Attributes:
+        grid: OccupancyGrid of the map
+        motion: MotionModel of every search on the map
+        buffers: search buffers shared by the map's searches (one search at a time)
+        landmarks: Landmarks table for the alt engine, built on first use
+        loadSeconds: time spent loading and preprocessing the map
+        hits: requests answered with this entry
+    '''
+
+    def __init__(self, grid, motion=EIGHT_CONNECTED):
+        t0 = time.perf_counter()
+        self.grid = grid
+        self.motion = motion
+        self.buffers = newBuffers(grid)
+        if not grid.mapped:
+            motion.masksFor(grid)           # build the neighbour masks up front
+        self.landmarks = None
+        self.hits = 0
+        self.loadSeconds = time.perf_counter() - t0
+
+    def prepare(self, engine):
+        '''
+        Preprocessing an engine needs before its first query
+        '''
+        if engine == "alt" and self.landmarks is None:
+            from .landmarks import Landmarks
+            t0 = time.perf_counter()
+            self.landmarks = Landmarks.build(self.grid, motion=self.motion)
+            self.loadSeconds += time.perf_counter() - t0
+        elif engine == "jps":
+            from .jps import wallsFor
+            wallsFor(self.grid)
+
+    def solve(self, start, goal, engine, heuristic, observer):
+        self.prepare(engine)
+        self.hits += 1
+        if engine == "jps":
+            from .jps import solveJPS
+            return(solveJPS(start, goal, self.grid, observer=observer, motion=self.motion))
+        if engine == "bidirectional":
+            from .bidirectional import solveBidirectional
+            return(solveBidirectional(start, goal, self.grid, observer=observer, motion=self.motion, heuristic=heuristic))
+        field = None if engine == "astar" else self.landmarks.field(goal)
+        return(solve(start, goal, self.grid, observer=observer, motion=self.motion, buffers=self.buffers,
+                     heuristic=heuristic, field=field))
+
+    def toDict(self):
+        return({"width": self.grid.width, "height": self.grid.height, "blocked": len(self.grid),
+                "hits": self.hits, "loadMs": round(self.loadSeconds * 1e3, 3),
+                "landmarks": self.landmarks is not None,
+                "bytes": self.buffers.nbytes + (0 if self.landmarks is None else self.landmarks.table.nbytes)})
+
+## ------------------------------------------------------------------------------------------
+#                                   Planning Server Class
+## ------------------------------------------------------------------------------------------
+
+class PlanningServer:
+
+    '''
+    Attributes:
+        maxPending: requests allowed to wait for the worker before new ones get 503
+        timeout: default request deadline in seconds
+        maxMaps: number of maps kept resident
+        maxCells: largest map (width * height) a request may load
+        maps: (map name, options) --> MapEntry, least recently used first
+        metrics: endpoint --> EndpointMetrics
+        cache: PathCache of answered queries, None when cacheSize is 0
+        pending: requests waiting for or running on the worker
+        rejected: requests turned away with 503
+    '''
+
+    def __init__(self, maxPending=64, timeout=1.0, maxMaps=8, cacheSize=4096, maxCells=2**24):
+        self.maxPending = maxPending
+        self.timeout = timeout
+        self.maxMaps = maxMaps
+        self.maxCells = maxCells
+        self.maps = OrderedDict()
+        self.metrics = {}
+        self.cache = PathCache(cacheSize, subpaths=True) if cacheSize else None
+        self.pending = 0
+        self.rejected = 0
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="astar-planner")
+        self.routes = {
+            ("POST", "/solve"): self.solveEndpoint,
+            ("POST", "/maps"): self.loadEndpoint,
+            ("GET", "/maps"): self.mapsEndpoint,
+            ("GET", "/metrics"): self.metricsEndpoint,
+            ("GET", "/health"): self.healthEndpoint,
+        }
+        self.server = None
+
+    def __repr__(self):
+        return(f' PlanningServer: {len(self.maps)} maps, {self.pending} pending, {self.rejected} rejected')
+
+    ## --------------------------------------------------------------------------------------
+    #                                 Worker Thread Side
+    ## --------------------------------------------------------------------------------------
+
+    def entry(self, name, options):
+        '''
+        Resident MapEntry of a map, loaded on a miss. Only called on the worker thread.
+        '''
+        key = (name, tuple(sorted(options.items())))
+        entry = self.maps.get(key)
+        if entry is not None:
+            self.maps.move_to_end(key)
+            return(entry)
+        t0 = time.perf_counter()
+        try:
+            width, height = mapSize(name, **options)
+            if width * height > self.maxCells:
+                raise RequestError(400, f"{width} x {height} map is over the limit of {self.maxCells} cells")
+            grid = loadMap(name, **options)
+        except OSError:
+            raise RequestError(404, f"{name!r} is neither a built-in map nor a readable grid file")
+        except (TypeError, ValueError) as error:
+            raise RequestError(400, str(error))
+        entry = self.maps[key] = MapEntry(grid)
+        entry.loadSeconds = time.perf_counter() - t0
+        while len(self.maps) > self.maxMaps:
+            self.maps.popitem(last=False)
+        return(entry)
+
+    def plan(self, request, deadline):
+        '''
+        Answer a parsed /solve request. Only called on the worker thread.
+        '''
+        if time.perf_counter() > deadline:
+            raise SearchTimeout()           # expired while waiting for the worker
+        name, options = mapOf(request)
+        engine = request.get("engine", "astar")
+        if engine not in ENGINES:
+            raise RequestError(400, f"unknown engine {engine!r}, pick one of {', '.join(ENGINES)}")
+        start, goal = cellOf(request, "start"), cellOf(request, "goal")
+        entry = self.entry(name, options)
+        for label, cell in (("start", start), ("goal", goal)):
+            if not entry.grid.isFree(cell):
+                raise RequestError(400, f"{label} {list(cell)} is outside the map or blocked")
+        heuristic = request.get("heuristic", "euclidean")
+        t0 = time.perf_counter()
+        try:
+            if self.cache is None:
+                path = entry.solve(start, goal, engine, heuristic, DeadlineObserver(deadline))
+            else:
+                path = self.cache.solve(start, goal, entry.grid, entry.motion, heuristic, tag=engine,
+                                        solver=lambda s, g: entry.solve(s, g, engine, heuristic, DeadlineObserver(deadline)))
+        except ValueError as error:
+            raise RequestError(400, str(error))
+        result = {"start": list(start), "goal": list(goal), **path.toDict(bool(request.get("compress"))),
+                  "seconds": round(time.perf_counter() - t0, 6)}
+        result["path"] = result.pop("path")
+        return(result)
+
+    def load(self, request, deadline=math.inf):
+        if time.perf_counter() > deadline:
+            raise SearchTimeout()           # expired while waiting for the worker
+        name, options = mapOf(request)
+        entry = self.entry(name, options)
+        for engine in request.get("engines", ()):
+            if engine not in ENGINES:
+                raise RequestError(400, f"unknown engine {engine!r}, pick one of {', '.join(ENGINES)}")
+            entry.prepare(engine)
+        return({"map": name, **options, **entry.toDict()})
+
+    ## --------------------------------------------------------------------------------------
+    #                                  Event Loop Side
+    ## --------------------------------------------------------------------------------------
+
+    async def onWorker(self, request, work):
+        '''
+        Run work(deadline) on the worker thread, with back-pressure and the request deadline
+        '''
+        timeout = timeoutOf(request, self.timeout)
+        if self.pending >= self.maxPending:
+            self.rejected += 1
+            raise RequestError(503, f"{self.pending} requests pending, retry later")
+        deadline = time.perf_counter() + timeout
+        future = asyncio.get_running_loop().run_in_executor(self.executor, work, deadline)
+        self.pending += 1
+        future.add_done_callback(self.finished)
+        try:
+            # the search stops itself at the deadline; the margin covers work that cannot
+            # be interrupted, like loading a map
+            return(await asyncio.wait_for(asyncio.shield(future), timeout + 0.05))
+        except (SearchTimeout, asyncio.TimeoutError):
+            raise RequestError(504, f"no answer within {timeout} s")
+
+    def finished(self, future):
+        '''
+        A request left the worker, possibly long after its client was answered
+        '''
+        self.pending -= 1
+        if not future.cancelled():
+            future.exception()              # retrieved, so an abandoned failure is not logged
+
+    async def solveEndpoint(self, request):
+        return(await self.onWorker(request, lambda deadline: self.plan(request, deadline)))
+
+    async def loadEndpoint(self, request):
+        return(await self.onWorker(request, lambda deadline: self.load(request, deadline)))
+
+    async def mapsEndpoint(self, request):
+        return({"maps": [{"map": name, **dict(options), **entry.toDict()}
+                         for (name, options), entry in list(self.maps.items())]})
+
+    async def metricsEndpoint(self, request):
+        cache = self.cache
+        return({"pending": self.pending, "rejected": self.rejected, "maps": len(self.maps),
+                "cache": None if cache is None else {"paths": len(cache), "hits": cache.hits,
+                                                     "subpathHits": cache.subpathHits, "misses": cache.misses,
+                                                     "hitRate": round(cache.hitRate, 4), "evictions": cache.evictions},
+                "endpoints": {endpoint: metrics.toDict() for endpoint, metrics in self.metrics.items()}})
+
+    async def healthEndpoint(self, request):
+        return({"status": "ok"})
+
+    async def dispatch(self, method, target, body):
+        '''
+        (status, payload) for one request
+        '''
+        route = target.split("?", 1)[0]
+        handler = self.routes.get((method, route))
+        if handler is None:
+            if any(path == route for _, path in self.routes):
+                return(405, {"error": f"{method} not allowed on {route}"})
+            return(404, {"error": f"no endpoint {route}"})
+        try:
+            request = json.loads(body) if body else {}
+            if not isinstance(request, dict):
+                raise RequestError(400, "the request body must be a JSON object")
+            return(200, await handler(request))
+        except json.JSONDecodeError as error:
+            return(400, {"error": f"invalid JSON: {error}"})
+        except RequestError as error:
+            return(error.status, {"error": str(error)})
+        except Exception as error:          # keep serving after a bug in one request
+            return(500, {"error": f"{type(error).__name__}: {error}"})
+
+    async def handle(self, reader, writer):
+        '''
+        Serve the requests of one connection (HTTP/1.1 keep-alive)
+        '''
+        try:
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine:
+                    break
+                t0 = time.perf_counter()
+                try:
+                    method, target, version = requestLine.decode("latin-1").split()
+                except ValueError:
+                    await respond(writer, 400, {"error": "malformed request line"}, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await respond(writer, 400, {"error": "invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY:
+                    await respond(writer, 413, {"error": f"body over {MAX_BODY} bytes"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keepAlive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+                status, payload = await self.dispatch(method, target, body)
+                await respond(writer, status, payload, keepAlive)
+                endpoint = f"{method} {target.split('?', 1)[0]}"
+                if (method, target.split("?", 1)[0]) not in self.routes:
+                    endpoint = "other"
+                self.metrics.setdefault(endpoint, EndpointMetrics()).add(status, time.perf_counter() - t0)
+                if not keepAlive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        '''
+        Listen on host:port, or on the Unix socket path if given
+        '''
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle, path)
+        else:
+            self.server = await asyncio.start_server(self.handle, host, port)
+        return(self.server)
+
+    def preload(self, names, engines=()):
+        for name in names:
+            self.load({"map": name, "engines": list(engines)})
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+        self.executor.shutdown(wait=False)
+
+## ------------------------------------------------------------------------------------------
+#                                     Helper Functions
+## ------------------------------------------------------------------------------------------
+
+async def respond(writer, status, payload, keepAlive):
+    body = json.dumps(payload, separators=(", ", ": ")).encode()
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keepAlive else 'close'}\r\n")
+    if status == 503:
+        head += "Retry-After: 1\r\n"
+    writer.write(head.encode("latin-1") + b"\r\n" + body)
+    await writer.drain()
+
+def mapOf(request):
+    '''
+    (map name, builder options) of a request
+    '''
+    name = request.get("map")
+    if not isinstance(name, str):
+        raise RequestError(400, "missing \"map\"")
+    options = {}
+    for option in ("width", "height", "scale"):
+        if request.get(option) is not None:
+            if not isinstance(request[option], int) or request[option] < 1:
+                raise RequestError(400, f"{option} must be a positive integer")
+            options[option] = request[option]
+    return(name, options)
+
+def timeoutOf(request, default):
+    value = request.get("timeout")
+    if value is None:
+        value = default
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 < value < math.inf:
+        raise RequestError(400, "\"timeout\" must be a positive number of seconds")
+    return(float(value))
+
+def cellOf(request, field):
+    value = request.get(field)
+    if not (isinstance(value, list) and len(value) == 2 and all(isinstance(v, int) for v in value)):
+        raise RequestError(400, f"\"{field}\" must be [x, y]")
+    return(tuple(value))
+
+async def serve(host="127.0.0.1", port=8765, path=None, preload=(), **options):
+    '''
+    Run a PlanningServer until cancelled
+    '''
+    server = PlanningServer(**options)
+    server.preload(preload)
+    listener = await server.start(host, port, path)
+    where = path or f"http://{host}:{port}"
+    print(f"planning server on {where}, {len(server.maps)} maps loaded", flush=True)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
@@ -0,0 +1,222 @@
+## ------------------------------------------------------------------------------------------
+#                                  Obstacle Shape Primitives
+## ------------------------------------------------------------------------------------------
+
+'''
+Shapes that are rasterized into an OccupancyGrid with NumPy broadcasting.
+
+Each shape marks the cells (x, y) whose centre satisfies its predicate, which is exactly the
+test the old buildMap() loops applied cell by cell:
+
+    Circle(cx, cy, r)              (x - cx)**2 + (y - cy)**2 <= r**2
+    Rectangle(x1, x2, y1, y2)      x1 <= x <= x2 and y1 <= y <= y2
+    Segment(x1, y1, x2, y2, t)     distance from the cell to the segment <= t / 2
+    Polygon(vertices)              inside the polygon or on its boundary
+
+A shape is only evaluated over its bounding box, so memory use is bounded by the size of the
+shape, not the size of the map. scaled(s) returns the same shape on a map s times larger:
+cell c becomes the s x s block of cells (c - 1) * s + 1 ... c * s.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import math
+
+import numpy as np
+
+EPS = 1e-9
+
+## ------------------------------------------------------------------------------------------
+#                                       Shape Classes
+## ------------------------------------------------------------------------------------------
+
+class Shape:
+
+    '''
+    Base class. Subclasses define bounds() and contains(xs, ys).
+    '''
+
+    def bounds(self):
+        '''
+        (xmin, xmax, ymin, ymax) of the shape, in map coordinates
+        '''
+        raise NotImplementedError
+
+    def contains(self, xs, ys):
+        '''
+        Boolean mask of the cells whose centres (xs, ys) are covered; broadcasts
+        '''
+        raise NotImplementedError
+
+    def scaled(self, s):
+        '''
+        The same shape on a map scaled by an integer factor s
+        '''
+        raise NotImplementedError
+
+    def rasterize(self, grid):
+        '''
+        Mark every covered cell of grid as an obstacle
+        '''
+        xmin, xmax, ymin, ymax = self.bounds()
+        x1, x2 = max(1, math.ceil(xmin - EPS)), min(grid.width, math.floor(xmax + EPS))
+        y1, y2 = max(1, math.ceil(ymin - EPS)), min(grid.height, math.floor(ymax + EPS))
+        if x1 > x2 or y1 > y2:
+            return(grid)
+        xs = np.arange(x1, x2 + 1, dtype=np.float64)[:, None]
+        ys = np.arange(y1, y2 + 1, dtype=np.float64)[None, :]
+        grid.cells[x1 - 1:x2, y1 - 1:y2] |= self.contains(xs, ys)
+        grid.touch()
+        return(grid)
+
+
+class Circle(Shape):
+
+    '''
+    Attributes:
+        cx, cy: centre
+        r: radius
+    '''
+
+    def __init__(self, cx, cy, r):
+        self.cx, self.cy, self.r = cx, cy, r
+
+    def __repr__(self):
+        return(f'Circle({self.cx}, {self.cy}, {self.r})')
+
+    def bounds(self):
+        return(self.cx - self.r, self.cx + self.r, self.cy - self.r, self.cy + self.r)
+
+    def scaled(self, s):
+        return(Circle(scalePoint(self.cx, s), scalePoint(self.cy, s), self.r * s))
+
+    def contains(self, xs, ys):
+        return((xs - self.cx)**2 + (ys - self.cy)**2 - self.r**2 <= 0)
+
+
+class Rectangle(Shape):
+
+    '''
+    Axis-aligned rectangle, bounds included
+
+    Attributes:
+        x1, x2: x range
+        y1, y2: y range
+    '''
+
+    def __init__(self, x1, x2, y1, y2):
+        self.x1, self.x2 = min(x1, x2), max(x1, x2)
+        self.y1, self.y2 = min(y1, y2), max(y1, y2)
+
+    def __repr__(self):
+        return(f'Rectangle({self.x1}, {self.x2}, {self.y1}, {self.y2})')
+
+    def bounds(self):
+        return(self.x1, self.x2, self.y1, self.y2)
+
+    def scaled(self, s):
+        return(Rectangle((self.x1 - 1) * s + 1, self.x2 * s, (self.y1 - 1) * s + 1, self.y2 * s))
+
+    def contains(self, xs, ys):
+        return((xs >= self.x1) & (xs <= self.x2) & (ys >= self.y1) & (ys <= self.y2))
+
+
+class Segment(Shape):
+
+    '''
+    Line segment with a thickness; thickness 1 covers exactly the cells on an axis-aligned line
+
+    Attributes:
+        x1, y1: first end point
+        x2, y2: second end point
+        thickness: width of the wall
+    '''
+
+    def __init__(self, x1, y1, x2, y2, thickness=1):
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+        self.thickness = thickness
+
+    def __repr__(self):
+        return(f'Segment({self.x1}, {self.y1}, {self.x2}, {self.y2}, thickness={self.thickness})')
+
+    def bounds(self):
+        half = self.thickness / 2
+        return(min(self.x1, self.x2) - half, max(self.x1, self.x2) + half,
+               min(self.y1, self.y2) - half, max(self.y1, self.y2) + half)
+
+    def scaled(self, s):
+        return(Segment(scalePoint(self.x1, s), scalePoint(self.y1, s), scalePoint(self.x2, s),
+                       scalePoint(self.y2, s), self.thickness * s))
+
+    def contains(self, xs, ys):
+        return(segmentDistance(xs, ys, self.x1, self.y1, self.x2, self.y2) <= self.thickness / 2 + EPS)
+
+
+class Polygon(Shape):
+
+    '''
+    Simple polygon, boundary included
+
+    Attributes:
+        vertices: list of (x, y) corners in order
+    '''
+
+    def __init__(self, vertices):
+        if len(vertices) < 3:
+            raise ValueError("a polygon needs at least 3 vertices")
+        self.vertices = [(float(x), float(y)) for x, y in vertices]
+
+    def __repr__(self):
+        return(f'Polygon({self.vertices})')
+
+    def bounds(self):
+        xs = [x for x, _ in self.vertices]
+        ys = [y for _, y in self.vertices]
+        return(min(xs), max(xs), min(ys), max(ys))
+
+    def scaled(self, s):
+        return(Polygon([(scalePoint(x, s), scalePoint(y, s)) for x, y in self.vertices]))
+
+    def contains(self, xs, ys):
+        xs, ys = np.broadcast_arrays(xs, ys)
+        inside = np.zeros(xs.shape, dtype=bool)
+        onEdge = np.zeros(xs.shape, dtype=bool)
+        n = len(self.vertices)
+        for i in range(n):   # even-odd ray casting, one edge at a time over all cells
+            ax, ay = self.vertices[i]
+            bx, by = self.vertices[(i + 1) % n]
+            onEdge |= segmentDistance(xs, ys, ax, ay, bx, by) <= EPS
+            if ay == by:
+                continue
+            crosses = (ay > ys) != (by > ys)
+            xCross = ax + (ys - ay) * (bx - ax) / (by - ay)
+            inside ^= crosses & (xs < xCross)
+        return(inside | onEdge)
+
+## ------------------------------------------------------------------------------------------
+#                                     Helper Functions
+## ------------------------------------------------------------------------------------------
+
+def scalePoint(c, s):
+    return((c - 0.5) * s + 0.5)   # centre of the block of cells that replaces cell c
+
+def segmentDistance(xs, ys, x1, y1, x2, y2):
+    '''
+    Distance from points (xs, ys) to the segment (x1, y1) - (x2, y2); broadcasts
+    '''
+    dx, dy = x2 - x1, y2 - y1
+    lengthSq = dx * dx + dy * dy
+    if lengthSq == 0:
+        return(np.hypot(xs - x1, ys - y1))
+    t = np.clip(((xs - x1) * dx + (ys - y1) * dy) / lengthSq, 0, 1)
+    return(np.hypot(xs - (x1 + t * dx), ys - (y1 + t * dy)))
+
+def rasterize(grid, shapes):
+    '''
+    Mark the cells covered by every shape as obstacles, returns the grid
+    '''
+    for shape in shapes:
+        shape.rasterize(grid)
+    return(grid)
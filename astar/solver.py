@@ -0,0 +1,281 @@
+## ------------------------------------------------------------------------------------------
+#                                     Headless A* Solver
+## ------------------------------------------------------------------------------------------
+
+'''
+A* search with no rendering. solve() never imports pygame and never sleeps; drawing is done
+by an optional observer (see astar.render.PygameObserver) that only the scripts attach.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import time
+
+import numpy as np
+
+from . import heuristics
+from .buffers import newBuffers
+from .motion import EIGHT_CONNECTED
+from .openlist import OpenList
+
+REOPEN_EPS = 1e-9
+
+## ------------------------------------------------------------------------------------------
+#                                     Path and Observer
+## ------------------------------------------------------------------------------------------
+
+class Path:
+
+    '''
+    A path is stored either as a list of cells or, as solve() returns it, as the flat ids
+    read off the parent array. The list of (x, y) tuples is then only built if cells is
+    read; array(), iterCells() and compressed() work on the ids directly.
+
+    Attributes:
+        cells: (x, y) cells from start to goal, empty if the goal cannot be reached
+        cost: cost to come of the goal, inf if the goal cannot be reached
+        expanded: number of nodes expanded by the search
+    '''
+
+    def __init__(self, cells, cost, expanded):
+        self._cells = cells
+        self._ids = None
+        self._height = None
+        self.cost = cost
+        self.expanded = expanded
+
+    @classmethod
+    def fromIds(cls, ids, height, cost, expanded):
+        '''
+        Path over the flat cell ids of a map with the given height
+        '''
+        path = cls(None, cost, expanded)
+        path._ids = ids
+        path._height = height
+        return(path)
+
+    def __repr__(self):
+        return(f' Path: {len(self)} cells, cost: {round(self.cost, 3)}, expanded: {self.expanded}')
+
+    def __len__(self):
+        return(len(self._ids) if self._cells is None else len(self._cells))
+
+    def __iter__(self):
+        return(self.iterCells())
+
+    @property
+    def found(self):
+        return(len(self) > 0)
+
+    @property
+    def cells(self):
+        if self._cells is None:
+            self._cells = list(self.iterCells())
+        return(self._cells)
+
+    @cells.setter
+    def cells(self, cells):
+        self._cells = cells
+        self._ids = None
+
+    def iterCells(self):
+        '''
+        Lazy (x, y) cells from start to goal
+        '''
+        if self._cells is not None:
+            yield from self._cells
+            return
+        height = self._height
+        for cellId in self._ids:
+            x, y = divmod(int(cellId), height)
+            yield (x + 1, y + 1)
+
+    def array(self):
+        '''
+        (k, 2) int64 array of the x, y coordinates from start to goal
+        '''
+        if self._cells is not None:
+            return(np.array(self._cells, dtype=np.int64).reshape(-1, 2))
+        x, y = np.divmod(self._ids, self._height)
+        return(np.stack([x + 1, y + 1], axis=1))
+
+    def compressed(self):
+        '''
+        array() without the collinear waypoints: start, every turn and goal
+        '''
+        return(compressPath(self.array()))
+
+    def toDict(self, compress=False):
+        '''
+        JSON-ready result: found, cost (None if not found), expanded and the cells as [x, y]
+        '''
+        return({"found": self.found, "cost": round(self.cost, 6) if self.found else None,
+                "expanded": self.expanded, "path": (self.compressed() if compress else self.array()).tolist()})
+
+
+class SearchObserver:
+
+    '''
+    Receives search events. All hooks are no-ops; subclass and override the ones you need.
+    '''
+
+    def onStart(self, start, goal, grid):
+        pass
+
+    def onExpand(self, cell):
+        pass
+
+    def onFinish(self, path):
+        pass
+
+## ------------------------------------------------------------------------------------------
+#                                         Solver
+## ------------------------------------------------------------------------------------------
+
+def solve(start, goal, grid, observer=None, motion=EIGHT_CONNECTED, buffers=None,
+          heuristic="euclidean", field=None, stats=None):
+    '''
+    Find the cheapest path from start to goal on an OccupancyGrid using the moves of a
+    MotionModel (8-connected by default).
+
+    Returns a Path; path.found is False if the goal cannot be reached. The observer, if
+    given, is notified when the search starts, on every expansion and when it finishes.
+    Pass the same SearchBuffers to repeated calls on one map to avoid reallocating them.
+
+    heuristic names one of astar.heuristics.SCALAR, fitted to the step costs of motion
+    (heuristics.scalarFor). field, if given, is a precomputed
+    heuristicField() for this goal and replaces the per-node heuristic with an array lookup.
+    stats, if given, is an astar.stats.SearchStats filled in with counters and timings.
+    '''
+    start, goal = tuple(start), tuple(goal)
+    if not grid.inBounds(start):
+        raise ValueError(f"start {start} is outside the {grid.width} x {grid.height} map")
+    if not grid.inBounds(goal):
+        raise ValueError(f"goal {goal} is outside the {grid.width} x {grid.height} map")
+    if observer is not None:
+        observer.onStart(start, goal, grid)
+    timed = stats is not None
+    if timed:
+        stats.start()
+        clock = time.perf_counter
+
+    width, height = grid.width, grid.height
+    hScalar = heuristics.scalarFor(heuristic, motion)
+    if buffers is None or not buffers.fits(grid):
+        buffers = newBuffers(grid)
+    buffers.reset()
+    c2c, parent, state = buffers.c2c, buffers.parent, buffers.state
+    OPEN, CLOSED = buffers.openMark, buffers.closedMark
+    # bit k set --> move k lands on a free cell. Memory-mapped grids skip the masks, which
+    # would read the whole file, and test bounds and obstacles per move instead.
+    masks = None if grid.mapped else motion.masksFor(grid)
+    blocked = grid.cells.reshape(-1)
+    moves = motion.offsets(height)      # (bit, flat id offset, dx, dy, cost) per move
+
+    startId, goalId = buffers.cellId(start), buffers.cellId(goal)
+    gx, gy = goal
+    c2c[startId] = 0.0
+    parent[startId] = -1
+    state[startId] = OPEN
+    queue = OpenList()
+    queue.push(startId, hScalar(abs(start[0] - gx), abs(start[1] - gy)))
+    expanded = 0
+    path = Path([], float('inf'), 0)
+
+    while queue:
+        if timed:
+            t0 = clock()
+            current, _, _ = queue.pop()
+            stats.queueSeconds += clock() - t0
+        else:
+            current, _, _ = queue.pop()
+        state[current] = CLOSED
+        expanded += 1
+        x, y = current // height + 1, current % height + 1
+        if observer is not None:
+            observer.onExpand((x, y))
+
+        # Case 1 --> Goal Reached
+        if current == goalId:
+            path = Path.fromIds(buffers.backtrackIds(goalId), height, float(c2c[goalId]), expanded)
+            break
+
+        # Case 2: goal not reached, relax neighbours of the current node
+        if timed:
+            t0 = clock()
+            inner = 0.0         # heuristic and queue time inside the neighbour loop
+        currentCost = float(c2c[current])
+        mask = -1 if masks is None else int(masks[current])
+        for bit, dId, dx, dy, stepCost in moves:
+            if not mask & bit:
+                continue
+            child = current + dId
+            if masks is None and (not (1 <= x + dx <= width and 1 <= y + dy <= height) or blocked[child]):
+                continue
+            # relax against the best cost to come found so far. A closed cell can only get
+            # cheaper with an inconsistent heuristic (e.g. manhattan on diagonal moves); it is
+            # reopened so the path stays as good as the heuristic allows. Float rounding in
+            # consistent heuristics gives improvements below REOPEN_EPS, which are ignored.
+            childState = state[child]
+            newCost = currentCost + stepCost
+            if childState == OPEN:
+                if newCost >= c2c[child]:
+                    continue
+            elif childState == CLOSED:
+                if newCost >= c2c[child] - REOPEN_EPS:
+                    continue
+            c2c[child] = newCost
+            parent[child] = current
+            state[child] = OPEN
+            if timed:
+                if childState == OPEN:
+                    stats.updated += 1
+                elif childState == CLOSED:
+                    stats.reopenings += 1
+                else:
+                    stats.generated += 1
+                t1 = clock()
+                h = hScalar(abs(x + dx - gx), abs(y + dy - gy)) if field is None else float(field[child])
+                t2 = clock()
+                queue.push(child, newCost + h)
+                t3 = clock()
+                stats.heuristicSeconds += t2 - t1
+                stats.queueSeconds += t3 - t2
+                inner += t3 - t1
+            elif field is None:
+                queue.push(child, newCost + hScalar(abs(x + dx - gx), abs(y + dy - gy)))
+            else:
+                queue.push(child, newCost + float(field[child]))
+        if timed:
+            stats.neighbourSeconds += clock() - t0 - inner
+            stats.peakOpen = max(stats.peakOpen, len(queue))
+            stats.peakHeap = max(stats.peakHeap, len(queue.heap))
+    else:
+        path.expanded = expanded
+
+    if timed:
+        stats.expanded += expanded
+        stats.bufferBytes = max(stats.bufferBytes, buffers.nbytes)
+        stats.finish()
+    if observer is not None:
+        observer.onFinish(path)
+    return(path)
+
+## ------------------------------------------------------------------------------------------
+#                                     Helper Functions
+## ------------------------------------------------------------------------------------------
+
+def compressPath(points):
+    '''
+    Drop the waypoints of a (k, 2) path that lie on a straight run, keeping both ends
+    '''
+    points = np.asarray(points)
+    if len(points) < 3:
+        return(points.copy())
+    steps = np.diff(points, axis=0)
+    steps //= np.maximum(np.gcd(steps[:, 0], steps[:, 1]), 1)[:, None]  # direction of each step
+    turns = np.any(steps[1:] != steps[:-1], axis=1)
+    keep = np.concatenate(([True], turns, [True]))
+    return(points[keep])
@@ -0,0 +1,120 @@
+## ------------------------------------------------------------------------------------------
+#                                    Search Statistics
+## ------------------------------------------------------------------------------------------
+
+'''
+Structured per-search metrics, replacing ad hoc prints and a single wall-clock number.
+
+Pass a SearchStats to solve() and it is filled in as the search runs:
+
+    stats = SearchStats()
+    path = solve(start, goal, grid, stats=stats)
+    print(stats.toJSON())
+
+Counters cost a few integer additions per node. The time split (heuristic, neighbour
+generation, open-list operations) calls time.perf_counter() around each part, so it slows
+the search down somewhat; it is only measured when a SearchStats is passed. Peak memory uses
+tracemalloc and is only measured with SearchStats(traceMemory=True), which is much slower.
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import time
+
+## ------------------------------------------------------------------------------------------
+#                                  Search Statistics Class
+## ------------------------------------------------------------------------------------------
+
+class SearchStats:
+
+    '''
+    Attributes:
+        expanded: nodes popped from the open list and expanded
+        generated: cells reached for the first time and pushed
+        updated: open cells whose cost to come was lowered (decrease-key)
+        reopenings: closed cells reached again at a lower cost and reopened; only happens
+            with an inconsistent heuristic
+        peakOpen: largest number of live open-list entries
+        peakHeap: largest heap size, including stale entries awaiting lazy deletion
+        peakMemory: bytes allocated by Python at the peak of the search (traceMemory only)
+        bufferBytes: size of the search buffers used
+        seconds: wall-clock time of the whole search
+        heuristicSeconds, neighbourSeconds, queueSeconds: time split of the search loop
+        searches: number of searches accumulated into this object
+    '''
+
+    FIELDS = ("searches", "expanded", "generated", "updated", "reopenings", "peakOpen", "peakHeap",
+              "peakMemory", "bufferBytes", "seconds", "heuristicSeconds", "neighbourSeconds", "queueSeconds")
+
+    def __init__(self, traceMemory=False):
+        self.traceMemory = traceMemory
+        self.searches = 0
+        self.expanded = 0
+        self.generated = 0
+        self.updated = 0
+        self.reopenings = 0
+        self.peakOpen = 0
+        self.peakHeap = 0
+        self.peakMemory = None
+        self.bufferBytes = 0
+        self.seconds = 0.0
+        self.heuristicSeconds = 0.0
+        self.neighbourSeconds = 0.0
+        self.queueSeconds = 0.0
+        self._t0 = None
+        self._tracing = False
+
+    def __repr__(self):
+        return(f' SearchStats: {self.expanded} expanded, {self.generated} generated, '
+               f'peak open {self.peakOpen}, {round(self.seconds * 1e3, 3)} ms')
+
+    def __iadd__(self, other):
+        '''
+        Accumulate another run: counters and times add up, peaks take the maximum
+        '''
+        for name in ("searches", "expanded", "generated", "updated", "reopenings", "seconds",
+                     "heuristicSeconds", "neighbourSeconds", "queueSeconds"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name in ("peakOpen", "peakHeap", "bufferBytes"):
+            setattr(self, name, max(getattr(self, name), getattr(other, name)))
+        if other.peakMemory is not None:
+            self.peakMemory = max(self.peakMemory or 0, other.peakMemory)
+        return(self)
+
+    @property
+    def otherSeconds(self):
+        '''
+        Time not in the three measured parts: bookkeeping, backtracking, observer calls
+        '''
+        return(max(0.0, self.seconds - self.heuristicSeconds - self.neighbourSeconds - self.queueSeconds))
+
+    def start(self):
+        self.searches += 1
+        if self.traceMemory:
+            import tracemalloc              # imported on demand, like json, to keep startup fast
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+            tracemalloc.reset_peak()
+        self._t0 = time.perf_counter()
+
+    def finish(self):
+        self.seconds += time.perf_counter() - self._t0
+        if self.traceMemory:
+            import tracemalloc
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peakMemory = max(self.peakMemory or 0, peak)
+            if self._tracing:
+                tracemalloc.stop()
+                self._tracing = False
+
+    def toDict(self):
+        data = {name: getattr(self, name) for name in self.FIELDS}
+        data["otherSeconds"] = self.otherSeconds
+        return(data)
+
+    def toJSON(self, **kwargs):
+        import json
+        return(json.dumps(self.toDict(), **kwargs))
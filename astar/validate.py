@@ -0,0 +1,231 @@
+## ------------------------------------------------------------------------------------------
+#                                  Optimality Validation
+## ------------------------------------------------------------------------------------------
+
+'''
+Checks every exact solver engine against a brute-force Dijkstra.
+
+dijkstra() is deliberately plain: a dict of costs, heapq, and MotionModel.neighbours() per
+cell. It shares no code with the engines, with no masks, buffers, open list or heuristic,
+so a bug in those cannot hide itself. For every query, each engine must return
+    - a path made of legal moves onto free cells, from start to goal,
+    - whose summed step costs equal the reported cost,
+    - and whose cost equals the Dijkstra distance (or no path when Dijkstra finds none).
+
+D* Lite is also checked the way a robot uses it (validateReplanning): plan, move one step
+along the path, add and remove random obstacles, and plan again, with every path compared
+to a fresh Dijkstra from the robot's current cell.
+
+The maps are the built-in ones scaled up, seeded random maps and seeded random mazes.
+
+Usage: python -m astar.validate [--queries 30] [--seed 0] [--engines astar,jps,...] [--replans 8]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import heapq
+import random
+
+import numpy as np
+
+from . import maps
+from .anytime import solveAnytime
+from .bidirectional import solveBidirectional
+from .distfield import distanceField, pathFromField
+from .dstar import DStarLite
+from .grid import OccupancyGrid
+from .heuristics import ADMISSIBLE
+from .jps import diagonalCostOf, solveJPS
+from .landmarks import Landmarks
+from .maps import randomQueries
+from .motion import EIGHT_CONNECTED, MotionModel
+from .solver import solve
+
+TOLERANCE = 1e-6
+
+## ------------------------------------------------------------------------------------------
+#                                     Reference Search
+## ------------------------------------------------------------------------------------------
+
+def dijkstra(grid, start, motion=EIGHT_CONNECTED):
+    '''
+    {cell: cost from start} for every cell reachable from start
+    '''
+    start = tuple(start)
+    dist = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        d, cell = heapq.heappop(heap)
+        if d > dist[cell]:
+            continue
+        for neighbour, cost in motion.neighbours(cell, grid):
+            if d + cost < dist.get(neighbour, float('inf')):
+                dist[neighbour] = d + cost
+                heapq.heappush(heap, (d + cost, neighbour))
+    return(dist)
+
+def pathCost(cells, grid, motion=EIGHT_CONNECTED):
+    '''
+    Summed step costs of a path, raises ValueError on a step that is not a legal move
+    '''
+    costs = {(dx, dy): cost for dx, dy, cost in reversed(motion.moves)}    # first move wins
+    total = 0.0
+    for a, b in zip(cells, cells[1:]):
+        step = (b[0] - a[0], b[1] - a[1])
+        if step not in costs:
+            raise ValueError(f"{tuple(a)} --> {tuple(b)} is not a move of the motion model")
+        if not grid.isFree(b):
+            raise ValueError(f"{tuple(a)} --> {tuple(b)} enters a blocked cell")
+        total += costs[step]
+    return(total)
+
+## ------------------------------------------------------------------------------------------
+#                                          Engines
+## ------------------------------------------------------------------------------------------
+
+def _alt(grid, motion):
+    landmarks = Landmarks.build(grid, motion=motion)
+    return(lambda s, g: solve(s, g, grid, motion=motion, heuristic="octile", field=landmarks.field(g)))
+
+def _jps(grid, motion):
+    diagonalCostOf(motion)                  # refuse motion models JPS cannot search
+    return(lambda s, g: solveJPS(s, g, grid, motion=motion))
+
+def _distfield(grid, motion):
+    return(lambda s, g: pathFromField(distanceField(grid, g, motion), s, grid, motion))
+
+# name --> factory(grid, motion) returning a query function (start, goal) --> Path
+ENGINES = {
+    "astar": lambda grid, motion: lambda s, g: solve(s, g, grid, motion=motion),
+    "astar-octile": lambda grid, motion: lambda s, g: solve(s, g, grid, motion=motion, heuristic="octile"),
+    "astar-chebyshev": lambda grid, motion: lambda s, g: solve(s, g, grid, motion=motion, heuristic="chebyshev"),
+    "jps": _jps,
+    "bidirectional": lambda grid, motion: lambda s, g: solveBidirectional(s, g, grid, motion=motion),
+    "anytime": lambda grid, motion: lambda s, g: solveAnytime(s, g, grid, motion=motion, heuristic="octile"),
+    "dstar": lambda grid, motion: lambda s, g: DStarLite(grid, s, g, motion).plan(),
+    "alt": _alt,
+    "distfield": _distfield,
+}
+
+## ------------------------------------------------------------------------------------------
+#                                        Validation
+## ------------------------------------------------------------------------------------------
+
+def validate(grid, queries, engines=ENGINES, motion=EIGHT_CONNECTED):
+    '''
+    Run every engine on every (start, goal) query, returns a list of failure messages.
+    Engines that refuse the motion model are skipped.
+    '''
+    failures = []
+    runners = {}
+    for name in engines:
+        try:
+            runners[name] = engines[name](grid, motion)
+        except ValueError:
+            pass
+    reference = {}
+    for start, goal in queries:
+        if start not in reference:
+            reference[start] = dijkstra(grid, start, motion)
+        best = reference[start].get(goal, float('inf'))
+        for name, run in runners.items():
+            failures += checkPath(f"{name} {start} --> {goal}", run(start, goal), start, goal, best, grid, motion)
+    return(failures)
+
+def validateReplanning(grid, queries, rng, motion=EIGHT_CONNECTED, steps=8, edits=3):
+    '''
+    Drive a DStarLite planner along its path for every query and heuristic in ADMISSIBLE,
+    toggling edits random cells (never the robot's cell or the goal) after every move.
+    Returns a list of failure messages.
+    '''
+    failures = []
+    for start, goal in queries:
+        for heuristic in sorted(ADMISSIBLE):
+            world = OccupancyGrid(grid.width, grid.height, np.array(grid.cells, dtype=bool))
+            planner = DStarLite(world, start, goal, motion, heuristic)
+            for step in range(steps):
+                path = planner.plan()
+                best = dijkstra(world, planner.start, motion).get(goal, float('inf'))
+                label = f"dstar {heuristic} {start} --> {goal}, step {step} from {planner.start}"
+                problems = checkPath(label, path, planner.start, goal, best, world, motion)
+                failures += problems
+                if problems or not path.found or len(path.cells) < 2:
+                    break
+                planner.moveTo(path.cells[1])
+                for _ in range(edits):
+                    cell = (rng.randint(1, world.width), rng.randint(1, world.height))
+                    if cell in (planner.start, goal):
+                        continue
+                    if world.isFree(cell):
+                        world.add(cell)
+                    else:
+                        world.discard(cell)
+    return(failures)
+
+def checkPath(label, path, start, goal, best, grid, motion):
+    '''
+    Failure messages of one path against the Dijkstra cost best, an empty list if it is right
+    '''
+    if not path.found:
+        return([] if best == float('inf') else [f"{label}: no path, Dijkstra cost {best:.6f}"])
+    if best == float('inf'):
+        return([f"{label}: returned a path to an unreachable goal"])
+    if tuple(path.cells[0]) != start or tuple(path.cells[-1]) != goal:
+        return([f"{label}: path runs {path.cells[0]} --> {path.cells[-1]}"])
+    try:
+        cost = pathCost(path.cells, grid, motion)
+    except ValueError as error:
+        return([f"{label}: {error}"])
+    failures = []
+    if abs(cost - path.cost) > TOLERANCE:
+        failures.append(f"{label}: reported cost {path.cost:.6f}, path cost {cost:.6f}")
+    if abs(cost - best) > TOLERANCE:
+        failures.append(f"{label}: cost {cost:.6f}, Dijkstra cost {best:.6f}")
+    return(failures)
+
+def testMaps(seed):
+    return([("empty", maps.emptyMap(scale=3)),
+            ("map1", maps.obstacleMap(1, scale=3)),
+            ("map2", maps.obstacleMap(2, scale=3)),
+            ("maze", maps.maze(scale=3)),
+            ("random", maps.randomMap(40, 30, 0.3, seed)),
+            ("randommaze", maps.randomMaze(41, 21, seed))])
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=30, help="queries per map")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engines", default=",".join(ENGINES))
+    parser.add_argument("--diagonal", type=float, default=None, help="diagonal step cost (default sqrt 2)")
+    parser.add_argument("--replans", type=int, default=8, help="D* Lite replans per query, 0 to skip")
+    args = parser.parse_args()
+
+    names = args.engines.split(",")
+    for name in names:
+        if name not in ENGINES:
+            parser.error(f"unknown engine {name!r}, pick from {', '.join(ENGINES)}")
+    motion = EIGHT_CONNECTED if args.diagonal is None else MotionModel.eightConnected(diagonalCost=args.diagonal)
+    engines = {name: ENGINES[name] for name in names}
+
+    rng = random.Random(args.seed)
+    total = 0
+    for mapName, grid in testMaps(args.seed):
+        queries = randomQueries(grid, args.queries, rng)
+        failures = validate(grid, queries, engines, motion)
+        total += len(failures)
+        print(f"{mapName:>11} {grid.width} x {grid.height}: {args.queries} queries x {len(engines)} engines, "
+              f"{len(failures)} failures")
+        for failure in failures[:10]:
+            print(f"    {failure}")
+        if args.replans and "dstar" in engines:
+            failures = validateReplanning(grid, queries, rng, motion, args.replans)
+            total += len(failures)
+            print(f"{'':>11} D* Lite moving and replanning {args.replans} times per query and heuristic: "
+                  f"{len(failures)} failures")
+            for failure in failures[:10]:
+                print(f"    {failure}")
+    raise SystemExit(1 if total else 0)
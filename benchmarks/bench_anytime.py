@@ -0,0 +1,58 @@
+## ------------------------------------------------------------------------------------------
+#                           Benchmark: Anytime A* under Deadlines
+## ------------------------------------------------------------------------------------------
+
+'''
+Runs astar.anytime.solveAnytime() on a corner-to-corner query of the scaled-up maps with a
+range of wall-clock deadlines, and reports the cost and proven bound of the returned path
+against the optimal cost of solve() and the time solve() needs to find it.
+
+Usage: python benchmarks/bench_anytime.py [--scale 20] [--weight 3.0] [--step 0.5]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import maps, solve
+from astar.anytime import solveAnytime
+
+DEADLINES = [0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, None]
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--weight", type=float, default=3.0)
+    parser.add_argument("--step", type=float, default=0.5)
+    args = parser.parse_args()
+
+    for name, grid in (("map2", maps.obstacleMap(2, scale=args.scale)), ("maze", maps.maze(scale=args.scale))):
+        start = next((x, 1) for x in range(1, grid.width + 1) if grid.isFree((x, 1)))
+        goal = next((x, grid.height) for x in range(grid.width, 0, -1) if grid.isFree((x, grid.height)))
+        solve(start, goal, grid)            # build the neighbour masks before timing
+        t0 = time.perf_counter()
+        optimal = solve(start, goal, grid, heuristic="octile")
+        optimalTime = time.perf_counter() - t0
+        print(f"{name} {grid.width} x {grid.height}: {start} --> {goal}, optimal cost {optimal.cost:.3f} "
+              f"in {optimalTime * 1e3:.1f} ms, {optimal.expanded} expansions")
+        print(f"{'deadline ms':>12} {'cost':>10} {'bound':>7} {'true ratio':>11} {'expanded':>9} {'passes':>7}")
+        for deadline in DEADLINES:
+            path = solveAnytime(start, goal, grid, deadline=deadline, weight=args.weight, step=args.step, heuristic="octile")
+            label = "none" if deadline is None else f"{deadline * 1e3:g}"
+            if path.found:
+                print(f"{label:>12} {path.cost:>10.3f} {path.bound:>7.3f} {path.cost / optimal.cost:>11.4f} "
+                      f"{path.expanded:>9} {len(path.improvements):>7}")
+            else:
+                print(f"{label:>12} {'-':>10} {'-':>7} {'-':>11} {path.expanded:>9} {0:>7}")
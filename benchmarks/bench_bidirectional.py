@@ -0,0 +1,72 @@
+## ------------------------------------------------------------------------------------------
+#                              Benchmark: Bidirectional A* vs A*
+## ------------------------------------------------------------------------------------------
+
+'''
+Runs one fixed-seed batch of random queries on the empty, obstacle and maze maps scaled up
+with solve() and with astar.bidirectional.solveBidirectional(). Reports mean expansions,
+mean time per query and the speedup, and also the same numbers for the "long" queries:
+pairs whose unidirectional search expands more than a quarter of the map.
+
+Usage: python benchmarks/bench_bidirectional.py [--scale 10] [--queries 20] [--heuristic octile]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import SearchBuffers, maps, solve
+from astar.bidirectional import solveBidirectional
+from astar.maps import randomQueries
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--heuristic", default="octile")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mapList = [("empty", maps.emptyMap(scale=args.scale)),
+               ("map1", maps.obstacleMap(1, scale=args.scale)),
+               ("map2", maps.obstacleMap(2, scale=args.scale)),
+               ("maze", maps.maze(scale=args.scale))]
+
+    print(f"{'map':>6} {'queries':>8} {'A* exp':>9} {'bidir exp':>10} {'A* ms':>9} {'bidir ms':>9} {'speedup':>8}")
+    for name, grid in mapList:
+        queries = randomQueries(grid, args.queries, rng)
+        buffers = SearchBuffers.forGrid(grid)
+        times = {}
+        for label, search in (("astar", lambda s, g: solve(s, g, grid, buffers=buffers, heuristic=args.heuristic)),
+                              ("bidir", lambda s, g: solveBidirectional(s, g, grid, heuristic=args.heuristic))):
+            for start, goal in queries:
+                t0 = time.perf_counter()
+                path = search(start, goal)
+                times.setdefault(label, []).append((time.perf_counter() - t0, path))
+        rows = [(a, b) for a, b in zip(times["astar"], times["bidir"])]
+        for (_, a), (_, b) in rows:
+            assert a.found == b.found and (not a.found or abs(a.cost - b.cost) < 1e-6), (a, b)
+        long = [(a, b) for a, b in rows if a[1].expanded > grid.width * grid.height / 4]
+        for label, subset in ((name, rows), ("  long", long)):
+            if not subset:
+                continue
+            astarExp = sum(a[1].expanded for a, _ in subset) / len(subset)
+            bidirExp = sum(b[1].expanded for _, b in subset) / len(subset)
+            astarTime = sum(a[0] for a, _ in subset) / len(subset)
+            bidirTime = sum(b[0] for _, b in subset) / len(subset)
+            print(f"{label:>6} {len(subset):>8} {astarExp:>9.0f} {bidirExp:>10.0f} "
+                  f"{astarTime * 1e3:>9.2f} {bidirTime * 1e3:>9.2f} {astarTime / bidirTime:>8.2f}")
@@ -0,0 +1,84 @@
+## ------------------------------------------------------------------------------------------
+#                           Benchmark: D* Lite Replanning vs A* from Scratch
+## ------------------------------------------------------------------------------------------
+
+'''
+Simulates a robot driving from one corner of a scaled-up map to the other. At every step, with
+probability --rate, it discovers an obstacle a few cells ahead on its current path. The robot
+then replans with astar.dstar.DStarLite (repairing the previous search) and with solve()
+from scratch. Reports mean expansions and time per replan of both, and checks they
+agree on the cost.
+
+Usage: python benchmarks/bench_dstar.py [--map maze] [--scale 10] [--rate 0.3]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import SearchBuffers, maps, solve
+from astar.dstar import DStarLite
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+def corners(grid):
+    free = [(x, y) for x in range(1, grid.width + 1) for y in (1, grid.height) if grid.isFree((x, y))]
+    return(free[0], free[-1])
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--map", default="maze", choices=["empty", "map1", "map2", "maze"])
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--rate", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    builders = {"empty": maps.emptyMap, "map1": lambda scale: maps.obstacleMap(1, scale=scale),
+                "map2": lambda scale: maps.obstacleMap(2, scale=scale), "maze": maps.maze}
+    grid = builders[args.map](scale=args.scale)
+    start, goal = corners(grid)
+    buffers = SearchBuffers.forGrid(grid)
+
+    t0 = time.perf_counter()
+    planner = DStarLite(grid, start, goal, heuristic="octile")
+    path = planner.plan()
+    print(f"{args.map} {grid.width} x {grid.height}: {start} --> {goal}, initial plan "
+          f"{path.expanded} expansions, {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    replans = steps = 0
+    dstarExp = astarExp = 0
+    dstarTime = astarTime = 0.0
+    while path.found and planner.start != goal:
+        if rng.random() < args.rate and len(path.cells) > 6:
+            grid.add(path.cells[rng.randint(3, min(6, len(path.cells) - 2))])   # obstacle ahead
+            t0 = time.perf_counter()
+            path = planner.plan()
+            t1 = time.perf_counter()
+            fresh = solve(planner.start, goal, grid, buffers=buffers, heuristic="octile")
+            t2 = time.perf_counter()
+            assert fresh.found == path.found and (not path.found or abs(fresh.cost - path.cost) < 1e-6), (fresh, path, planner.start)
+            replans += 1
+            dstarExp, astarExp = dstarExp + path.expanded, astarExp + fresh.expanded
+            dstarTime, astarTime = dstarTime + t1 - t0, astarTime + t2 - t1
+        if not path.found:
+            break
+        planner.moveTo(path.cells[1])
+        path = planner.plan()
+        steps += 1
+
+    print(f"{steps} steps, {replans} replans after discovered obstacles")
+    if replans:
+        print(f"  D* Lite  {dstarExp / replans:10.1f} expansions  {dstarTime / replans * 1e3:8.2f} ms per replan")
+        print(f"  A*       {astarExp / replans:10.1f} expansions  {astarTime / replans * 1e3:8.2f} ms per replan")
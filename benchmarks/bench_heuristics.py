@@ -0,0 +1,101 @@
+## ------------------------------------------------------------------------------------------
+#                              Benchmark: Heuristic Cost per Expansion
+## ------------------------------------------------------------------------------------------
+
+'''
+Times the heuristic work done for one expansion (8 neighbours) in four ways:
+
+    scipy    8 calls of round(scipy.spatial.distance.euclidean(...), 3), the old Node.manhatten()
+    scalar   8 calls of astar.heuristics.SCALAR["euclidean"]
+    batch    1 call of astar.heuristics.evaluate() on all 8 neighbours
+    field    8 lookups in a precomputed astar.heuristicField()
+
+and checks that every variant returns exactly the same numbers as the old heuristic. The
+scipy row is skipped when scipy is not installed.
+
+Usage: python benchmarks/bench_heuristics.py [--size 500] [--repeat 20000]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import OccupancyGrid, heuristicField
+from astar import heuristics
+
+MOVES = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+def perExpansion(fn, nodes, repeat):
+    t0 = time.perf_counter()
+    for i in range(repeat):
+        fn(nodes[i % len(nodes)])
+    return(1e6 * (time.perf_counter() - t0) / repeat)
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    size = args.size
+    grid = OccupancyGrid(size, size)
+    goal = (size, size // 3)
+    rng = random.Random(0)
+    nodes = [(rng.randint(2, size - 1), rng.randint(2, size - 1)) for _ in range(1000)]
+
+    scalar = heuristics.SCALAR["euclidean"]
+    t0 = time.perf_counter()
+    field = heuristicField(grid, goal)
+    fieldSeconds = time.perf_counter() - t0
+
+    def runScalar(node):
+        x, y = node
+        return([scalar(abs(x + dx - goal[0]), abs(y + dy - goal[1])) for dx, dy in MOVES])
+
+    moveX = np.array([dx for dx, dy in MOVES])
+    moveY = np.array([dy for dx, dy in MOVES])
+
+    def runBatch(node):
+        return(heuristics.evaluate(node[0] + moveX, node[1] + moveY, goal).tolist())
+
+    def runField(node):
+        x, y = node
+        return([float(field[(x + dx - 1) * size + (y + dy - 1)]) for dx, dy in MOVES])
+
+    variants = [("scalar", runScalar), ("batch", runBatch), ("field", runField)]
+    try:
+        from scipy.spatial import distance
+
+        def runScipy(node):
+            x, y = node
+            return([round(distance.euclidean((x + dx, y + dy), goal), 3) for dx, dy in MOVES])
+
+        variants.insert(0, ("scipy", runScipy))
+    except ImportError:
+        print("scipy not installed, skipping the old heuristic")
+
+    # every variant must agree with the old heuristic (scalar is checked against it if scipy is missing)
+    reference = variants[0][1]
+    for name, fn in variants:
+        for node in nodes:
+            assert fn(node) == reference(node), (name, node)
+
+    print(f"{'variant':>8} {'us/expansion':>13}")
+    for name, fn in variants:
+        print(f"{name:>8} {perExpansion(fn, nodes, args.repeat):>13.2f}")
+    print(f"field precompute for {size} x {size}: {1e3 * fieldSeconds:.1f} ms")
@@ -0,0 +1,91 @@
+## ------------------------------------------------------------------------------------------
+#                              Benchmark: HPA* vs A* on Large Maps
+## ------------------------------------------------------------------------------------------
+
+'''
+Builds an astar.hpa.HierarchicalMap for the scaled-up obstacle and maze maps and reports:
+    build, save and load time of the abstraction
+    mean time per query of solve() and HierarchicalMap.solve(), and the mean / worst ratio
+    of HPA* path cost to the optimal cost
+    time to update the abstraction after a small edit, vs a full rebuild
+
+Usage: python benchmarks/bench_hpa.py [--scale 25] [--cluster 16] [--queries 20]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import SearchBuffers, maps, solve
+from astar.hpa import HierarchicalMap
+from astar.maps import randomQueries
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=25)
+    parser.add_argument("--cluster", type=int, default=16)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mapList = [("map2", maps.obstacleMap(2, scale=args.scale)),
+               ("maze", maps.maze(scale=args.scale))]
+
+    for name, grid in mapList:
+        print(f"{name}: {grid.width} x {grid.height}, clusters of {args.cluster}")
+        t0 = time.perf_counter()
+        hmap = HierarchicalMap(grid, clusterSize=args.cluster)
+        buildTime = time.perf_counter() - t0
+        print(f"  build       {buildTime * 1e3:10.1f} ms   {hmap}")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, name + ".hpa.npz")
+            t0 = time.perf_counter()
+            hmap.save(path)
+            saveTime = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            hmap = HierarchicalMap.load(path, grid)
+            loadTime = time.perf_counter() - t0
+            print(f"  save / load {saveTime * 1e3:10.1f} ms / {loadTime * 1e3:.1f} ms, {os.path.getsize(path)} bytes")
+
+        queries = randomQueries(grid, args.queries, rng)
+        buffers = SearchBuffers.forGrid(grid)
+        astarTime = hpaTime = 0.0
+        ratios = []
+        for start, goal in queries:
+            t0 = time.perf_counter()
+            optimal = solve(start, goal, grid, buffers=buffers, heuristic="octile")
+            t1 = time.perf_counter()
+            path = hmap.solve(start, goal)
+            t2 = time.perf_counter()
+            astarTime, hpaTime = astarTime + t1 - t0, hpaTime + t2 - t1
+            assert optimal.found == path.found
+            if optimal.found and optimal.cost > 0:
+                ratios.append(path.cost / optimal.cost)
+        print(f"  query       {astarTime / len(queries) * 1e3:10.2f} ms A*, {hpaTime / len(queries) * 1e3:.2f} ms HPA*, "
+              f"speedup {astarTime / hpaTime:.1f}")
+        print(f"  cost ratio  {sum(ratios) / len(ratios):10.4f} mean, {max(ratios):.4f} worst")
+
+        edits = [(rng.randint(1, grid.width), rng.randint(1, grid.height)) for _ in range(10)]
+        for cell in edits:
+            grid.add(cell)
+        t0 = time.perf_counter()
+        rebuilt = hmap.update(edits)
+        updateTime = time.perf_counter() - t0
+        print(f"  update      {updateTime * 1e3:10.1f} ms for {len(edits)} edits, "
+              f"{len(rebuilt)} of {hmap.clustersX * hmap.clustersY} clusters rebuilt")
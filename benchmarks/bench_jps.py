@@ -0,0 +1,67 @@
+## ------------------------------------------------------------------------------------------
+#                              Benchmark: Jump Point Search vs A*
+## ------------------------------------------------------------------------------------------
+
+'''
+Runs one fixed-seed batch of random queries on the empty, obstacle and maze maps scaled up
+(astar.maps builders with scale=...) with solve() and with astar.jps.solveJPS(). Reports
+mean expansions, mean time per query and the speedup. Both searches use the octile
+heuristic, and every query must give the same path cost.
+
+Usage: python benchmarks/bench_jps.py [--scale 20] [--queries 20]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import SearchBuffers, maps, solve
+from astar.jps import solveJPS
+from astar.maps import randomQueries
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+def timeSearch(search, queries):
+    paths = []
+    t0 = time.perf_counter()
+    for start, goal in queries:
+        paths.append(search(start, goal))
+    return(paths, (time.perf_counter() - t0) / len(queries))
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mapList = [("empty", maps.emptyMap(scale=args.scale)),
+               ("map1", maps.obstacleMap(1, scale=args.scale)),
+               ("map2", maps.obstacleMap(2, scale=args.scale)),
+               ("maze", maps.maze(scale=args.scale))]
+
+    print(f"{'map':>6} {'size':>10} {'A* exp':>9} {'JPS exp':>9} {'A* ms':>9} {'JPS ms':>9} {'speedup':>8}")
+    for name, grid in mapList:
+        queries = randomQueries(grid, args.queries, rng)
+        buffers = SearchBuffers.forGrid(grid)
+        solveJPS(*queries[0], grid)        # build the padded wall copy before timing
+        astar, astarTime = timeSearch(lambda s, g: solve(s, g, grid, buffers=buffers, heuristic="octile"), queries)
+        jps, jpsTime = timeSearch(lambda s, g: solveJPS(s, g, grid), queries)
+        for a, b in zip(astar, jps):
+            assert a.found == b.found and (not a.found or abs(a.cost - b.cost) < 1e-6), (a, b)
+        astarExp = sum(p.expanded for p in astar) / len(queries)
+        jpsExp = sum(p.expanded for p in jps) / len(queries)
+        print(f"{name:>6} {f'{grid.width}x{grid.height}':>10} {astarExp:>9.0f} {jpsExp:>9.0f} "
+              f"{astarTime * 1e3:>9.2f} {jpsTime * 1e3:>9.2f} {astarTime / jpsTime:>8.2f}")
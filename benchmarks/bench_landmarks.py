@@ -0,0 +1,66 @@
+## ------------------------------------------------------------------------------------------
+#                           Benchmark: Landmark (ALT) vs Octile Heuristic
+## ------------------------------------------------------------------------------------------
+
+'''
+Builds astar.landmarks.Landmarks tables (float32 and uint16) for the scaled-up maps and
+runs one fixed-seed batch of random queries with the octile heuristic alone and with the
+ALT field. Reports build time, table size, mean expansions and mean time per query,
+including the per-goal field() evaluation.
+
+Usage: python benchmarks/bench_landmarks.py [--scale 10] [--landmarks 8] [--queries 20]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import SearchBuffers, maps, solve
+from astar.landmarks import Landmarks
+from astar.maps import randomQueries
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--landmarks", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for name, grid in (("map2", maps.obstacleMap(2, scale=args.scale)), ("maze", maps.maze(scale=args.scale))):
+        queries = randomQueries(grid, args.queries, rng)
+        buffers = SearchBuffers.forGrid(grid)
+        print(f"{name} {grid.width} x {grid.height}, {args.landmarks} landmarks")
+        print(f"{'heuristic':>10} {'build ms':>9} {'bytes':>9} {'expanded':>9} {'ms/query':>9}")
+
+        t0 = time.perf_counter()
+        paths = [solve(s, g, grid, buffers=buffers, heuristic="octile") for s, g in queries]
+        elapsed = time.perf_counter() - t0
+        print(f"{'octile':>10} {'-':>9} {'-':>9} {sum(p.expanded for p in paths) / len(paths):>9.0f} "
+              f"{elapsed / len(paths) * 1e3:>9.2f}")
+
+        for dtype in ("float32", "uint16"):
+            t0 = time.perf_counter()
+            landmarks = Landmarks.build(grid, args.landmarks, dtype=dtype)
+            buildTime = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            alt = [solve(s, g, grid, buffers=buffers, heuristic="octile", field=landmarks.field(g)) for s, g in queries]
+            elapsed = time.perf_counter() - t0
+            for a, b in zip(paths, alt):
+                assert a.found == b.found and (not a.found or abs(a.cost - b.cost) < 1e-6)
+            print(f"{'ALT ' + dtype:>10} {buildTime * 1e3:>9.0f} {landmarks.table.nbytes:>9} "
+                  f"{sum(p.expanded for p in alt) / len(alt):>9.0f} {elapsed / len(alt) * 1e3:>9.2f}")
@@ -0,0 +1,131 @@
+## ------------------------------------------------------------------------------------------
+#                              Benchmark: Sorted List vs Binary Heap Open List
+## ------------------------------------------------------------------------------------------
+
+'''
+Compares the old open list (list.sort() + list.pop(0) on every expansion) with the heapq
+based astar.OpenList on 100 x 100, 500 x 500 and 2000 x 2000 grids.
+
+Both runs use the same search loop, closed set and 8-connected moves, so only the open list
+differs. Each grid has a wall down the middle with a single gap at the top, which forces the
+search to flood the map and keeps the open list large. The sorted list gets very slow on the
+big grids, so every run stops after --budget expansions and the rate is reported per
+expansion.
+
+Usage: python benchmarks/bench_openlist.py [--sizes 100 500 2000] [--budget 20000]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import OpenList
+
+MOVES = ((0, 1, 1), (1, 1, math.sqrt(2)), (1, 0, 1), (1, -1, math.sqrt(2)),
+         (0, -1, 1), (-1, -1, math.sqrt(2)), (-1, 0, 1), (-1, 1, math.sqrt(2)))
+
+## ------------------------------------------------------------------------------------------
+#                                  Old Open List Behaviour
+## ------------------------------------------------------------------------------------------
+
+class SortedListOpen:
+
+    '''
+    Same interface as OpenList, but backed by the list that was sorted on every pop
+    '''
+
+    def __init__(self):
+        self.queue = []
+        self.keys = set()
+
+    def __bool__(self):
+        return(bool(self.queue))
+
+    def __contains__(self, key):
+        return(key in self.keys)
+
+    def push(self, key, priority, item=None):
+        if key in self.keys:                 # old code never updated queued nodes in place
+            for entry in self.queue:
+                if entry[0] == key and priority < entry[1]:
+                    entry[1] = priority
+                    return(True)
+            return(False)
+        self.queue.append([key, priority, item])
+        self.keys.add(key)
+        return(True)
+
+    def pop(self):
+        self.queue.sort(key = lambda x: x[1])
+        key, priority, item = self.queue.pop(0)
+        self.keys.discard(key)
+        return(key, priority, item)
+
+## ------------------------------------------------------------------------------------------
+#                                      Search Loop
+## ------------------------------------------------------------------------------------------
+
+def wallGrid(size):
+    # vertical wall at x = size // 2 with a gap in the top row
+    wallX = size // 2
+    return({(wallX, y) for y in range(1, size)})
+
+def search(openList, size, blocked, s, g, budget):
+    gScore = {s: 0.0}
+    closed = set()
+    openList.push(s, math.dist(s, g))
+    expanded = 0
+    while openList and expanded < budget:
+        current, _, _ = openList.pop()
+        if current == g:
+            return(expanded, gScore[current])
+        closed.add(current)
+        expanded += 1
+        x, y = current
+        for dx, dy, stepCost in MOVES:
+            child = (x + dx, y + dy)
+            if not (1 <= child[0] <= size and 1 <= child[1] <= size):
+                continue
+            if child in blocked or child in closed:
+                continue
+            c2c = gScore[current] + stepCost
+            if c2c < gScore.get(child, float('inf')):
+                gScore[child] = c2c
+                openList.push(child, c2c + math.dist(child, g))
+    return(expanded, None)
+
+def timeRun(factory, size, blocked, s, g, budget):
+    openList = factory()
+    t0 = time.perf_counter()
+    expanded, cost = search(openList, size, blocked, s, g, budget)
+    elapsed = time.perf_counter() - t0
+    return(expanded, cost, elapsed)
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--budget", type=int, default=20000, help="max expansions per run")
+    args = parser.parse_args()
+
+    print(f"{'grid':>11} {'open list':>10} {'expanded':>9} {'seconds':>9} {'us/expansion':>13} {'cost':>10}")
+    for size in args.sizes:
+        blocked = wallGrid(size)
+        s, g = (1, 1), (size, 1)
+        for name, factory in (("sorted", SortedListOpen), ("heap", OpenList)):
+            expanded, cost, elapsed = timeRun(factory, size, blocked, s, g, args.budget)
+            perNode = 1e6 * elapsed / max(expanded, 1)
+            costText = "budget" if cost is None else f"{cost:.3f}"
+            print(f"{size:>5}x{size:<5} {name:>10} {expanded:>9} {elapsed:>9.3f} {perNode:>13.2f} {costText:>10}")
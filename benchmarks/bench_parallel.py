@@ -0,0 +1,60 @@
+## ------------------------------------------------------------------------------------------
+#                              Benchmark: Parallel Planner Scaling
+## ------------------------------------------------------------------------------------------
+
+'''
+Plans one fixed-seed batch of random queries on a random obstacle map with 1, 2, ... N worker
+processes (astar.parallel.ParallelPlanner) and with the single-process BatchPlanner, and
+reports queries/sec and speedup over the single process.
+
+Usage: python benchmarks/bench_parallel.py [--size 300] [--queries 400] [--workers 4]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import BatchPlanner
+from astar.maps import randomMap, randomQueries
+from astar.parallel import ParallelPlanner
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    grid = randomMap(args.size, args.size, 0.2, args.seed)
+    queries = randomQueries(grid, args.queries, rng)
+
+    planner = BatchPlanner(grid)
+    t0 = time.perf_counter()
+    serial = [path.cost for _, _, path in planner.run(queries)]
+    baseline = len(queries) / (time.perf_counter() - t0)
+
+    print(f"{'workers':>8} {'queries/sec':>12} {'speedup':>8}")
+    print(f"{'serial':>8} {baseline:>12.1f} {1.0:>8.2f}")
+    for workers in range(1, args.workers + 1):
+        with ParallelPlanner(grid, workers=workers) as parallel:
+            list(parallel.run(queries[:workers * parallel.chunksize]))    # one chunk per worker starts them all
+            t0 = time.perf_counter()
+            costs = [path.cost for _, _, path in parallel.run(queries)]
+            rate = len(queries) / (time.perf_counter() - t0)
+        assert costs == serial
+        print(f"{workers:>8} {rate:>12.1f} {rate / baseline:>8.2f}")
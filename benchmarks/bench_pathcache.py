@@ -0,0 +1,72 @@
+## ------------------------------------------------------------------------------------------
+#                                 Benchmark: Path Result Cache
+## ------------------------------------------------------------------------------------------
+
+'''
+Replays a fixed-seed stream of queries in which a small pool of (start, goal) pairs recurs
+with Zipf-like popularity, as in a service where the same trips are asked for again and
+again. Times the stream with solve() alone, with a PathCache and with a PathCache that also
+answers from cached subpaths, and reports queries/sec and hit rates. Finally adds one
+obstacle to the map and times the lookup that drops the stale paths.
+
+Usage: python benchmarks/bench_pathcache.py [--map maze] [--scale 10] [--pool 500] [--queries 20000]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from astar import PathCache, solve
+from astar.maps import loadMap, randomQueries
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+def replay(stream, plan):
+    t0 = time.perf_counter()
+    for start, goal in stream:
+        plan(start, goal)
+    return(time.perf_counter() - t0)
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--map", default="maze")
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--pool", type=int, default=500, help="distinct queries")
+    parser.add_argument("--queries", type=int, default=20000, help="length of the query stream")
+    parser.add_argument("--capacity", type=int, default=4096)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    grid = loadMap(args.map, scale=args.scale)
+    rng = random.Random(args.seed)
+    pool = randomQueries(grid, args.pool, rng)
+    weights = [1 / (rank + 1) for rank in range(len(pool))]
+    stream = rng.choices(pool, weights, k=args.queries)
+    print(f"{args.map} x{args.scale} ({grid.width} x {grid.height}), {len(stream)} queries over {len(pool)} distinct pairs")
+
+    # solve() alone is timed on the distinct queries only and scaled up, it has no state
+    seconds = replay(pool, lambda s, g: solve(s, g, grid)) * len(stream) / len(pool)
+    print(f"{'solve()':>18}: {len(stream) / seconds:>9.0f} queries/sec")
+    for label, subpaths in (("PathCache", False), ("PathCache subpaths", True)):
+        cache = PathCache(args.capacity, subpaths=subpaths)
+        seconds = replay(stream, lambda s, g: cache.solve(s, g, grid))
+        print(f"{label:>18}: {len(stream) / seconds:>9.0f} queries/sec, hit rate {cache.hitRate:.3f} "
+              f"({cache.subpathHits} from subpaths), {cache.misses} searches, {cache.evictions} evictions")
+
+    path = cache.solve(*pool[0], grid)
+    grid.add(path.cells[len(path.cells) // 2])
+    stale = len(cache)
+    t0 = time.perf_counter()
+    cache.solve(*pool[0], grid)
+    print(f"after one grid.add(): {(time.perf_counter() - t0) * 1e3:.2f} ms to drop {stale} stale paths and re-plan")
@@ -0,0 +1,108 @@
+## ------------------------------------------------------------------------------------------
+#                              Benchmark: Planning Server Latency
+## ------------------------------------------------------------------------------------------
+
+'''
+Starts an astar.server.PlanningServer in-process and sends one fixed-seed batch of random
+/solve queries over keep-alive HTTP connections from several concurrent clients. Reports the
+client-side latency percentiles and throughput, the server's own /metrics for the endpoint,
+and, for comparison, the wall time of one cold `python -m astar solve` process.
+
+Usage: python benchmarks/bench_server.py [--map maze] [--scale 10] [--queries 400] [--clients 8]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from astar.maps import loadMap, randomQueries
+from astar.server import PlanningServer
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+async def request(reader, writer, method, target, payload=None):
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return(status, json.loads(await reader.readexactly(length)))
+
+async def client(port, queue, latencies, statuses, options):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    while queue:
+        start, goal = queue.pop()
+        t0 = time.perf_counter()
+        status, _ = await request(reader, writer, "POST", "/solve", dict(options, start=list(start), goal=list(goal)))
+        latencies.append(time.perf_counter() - t0)
+        statuses[status] = statuses.get(status, 0) + 1
+    writer.close()
+    await writer.wait_closed()
+
+async def run(args):
+    server = PlanningServer(maxPending=args.clients, timeout=5.0)
+    listener = await server.start(port=0)
+    port = listener.sockets[0].getsockname()[1]
+    options = {"map": args.map, "scale": args.scale, "engine": args.engine}
+    server.load(dict(options, engines=[args.engine]))
+
+    grid = loadMap(args.map, scale=args.scale)
+    queue = randomQueries(grid, args.queries, random.Random(args.seed))
+    latencies, statuses = [], {}
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(port, queue, latencies, statuses, options) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - t0
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, metrics = await request(reader, writer, "GET", "/metrics")
+    writer.close()
+    await writer.wait_closed()
+    await asyncio.sleep(0.01)           # let the server see the connections close
+    server.close()
+    return(sorted(latencies), statuses, elapsed, metrics["endpoints"]["POST /solve"])
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--map", default="maze")
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--engine", default="astar")
+    parser.add_argument("--queries", type=int, default=400)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    latencies, statuses, elapsed, metrics = asyncio.run(run(args))
+    print(f"{args.map} x{args.scale}, {args.engine}, {len(latencies)} queries from {args.clients} clients: "
+          f"{len(latencies) / elapsed:.0f} queries/sec, statuses {statuses}")
+    for p in (50, 90, 99):
+        print(f"client p{p}: {latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1e3:.2f} ms")
+    print(f"server p50 {metrics['p50Ms']:.2f} ms, p99 {metrics['p99Ms']:.2f} ms")
+
+    (sx, sy), (gx, gy) = randomQueries(loadMap(args.map, scale=args.scale), 1, random.Random(args.seed))[0]
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "astar", "solve", "--map", args.map, "--scale", str(args.scale),
+                    "--start", f"{sx},{sy}", "--goal", f"{gx},{gy}", "--engine", args.engine],
+                   cwd=ROOT, capture_output=True, check=True)
+    print(f"one cold python -m astar solve process: {(time.perf_counter() - t0) * 1e3:.0f} ms")
@@ -0,0 +1,73 @@
+## ------------------------------------------------------------------------------------------
+#                              Benchmark: Cold Start vs Solve Time
+## ------------------------------------------------------------------------------------------
+
+'''
+Starts fresh Python processes and reports the median wall-clock time of each, to separate
+the cost of starting a planner process from the cost of the search itself:
+
+    python           python -c pass, the interpreter alone
+    numpy            python -c "import numpy"
+    astar            python -c "import astar" (lazy, loads no submodule)
+    solve imports    python -c "from astar import solve, maps"
+    all engines      every engine module imported eagerly, as astar/__init__ used to
+    entry point      python -m astar solve --map maze --start 16,1 --goal 3,6
+
+The entry point row also lists the solve time it reports itself (--timing).
+
+Usage: python benchmarks/bench_startup.py [--repeat 15]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+ALL_ENGINES = ("import astar.anytime, astar.batch, astar.bidirectional, astar.distfield, astar.dstar, "
+               "astar.gridfile, astar.hpa, astar.jps, astar.landmarks, astar.solver, astar.stats")
+
+COMMANDS = [
+    ("python", ["-c", "pass"]),
+    ("numpy", ["-c", "import numpy"]),
+    ("astar", ["-c", "import astar"]),
+    ("solve imports", ["-c", "from astar import solve, maps"]),
+    ("all engines", ["-c", ALL_ENGINES]),
+    ("entry point", ["-m", "astar", "solve", "--map", "maze", "--start", "16,1", "--goal", "3,6", "--timing"]),
+]
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+def timeProcess(arguments):
+    t0 = time.perf_counter()
+    result = subprocess.run([sys.executable] + arguments, cwd=ROOT, capture_output=True, text=True, check=True)
+    return(time.perf_counter() - t0, result.stderr)
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"{'command':>14} {'median ms':>10} {'min ms':>8} {'solve ms':>9}")
+    for name, arguments in COMMANDS:
+        timeProcess(arguments)              # warm the file system cache and the .pyc files
+        wall, solveTimes = [], []
+        for _ in range(args.repeat):
+            seconds, stderr = timeProcess(arguments)
+            wall.append(seconds)
+            match = re.search(r"solve ([0-9.]+) ms", stderr)
+            if match:
+                solveTimes.append(float(match.group(1)))
+        solveText = f"{statistics.median(solveTimes):.2f}" if solveTimes else "-"
+        print(f"{name:>14} {statistics.median(wall) * 1e3:>10.1f} {min(wall) * 1e3:>8.1f} {solveText:>9}")
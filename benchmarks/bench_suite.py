@@ -0,0 +1,203 @@
+## ------------------------------------------------------------------------------------------
+#                           Benchmark Suite: Map Families x Engines
+## ------------------------------------------------------------------------------------------
+
+'''
+Runs one fixed-seed batch of random queries per map family through every solver engine and
+writes the results to a JSON file, so runs can be compared across commits.
+
+Map families (scale multiplies the size of the built-in maps):
+
+    empty        emptyMap             10s x 10s
+    map1, map2   obstacleMap(1 / 2)   10s x 10s, circles / walls
+    maze         maze                 16s x 8s
+    random       randomMap            10s x 10s, 25 % of the cells blocked
+    randommaze   randomMaze           (16s + 1) x (8s + 1), corridors one cell wide
+
+Engines: astar (solve, octile), jps, bidirectional, hpa (HierarchicalMap, 16 x 16 clusters)
+and alt (solve with an 8-landmark Landmarks field). Preprocessing of hpa and alt is timed
+separately. For each pair the suite reports latency percentiles, expansions per second and
+the peak memory allocated while answering the batch (tracemalloc, measured in a second pass
+so it does not skew the latencies).
+
+    python benchmarks/bench_suite.py --output before.json
+    ... change something ...
+    python benchmarks/bench_suite.py --output after.json --compare before.json
+
+Usage: python benchmarks/bench_suite.py [--scale 20] [--queries 50] [--seed 0]
+       [--families maze,random] [--engines astar,jps] [--no-memory] [--output FILE] [--compare FILE]
+'''
+
+## ------------------------------------------------------------------------------------------
+#                                        Import Libraries
+## ------------------------------------------------------------------------------------------
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from astar import HierarchicalMap, Landmarks, SearchBuffers, maps, solve, solveBidirectional, solveJPS
+from astar.maps import randomQueries
+
+FAMILIES = {
+    "empty": lambda scale, seed: maps.emptyMap(scale=scale),
+    "map1": lambda scale, seed: maps.obstacleMap(1, scale=scale),
+    "map2": lambda scale, seed: maps.obstacleMap(2, scale=scale),
+    "maze": lambda scale, seed: maps.maze(scale=scale),
+    "random": lambda scale, seed: maps.randomMap(10 * scale, 10 * scale, 0.25, seed),
+    "randommaze": lambda scale, seed: maps.randomMaze(16 * scale + 1, 8 * scale + 1, seed),
+}
+
+PERCENTILES = (50, 90, 99)
+
+## ------------------------------------------------------------------------------------------
+#                                          Engines
+## ------------------------------------------------------------------------------------------
+
+def astarEngine(grid):
+    buffers = SearchBuffers.forGrid(grid)
+    return(lambda s, g: solve(s, g, grid, buffers=buffers, heuristic="octile"))
+
+def jpsEngine(grid):
+    return(lambda s, g: solveJPS(s, g, grid))
+
+def bidirectionalEngine(grid):
+    return(lambda s, g: solveBidirectional(s, g, grid, heuristic="octile"))
+
+def hpaEngine(grid):
+    hierarchy = HierarchicalMap(grid)
+    return(lambda s, g: hierarchy.solve(s, g, heuristic="octile"))
+
+def altEngine(grid):
+    landmarks = Landmarks.build(grid)
+    buffers = SearchBuffers.forGrid(grid)
+    return(lambda s, g: solve(s, g, grid, buffers=buffers, heuristic="octile", field=landmarks.field(g)))
+
+ENGINES = {
+    "astar": astarEngine,
+    "jps": jpsEngine,
+    "bidirectional": bidirectionalEngine,
+    "hpa": hpaEngine,
+    "alt": altEngine,
+}
+
+## ------------------------------------------------------------------------------------------
+#                                       Main Function
+## ------------------------------------------------------------------------------------------
+
+def machine():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return({"commit": commit,
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine()})
+
+def run(engine, grid, queries, memory):
+    t0 = time.perf_counter()
+    query = ENGINES[engine](grid)
+    setupSeconds = time.perf_counter() - t0
+    query(*queries[0])                      # warm the per-grid caches (masks, walls map)
+
+    latencies, expanded, found, costs = [], 0, 0, []
+    for s, g in queries:
+        t0 = time.perf_counter()
+        path = query(s, g)
+        latencies.append(time.perf_counter() - t0)
+        expanded += path.expanded
+        if path.found:
+            found += 1
+            costs.append(path.cost)
+    seconds = sum(latencies)
+
+    peakMemory = None
+    if memory:
+        tracemalloc.start()
+        for s, g in queries:
+            query(s, g)
+        peakMemory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    result = {"setupSeconds": setupSeconds,
+              "queries": len(queries),
+              "found": found,
+              "meanCost": float(np.mean(costs)) if costs else None,
+              "meanSeconds": seconds / len(queries),
+              "expanded": expanded,
+              "expansionsPerSecond": expanded / seconds if seconds > 0 else None,
+              "peakMemory": peakMemory}
+    for p, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES)):
+        result[f"p{p}Seconds"] = float(value)
+    return(result)
+
+def compare(results, oldPath):
+    with open(oldPath) as f:
+        old = {(r["family"], r["engine"]): r for r in json.load(f)["results"]}
+    print(f"\ncompared with {oldPath} (new / old, below 1 is faster)")
+    print(f"{'family':>11} {'engine':>14} {'p50':>7} {'p90':>7} {'exp/s':>7}")
+    for r in results:
+        before = old.get((r["family"], r["engine"]))
+        if before is None:
+            continue
+        ratios = [r[key] / before[key] if before[key] else float('nan') for key in ("p50Seconds", "p90Seconds")]
+        speed = before["expansionsPerSecond"] / r["expansionsPerSecond"] if r["expansionsPerSecond"] else float('nan')
+        print(f"{r['family']:>11} {r['engine']:>14} {ratios[0]:>7.2f} {ratios[1]:>7.2f} {speed:>7.2f}")
+
+if __name__== "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--families", default=",".join(FAMILIES))
+    parser.add_argument("--engines", default=",".join(ENGINES))
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the tracemalloc pass")
+    parser.add_argument("--output", default="bench_suite.json")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare against")
+    args = parser.parse_args()
+
+    families, engines = args.families.split(","), args.engines.split(",")
+    for name in families:
+        if name not in FAMILIES:
+            parser.error(f"unknown family {name!r}, pick from {', '.join(FAMILIES)}")
+    for name in engines:
+        if name not in ENGINES:
+            parser.error(f"unknown engine {name!r}, pick from {', '.join(ENGINES)}")
+
+    results = []
+    print(f"{'family':>11} {'engine':>14} {'setup ms':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} "
+          f"{'exp/s':>10} {'peak KiB':>9}")
+    for family in families:
+        grid = FAMILIES[family](args.scale, args.seed)
+        queries = randomQueries(grid, args.queries, random.Random(f"{args.seed}:{family}"))
+        for engine in engines:
+            result = dict(family=family, engine=engine, width=grid.width, height=grid.height,
+                          **run(engine, grid, queries, args.memory))
+            results.append(result)
+            memory = "-" if result["peakMemory"] is None else f"{result['peakMemory'] / 1024:.0f}"
+            print(f"{family:>11} {engine:>14} {result['setupSeconds'] * 1e3:>9.1f} "
+                  f"{result['p50Seconds'] * 1e3:>8.2f} {result['p90Seconds'] * 1e3:>8.2f} "
+                  f"{result['p99Seconds'] * 1e3:>8.2f} {result['expansionsPerSecond'] or 0:>10.0f} {memory:>9}")
+
+    with open(args.output, "w") as f:
+        json.dump({"machine": machine(), "settings": vars(args), "results": results}, f, indent=2)
+    print(f"results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)